@@ -0,0 +1,45 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from snake.config import GameConfig, WindowConfig
+from snake.game import SnakeGame
+from snake.game_controls import Direction
+from snake.publisher import (
+    AbstractSubscriber,
+    NoCollisionSubscriber,
+    RewardSubscriber,
+    ScoreSubscriber,
+)
+from snake.validators import ConfigValidator
+
+DIRECTIONS = list(Direction)
+
+
+def load_configurations() -> Tuple[WindowConfig, GameConfig]:
+    ConfigValidator.register_validator(*WindowConfig.get_all_validators(), *GameConfig.get_all_validators())
+    ConfigValidator.validate_all()
+    return WindowConfig.from_dynaconf(), GameConfig.from_dynaconf()
+
+
+def create_subscribers(remuneration: Dict[str, int]) -> List[AbstractSubscriber]:
+    return [
+        ScoreSubscriber(remuneration=remuneration),
+        RewardSubscriber(remuneration=remuneration),
+        NoCollisionSubscriber(remuneration=remuneration),
+    ]
+
+
+def register_subscribers(game: SnakeGame, remuneration: Dict[str, int]) -> None:
+    for subscriber in create_subscribers(remuneration):
+        game.add_subscriber(subscriber)
+
+
+def play_random_step(game: SnakeGame, random_generator: np.random.Generator) -> None:
+    game.update_direction(DIRECTIONS[random_generator.integers(len(DIRECTIONS))])
+    game.run()
+
+
+def play_random_episode(game: SnakeGame, random_generator: np.random.Generator) -> None:
+    while not game.is_over():
+        play_random_step(game, random_generator)
@@ -0,0 +1,81 @@
+import argparse
+import time
+from dataclasses import replace
+from typing import Callable, Tuple
+
+import numpy as np
+import pygame
+
+from benchmarks.common import (
+    load_configurations,
+    play_random_episode,
+    register_subscribers,
+)
+from snake.game import SnakeGame, SnakeGameFactory
+
+
+def measure_episodes_per_second(
+    episodes: int, start_episode: Callable[[], SnakeGame], random_generator: np.random.Generator
+) -> Tuple[float, float]:
+    restart_time = 0.0
+    start = time.perf_counter()
+    for _ in range(episodes):
+        restart_start = time.perf_counter()
+        game = start_episode()
+        restart_time += time.perf_counter() - restart_start
+        play_random_episode(game, random_generator)
+    return episodes / (time.perf_counter() - start), episodes / restart_time
+
+
+class RebuildingEpisodes:
+    def __init__(self, game_factory: SnakeGameFactory):
+        self._game_factory = game_factory
+
+    def __call__(self) -> SnakeGame:
+        game = self._game_factory.create_snake_game()
+        register_subscribers(game, remuneration={"score": 0, "reward": 0})
+        return game
+
+
+class ResettingEpisodes:
+    def __init__(self, game_factory: SnakeGameFactory):
+        self._remuneration = {"score": 0, "reward": 0}
+        self._game = game_factory.create_snake_game()
+        register_subscribers(self._game, remuneration=self._remuneration)
+
+    def __call__(self) -> SnakeGame:
+        self._game.reset()
+        self._remuneration.update({"score": 0, "reward": 0})
+        return self._game
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure headless episodes per second for restarting games.")
+    parser.add_argument("--episodes", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--display", action="store_true", help="render every step instead of running headless")
+    args = parser.parse_args()
+
+    window_config, game_config = load_configurations()
+    if args.display:
+        pygame.init()  # pylint: disable=E1101
+    game_factory = SnakeGameFactory(
+        window_configuration=window_config,
+        # a frame rate of 0 lets Clock.tick return without delay
+        game_configuration=replace(game_config, frame_rate=0, seed=args.seed, scenario=True),
+        headless=not args.display,
+    )
+
+    for name, start_episode in (
+        ("rebuild", RebuildingEpisodes(game_factory)),
+        ("reset", ResettingEpisodes(game_factory)),
+    ):
+        random_generator = np.random.default_rng(args.seed)
+        episodes_per_second, restarts_per_second = measure_episodes_per_second(
+            args.episodes, start_episode, random_generator
+        )
+        print(f"{name:>8}: {episodes_per_second:10.1f} episodes/s {restarts_per_second:12.1f} restarts/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import time
+from dataclasses import replace
+from typing import List
+
+import numpy as np
+import pygame
+
+from benchmarks.common import load_configurations
+from snake.game_objects.factories import GridFactory
+from snake.game_objects.objects import (
+    Food,
+    FoodHandler,
+    Grid,
+    Point,
+    Snake,
+    SnakeHandler,
+)
+from snake.pygame_interface.game_ui import AbstractGameUI, FramebufferGameUI, GameUI
+
+UI_TYPES = {"GameUI": GameUI, "FramebufferGameUI": FramebufferGameUI}
+
+
+def create_serpentine_path(grid: Grid) -> List[Point]:
+    return [
+        Point(x=x if y % 2 == 0 else grid.width - 1 - x, y=y) for y in range(grid.height) for x in range(grid.width)
+    ]
+
+
+def create_snake_handler(path: List[Point], grid: Grid, snake_length: int) -> SnakeHandler:
+    return SnakeHandler(snake=Snake(head=path[snake_length - 1], body=path[snake_length - 2 :: -1]), grid=grid)
+
+
+def measure_frame_time_ms(
+    ui: AbstractGameUI, snake_handler: SnakeHandler, path: List[Point], frames: int, full_redraw: bool
+) -> float:
+    position = len(snake_handler.get_snake())
+    start = time.perf_counter()
+    for _ in range(frames):
+        snake_handler.extend_snake(path[position % len(path)])
+        snake_handler.remove_last_element_from_body()
+        position += 1
+        if full_redraw:
+            ui.reset()
+        ui.update_snake_food_and_text(score=0)
+    return 1_000 * (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure frame times for growing snakes.")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[3, 50, 200, 600])
+    parser.add_argument("--backend", choices=list(UI_TYPES), default="GameUI")
+    parser.add_argument("--block-size", type=int, help="override the block size to render larger boards")
+    args = parser.parse_args()
+
+    window_config, game_config = load_configurations()
+    game_config = replace(game_config, frame_rate=0)
+    if args.block_size:
+        game_config = replace(game_config, outer_block_size=args.block_size, inner_block_size=args.block_size)
+    grid = GridFactory(window_config=window_config, game_config=game_config).create_grid()
+    path = create_serpentine_path(grid)
+    pygame.init()  # pylint: disable=E1101
+    print(f"{args.backend} on a {grid.width}x{grid.height} board")
+
+    for snake_length in args.lengths:
+        if snake_length >= grid.size:
+            continue
+        snake_handler = create_snake_handler(path, grid, snake_length)
+        food_handler = FoodHandler(food=Food(cell=0), grid=grid, random_generator=np.random.default_rng(0))
+        ui = UI_TYPES[args.backend](
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+        )
+        incremental = measure_frame_time_ms(ui, snake_handler, path, args.frames, full_redraw=False)
+        full = measure_frame_time_ms(ui, snake_handler, path, args.frames, full_redraw=True)
+        print(f"length {snake_length:5d}: {incremental:8.3f} ms/frame incremental {full:8.3f} ms/frame full redraw")
+
+
+if __name__ == "__main__":
+    main()
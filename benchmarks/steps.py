@@ -0,0 +1,79 @@
+import argparse
+import time
+from dataclasses import replace
+
+import numpy as np
+import pygame
+
+from benchmarks.common import (
+    create_subscribers,
+    load_configurations,
+    play_random_step,
+    register_subscribers,
+)
+from snake.game import SnakeGameFactory
+from snake.publisher import Publisher, PublisherEvents
+
+
+def measure_steps_per_second(game_factory: SnakeGameFactory, steps: int, seed: int) -> float:
+    random_generator = np.random.default_rng(seed)
+    remuneration = {"score": 0, "reward": 0}
+    game = game_factory.create_snake_game()
+    register_subscribers(game, remuneration=remuneration)
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        play_random_step(game, random_generator)
+        if game.is_over():
+            game.reset()
+            remuneration.update({"score": 0, "reward": 0})
+    return steps / (time.perf_counter() - start)
+
+
+def measure_event_dispatch_ns(steps: int) -> float:
+    publisher = Publisher()
+    remuneration = {"score": 0, "reward": 0}
+    for subscriber in create_subscribers(remuneration):
+        publisher.add_subscriber(subscriber)
+    step_events = [PublisherEvents.NO_COLLISION]
+
+    start = time.perf_counter_ns()
+    for _ in range(steps):
+        publisher.publish_events(step_events)
+    return (time.perf_counter_ns() - start) / steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure headless game steps per second and event overhead.")
+    parser.add_argument("--steps", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--render",
+        choices=["headless", "coupled", "decoupled"],
+        default="headless",
+        help="draw every step at frame_rate (coupled) or sample snapshots from a render thread (decoupled)",
+    )
+    args = parser.parse_args()
+
+    window_config, game_config = load_configurations()
+    game_factory = SnakeGameFactory(
+        window_configuration=window_config,
+        game_configuration=replace(
+            game_config, seed=args.seed, scenario=True, decoupled_rendering=args.render == "decoupled"
+        ),
+        headless=args.render == "headless",
+    )
+    if args.render != "headless":
+        pygame.init()  # pylint: disable=E1101
+
+    steps_per_second = measure_steps_per_second(game_factory, args.steps, args.seed)
+    event_dispatch_ns = measure_event_dispatch_ns(args.steps)
+    step_ns = 1e9 / steps_per_second
+    print(f"   steps: {steps_per_second:10.1f} steps/s {step_ns:10.1f} ns/step")
+    if args.render != "headless":
+        pygame.quit()  # pylint: disable=E1101
+    print(f"  events: {event_dispatch_ns:10.1f} ns/step {100 * event_dispatch_ns / step_ns:9.1f} % of a step")
+
+
+if __name__ == "__main__":
+    main()
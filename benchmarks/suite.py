@@ -0,0 +1,289 @@
+import argparse
+import itertools
+import json
+import platform
+import sys
+import time
+from collections import deque
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from benchmarks.common import (
+    load_configurations,
+    play_random_episode,
+    register_subscribers,
+)
+from benchmarks.rendering import create_serpentine_path, create_snake_handler
+from snake.agents import LONG_MEMORY_BATCH_SIZE
+from snake.bitboard import SnakeBitboard
+from snake.collision_checker import CollisionChecker
+from snake.config import GameConfig, WindowConfig
+from snake.frame_stacking import FrameStacker
+from snake.game import SnakeGameFactory
+from snake.game_controls import Direction
+from snake.game_objects.objects import Grid, Point
+from snake.hamiltonian import HamiltonianPlanner, create_hamiltonian_cycle
+from snake.model import LinearQNet, QTrainer
+from snake.observations import ObservationBatch
+from snake.pathfinding import get_direction
+from snake.state import StateFactory
+
+DEFAULT_OUTPUT = Path("benchmarks/results.json")
+DEFAULT_BASELINE = Path("benchmarks/baseline.json")
+DEFAULT_TOLERANCE = 0.2
+SQUARE_LOOP = [Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP]
+SNAKE_LENGTHS = [3, 50, 200]
+BOARD_SIZES = [(320, 240), (640, 480), (1280, 960)]
+# episode start lengths as fractions of the grid width; they stay below half of it so the snake fits the board
+START_LENGTH_FRACTIONS = [0.2, 0.3, 0.45]
+BATCH_SIZES = [1, 32, 1_000]
+BOARD_FILLS = [0.5, 0.9]
+
+Benchmark = Callable[[], object]
+
+
+def measure_ns_per_op(benchmark: Benchmark, min_time_s: float, repeats: int) -> Dict[str, float]:
+    benchmark()
+    operations = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(operations):
+            benchmark()
+        elapsed_ns = time.perf_counter_ns() - start
+        if elapsed_ns >= min_time_s * 1e9 / repeats:
+            break
+        operations *= 2
+    timings_ns = [elapsed_ns / operations]
+    for _ in range(repeats - 1):
+        start = time.perf_counter_ns()
+        for _ in range(operations):
+            benchmark()
+        timings_ns.append((time.perf_counter_ns() - start) / operations)
+    return {"ns_per_op": float(np.median(timings_ns)), "min_ns_per_op": min(timings_ns), "operations": operations}
+
+
+class EpisodeBenchmark:
+    def __init__(self, window_config: WindowConfig, game_config: GameConfig, seed: int):
+        self._remuneration = {"score": 0, "reward": 0}
+        self._game = SnakeGameFactory(
+            window_configuration=window_config, game_configuration=game_config, headless=True
+        ).create_snake_game()
+        register_subscribers(self._game, remuneration=self._remuneration)
+        self._random_generator = np.random.default_rng(seed)
+
+    def __call__(self) -> None:
+        self._game.reset()
+        self._remuneration.update({"score": 0, "reward": 0})
+        play_random_episode(self._game, self._random_generator)
+
+
+class HamiltonianStepBenchmark:
+    # One step of a snake that already fills part of the board and follows the Hamiltonian cycle, so collision checks
+    # and food placement run against a long snake. The game is restored to the filled position when it ends.
+    def __init__(self, window_config: WindowConfig, game_config: GameConfig, fill: float):
+        self._game = SnakeGameFactory(
+            window_configuration=window_config, game_configuration=game_config, headless=True
+        ).create_snake_game()
+        snake_handler = self._game.get_snake_handler()
+        grid = snake_handler.grid
+        cells = create_hamiltonian_cycle(grid).cells
+        snake_length = int(fill * grid.size)
+        head = grid.to_point(cells[snake_length - 1])
+        snake_handler.restore(head, [grid.to_point(cell) for cell in cells[snake_length - 2 :: -1]])
+        food_handler = self._game.get_food_handler()
+        food_handler.move_food_to_random_free_cell(snake_handler.get_free_cells())
+        self._filled_state = self._game.snapshot()._replace(
+            direction=get_direction(grid, snake_handler.body[0], cells[snake_length - 1])
+        )
+        self._game.restore(self._filled_state)
+        self._planner = HamiltonianPlanner(snake_handler=snake_handler, max_shortcut_fill=0)
+
+    def __call__(self) -> None:
+        if self._game.is_over():
+            self._game.restore(self._filled_state)
+            self._planner.reset()
+        snake_handler = self._game.get_snake_handler()
+        next_cell = self._planner.next_cell(self._game.get_food_handler().get_current_food_cell())
+        self._game.update_direction(get_direction(snake_handler.grid, snake_handler.head, next_cell))
+        self._game.run()
+
+
+def create_square_moves(grid: Grid, snake_length: int) -> Benchmark:
+    snake_handler = create_snake_handler(create_serpentine_path(grid), grid, snake_length)
+    directions = itertools.cycle(SQUARE_LOOP)
+    return lambda: snake_handler.move_snake(next(directions))
+
+
+def create_reachable_cells(grid: Grid, snake_length: int) -> Benchmark:
+    # The serpentine snake leaves one open area, so the flood fill has to cover snake_length cells of it.
+    snake_handler = create_snake_handler(create_serpentine_path(grid), grid, snake_length)
+    snake_bitboard = SnakeBitboard(snake_handler)
+    head = snake_handler.head
+    below_head = Point(x=head.x, y=head.y + 1)
+    return lambda: snake_bitboard.count_reachable_cells(below_head, limit=snake_length)
+
+
+def create_micro_benchmarks(window_config: WindowConfig, game_config: GameConfig) -> Iterator[Tuple[str, Benchmark]]:
+    snake_game = SnakeGameFactory(
+        window_configuration=window_config, game_configuration=game_config, headless=True
+    ).create_snake_game()
+    grid = snake_game.get_snake_handler().grid
+    path = create_serpentine_path(grid)
+
+    for snake_length in SNAKE_LENGTHS:
+        yield f"move_snake[length={snake_length}]", create_square_moves(grid, snake_length)
+        collision_checker = CollisionChecker(grid=grid, snake_handler=create_snake_handler(path, grid, snake_length))
+        yield f"collision_detected[length={snake_length}]", collision_checker.collision_detected
+        yield f"reachable_cells[length={snake_length}]", create_reachable_cells(grid, snake_length)
+
+    state = StateFactory(game_configuration=game_config).create_state_for_game(game=snake_game)
+    yield "calculate_state_from_game", state.calculate_state_from_game
+
+    input_size = len(state.calculate_state_from_game()) * game_config.frame_stack_depth
+    model = LinearQNet(input_feature_size=input_size)
+    for batch_size in BATCH_SIZES:
+        states = torch.rand((batch_size, input_size))
+        yield f"linear_qnet_forward[batch={batch_size}]", create_forward(model, states)
+
+    trainer = QTrainer(model=model)
+    for batch_size in [1, LONG_MEMORY_BATCH_SIZE]:
+        yield f"train_step[batch={batch_size}]", create_train_step(trainer, input_size, batch_size)
+
+    yield f"replay_sampling[batch={LONG_MEMORY_BATCH_SIZE}]", create_replay_sampling(input_size=11, depth=2)
+
+
+def create_forward(model: LinearQNet, states: torch.Tensor) -> Benchmark:
+    return lambda: model(states)
+
+
+def create_train_step(trainer: QTrainer, input_size: int, batch_size: int) -> Benchmark:
+    states = np.random.default_rng(0).random((batch_size, input_size), dtype=np.float32)
+    if batch_size == 1:
+        return lambda: trainer.train_step(
+            old_state=states[0], action=[1, 0, 0], reward=0, new_state=states[0], game_over=False
+        )
+    actions = [[1, 0, 0]] * batch_size
+    rewards = [0] * batch_size
+    game_overs = tuple([False] * batch_size)
+    return lambda: trainer.train_step(
+        old_state=states, action=actions, reward=rewards, new_state=states, game_over=game_overs
+    )
+
+
+def create_replay_sampling(input_size: int, depth: int, memory_size: int = 100_000) -> Benchmark:
+    random_generator = np.random.default_rng(0)
+    frame_stacker = FrameStacker(frame_shape=(input_size,), depth=depth, capacity=memory_size + depth)
+    old_state = frame_stacker.reset(random_generator.random(input_size))
+    memory: deque = deque(maxlen=memory_size)
+    for _ in range(memory_size):
+        new_state = frame_stacker.push(random_generator.random(input_size))
+        memory.append((old_state, [1, 0, 0], 0, new_state, False))
+        old_state = new_state
+    batch = ObservationBatch(batch_size=LONG_MEMORY_BATCH_SIZE, shape=frame_stacker.stacked_shape)
+
+    def sample() -> np.ndarray:
+        indices = random_generator.choice(len(memory), size=LONG_MEMORY_BATCH_SIZE, replace=False)
+        old_states, _, _, _, _ = zip(*[memory[idx] for idx in indices])
+        return frame_stacker.materialize_batch(old_states, out=batch.array)
+
+    return sample
+
+
+def create_macro_benchmarks(
+    window_config: WindowConfig, game_config: GameConfig, seed: int
+) -> Iterator[Tuple[str, Benchmark]]:
+    for width, height in BOARD_SIZES:
+        board = replace(window_config, width=width, height=height)
+        columns = width // game_config.outer_block_size
+        for start_length in [int(columns * fraction) for fraction in START_LENGTH_FRACTIONS]:
+            yield f"episode[board={width}x{height},length={start_length}]", EpisodeBenchmark(
+                board, replace(game_config, start_length=start_length), seed
+            )
+        for fill in BOARD_FILLS:
+            yield f"hamiltonian_step[board={width}x{height},fill={fill}]", HamiltonianStepBenchmark(
+                replace(window_config, width=width, height=height), replace(game_config, loop_detection=False), fill
+            )
+
+
+def run_benchmarks(
+    benchmarks: Iterator[Tuple[str, Benchmark]], min_time_s: float, repeats: int, pattern: Optional[str]
+) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, benchmark in benchmarks:
+        if pattern and pattern not in name:
+            continue
+        results[name] = measure_ns_per_op(benchmark, min_time_s=min_time_s, repeats=repeats)
+        print(f"{name:<48} {results[name]['ns_per_op']:14.0f} ns/op")
+    return results
+
+
+def compare_with_baseline(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float
+) -> List[str]:
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["ns_per_op"] / baseline[name]["ns_per_op"]
+        result["baseline_ratio"] = ratio
+        marker = "REGRESSION" if ratio > 1 + tolerance else ""
+        print(f"{name:<48} {ratio:8.2f}x baseline {marker}")
+        if marker:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run micro and macro benchmarks and compare them with a baseline.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown, 0.2 is 20 %%")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds spent per benchmark")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    window_config, game_config = load_configurations()
+    game_config = replace(game_config, frame_rate=0, seed=args.seed, scenario=True, profiling=False, metrics_port=None)
+    torch.manual_seed(args.seed)
+    torch.set_num_threads(1)
+
+    results = run_benchmarks(
+        create_micro_benchmarks(window_config, game_config), args.min_time, args.repeats, args.filter
+    )
+    results.update(
+        run_benchmarks(
+            create_macro_benchmarks(window_config, game_config, args.seed), args.min_time, args.repeats, args.filter
+        )
+    )
+
+    regressions = []
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["benchmarks"]
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+
+    report = {
+        "environment": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "torch": torch.__version__,
+            "numpy": np.__version__,
+        },
+        "benchmarks": results,
+    }
+    output = args.baseline if args.save_baseline else args.output
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Saved results to {output}")
+    if regressions:
+        sys.exit(f"{len(regressions)} benchmark(s) slower than {1 + args.tolerance:.2f}x baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,8 +16,13 @@ if __name__ == "__main__":
             game_configuration=game_configuration,
         ).create_agent()
 
-        while agent.wants_to_play():
-            agent.play_game()
+        try:
+            while agent.wants_to_play():
+                agent.play_game()
+        finally:
+            agent.close()
 
         score = agent.get_max_score()
         print("Max score", score)
+        if game_configuration.profiling:
+            print(agent.get_step_profiler().get_summary())
@@ -1,24 +1,101 @@
-import random
+import time
 from abc import ABC, abstractmethod
 from collections import deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, cast
+from typing import Dict, List, Optional, Sequence, Tuple, cast
 
 import numpy as np
 import torch
 
 from snake.config import GameConfig, WindowConfig
+from snake.evaluation import (
+    EvaluationResult,
+    PeriodicEvaluation,
+    create_periodic_evaluation,
+)
+from snake.frame_stacking import FrameStacker, LazyFrameStack
 from snake.game import SnakeGame, SnakeGameFactory
-from snake.game_controls import Direction, PygameEventHandler
-from snake.game_objects.objects import Point
-from snake.model import LinearQNet, QTrainer
+from snake.game_controls import (
+    AbstractEventHandler,
+    Direction,
+    HeadlessEventHandler,
+    PygameEventHandler,
+)
+from snake.game_objects.objects import Point, SnakeHandler
+from snake.hamiltonian import HamiltonianPlanner
+from snake.mcts import MonteCarloTreeSearch, turn
+from snake.memory_diagnostics import MemoryDiagnostics, create_memory_diagnostics
+from snake.metrics import EpisodeMetrics, MetricsSummary, MetricsWriter
+from snake.metrics_server import LiveMetrics, MetricsServer
+from snake.model import ConvQNet, LinearQNet, QNet, QTrainer
+from snake.observations import GridObservation, GridObservationFactory, ObservationBatch
+from snake.pathfinding import AbstractPathPlanner, PathPlanner, get_direction
+from snake.profiler import AbstractStepProfiler
 from snake.publisher import (
     AbstractSubscriber,
     NoCollisionSubscriber,
     RewardSubscriber,
     ScoreSubscriber,
 )
-from snake.state import State, StateFactory
+from snake.random_generators import RandomStream, create_random_generator
+from snake.state import StateFactory
+
+MEMORY_SIZE = 100_000
+LONG_MEMORY_BATCH_SIZE = 1_000
+# A random move is made when a number drawn from 0 to EPSILON_RANGE is below epsilon.
+EPSILON_RANGE = 200
+
+
+@dataclass(frozen=True)
+class TrainingParameters:
+    learning_rate: float = 0.001
+    discount_rate: float = 0.9
+    hidden_layer_size: int = 256
+    batch_size: int = LONG_MEMORY_BATCH_SIZE
+    epsilon_start: int = 80
+    epsilon_decay: float = 1.0
+
+    @staticmethod
+    def from_game_config(game_config: GameConfig) -> "TrainingParameters":
+        return TrainingParameters(
+            learning_rate=game_config.learning_rate,
+            discount_rate=game_config.discount_rate,
+            hidden_layer_size=game_config.hidden_layer_size,
+            batch_size=game_config.batch_size,
+            epsilon_start=game_config.epsilon_start,
+            epsilon_decay=game_config.epsilon_decay,
+        )
+
+
+@dataclass(frozen=True)
+class AIAgentOptions:
+    frame_stack_depth: int = 2
+    loop_penalty: int = -10
+    reachable_area_safety: bool = False
+    persist_model: bool = True
+    training_parameters: TrainingParameters = TrainingParameters()
+
+    @staticmethod
+    def from_game_config(game_config: GameConfig, persist_model: bool = True) -> "AIAgentOptions":
+        return AIAgentOptions(
+            frame_stack_depth=game_config.frame_stack_depth,
+            loop_penalty=game_config.loop_penalty,
+            reachable_area_safety=game_config.reachable_area_safety,
+            persist_model=persist_model,
+            training_parameters=TrainingParameters.from_game_config(game_config),
+        )
+
+
+@dataclass(frozen=True)
+class AIAgentComponents:
+    # Optional collaborators of the AIAgent; without them it plays with pygame input and records nothing.
+    grid_observation_factory: Optional[GridObservationFactory] = None
+    event_handler: Optional[AbstractEventHandler] = None
+    metrics_writer: Optional[MetricsWriter] = None
+    metrics_server: Optional[MetricsServer] = None
+    memory_diagnostics: Optional[MemoryDiagnostics] = None
+    periodic_evaluation: Optional[PeriodicEvaluation] = None
 
 
 class Actions(Enum):
@@ -30,6 +107,9 @@ class Actions(Enum):
 class Agents(Enum):
     UserAgent = "UserAgent"
     AIAgent = "AIAgent"
+    MCTSAgent = "MCTSAgent"
+    PathfindingAgent = "PathfindingAgent"
+    HamiltonianAgent = "HamiltonianAgent"
 
     @classmethod
     def get_agent_names(cls) -> List[str]:
@@ -57,6 +137,14 @@ class AbstractAgent(ABC):
     def get_max_score(self) -> int:
         pass
 
+    @abstractmethod
+    def get_step_profiler(self) -> AbstractStepProfiler:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
 
 class UserAgent(AbstractAgent):
     def __init__(self, game_factory: SnakeGameFactory):
@@ -112,9 +200,8 @@ class UserAgent(AbstractAgent):
             self._max_score = new_score
 
     def restart_game(self) -> None:
-        self._game = self._game_factory.create_snake_game()
-        self._remuneration = self._initial_remuneration
-        self._register_subscriber(self._initial_subscribers)
+        self._game.reset()
+        self._remuneration.update(self._initial_remuneration)
 
     @property
     def _actions(self) -> Dict:
@@ -136,29 +223,99 @@ class UserAgent(AbstractAgent):
     def get_max_score(self) -> int:
         return self._max_score
 
+    def get_step_profiler(self) -> AbstractStepProfiler:
+        return self._game.get_step_profiler()
+
+    def close(self) -> None:
+        pass
+
 
 class AIAgent(AbstractAgent):
     # pylint: disable=too-many-instance-attributes
-    def __init__(self, game_factory: SnakeGameFactory, state_factory: StateFactory):
+    def __init__(
+        self,
+        game_factory: SnakeGameFactory,
+        state_factory: StateFactory,
+        random_generator: np.random.Generator,
+        options: AIAgentOptions = AIAgentOptions(),
+        components: AIAgentComponents = AIAgentComponents(),
+    ):
+        # pylint: disable=too-many-arguments
         self._game_factory = game_factory
+        self._loop_penalty = options.loop_penalty
+        self._reachable_area_safety = options.reachable_area_safety
+        self._training_parameters = options.training_parameters
+        self._persist_model = options.persist_model
+        self._random_generator = random_generator
         self._game = self._game_factory.create_snake_game()
 
         self._remuneration = self._initial_remuneration
         self._register_subscriber(self._initial_subscribers)
 
-        self._event_handler = PygameEventHandler()
+        self._event_handler = components.event_handler or PygameEventHandler()
         self._state_factory = state_factory
         self._state = self._state_factory.create_state_for_game(game=self._game)
 
-        self._memory: deque = deque(maxlen=100_000)
-        self._direction_store: deque = deque([0 for _ in range(9)], maxlen=9)
+        self._memory: deque = deque(maxlen=MEMORY_SIZE)
         self._n_games = 0
         self._epsilon = 0
 
-        self._model = LinearQNet(input_feature_size=20, hidden_layer_size=256, output_feature_size=3)
-        self._trainer = QTrainer(model=self._model, learning_rate=0.001, discount_rate=0.9)
+        self._grid_observation: Optional[GridObservation] = None
+        if components.grid_observation_factory:
+            self._grid_observation = components.grid_observation_factory.create_grid_observation(game=self._game)
+        first_frame = self._observe_frame()
+        # Every step adds one frame and every restart one more, so the frames of all remembered steps fit.
+        self._frame_stacker = FrameStacker(
+            frame_shape=first_frame.shape,
+            depth=options.frame_stack_depth,
+            capacity=2 * MEMORY_SIZE + options.frame_stack_depth,
+        )
+        self._frame_stacker.reset(first_frame)
+        shape = self._frame_stacker.stacked_shape
+        self._step_batch = ObservationBatch(batch_size=2, shape=shape)
+        self._old_states_batch = ObservationBatch(batch_size=self._training_parameters.batch_size, shape=shape)
+        self._new_states_batch = ObservationBatch(batch_size=self._training_parameters.batch_size, shape=shape)
+        self._model = self._create_model()
+        self._trainer = QTrainer(
+            model=self._model,
+            learning_rate=self._training_parameters.learning_rate,
+            discount_rate=self._training_parameters.discount_rate,
+        )
         self._max_score = 0
 
+        self._metrics_writer = components.metrics_writer
+        if self._metrics_writer:
+            self._metrics_writer.start()
+        self._metrics_summary = MetricsSummary()
+        self._episode_steps = 0
+        self._episode_reward = 0
+        self._episode_started_at = time.perf_counter()
+
+        self._metrics_server = components.metrics_server
+        self._live_metrics = self._metrics_server.live_metrics if self._metrics_server else LiveMetrics()
+        self._live_metrics.replay_capacity = MEMORY_SIZE
+        if self._metrics_server:
+            self._metrics_server.start(step_profiler=self._game.get_step_profiler())
+        self._memory_diagnostics = components.memory_diagnostics
+        self._periodic_evaluation = components.periodic_evaluation
+        self._evaluation_result: Optional[EvaluationResult] = None
+
+    def _create_model(self) -> QNet:
+        shape = self._frame_stacker.stacked_shape
+        hidden_layer_size = self._training_parameters.hidden_layer_size
+        if self._grid_observation:
+            return ConvQNet(
+                input_shape=cast(Tuple[int, int, int], shape),
+                hidden_layer_size=hidden_layer_size,
+                load_saved_model=self._persist_model,
+            )
+        return LinearQNet(
+            input_feature_size=shape[0],
+            hidden_layer_size=hidden_layer_size,
+            output_feature_size=3,
+            load_saved_model=self._persist_model,
+        )
+
     @property
     def _initial_remuneration(self) -> Dict[str, int]:
         return {"score": 0, "reward": 0}
@@ -167,7 +324,7 @@ class AIAgent(AbstractAgent):
     def _initial_subscribers(self) -> List[AbstractSubscriber]:
         return [
             ScoreSubscriber(remuneration=self._remuneration),
-            RewardSubscriber(remuneration=self._remuneration),
+            RewardSubscriber(remuneration=self._remuneration, loop_penalty=self._loop_penalty),
             NoCollisionSubscriber(remuneration=self._remuneration),
         ]
 
@@ -176,40 +333,75 @@ class AIAgent(AbstractAgent):
             self._game.add_subscriber(subscriber)
 
     def play_game(self) -> None:
+        profiler = self._game.get_step_profiler()
+        started_at = profiler.begin_step()
         self._event_handler.handle_events()
-        self._store_direction()
-        old_state = self._state.calculate_state_from_game()
-        old_state = np.append(old_state, self._direction_store)
+        self._game.update_speed(
+            self._event_handler.get_updated_speed_mode(), frame_skip_change=self._event_handler.get_frame_skip_change()
+        )
+        started_at = profiler.record("agent.events", started_at)
+        old_state = self._frame_stacker.current()
+        old_state_array = old_state.materialize(out=self._step_batch.array[0])
+        started_at = profiler.record("agent.old_state", started_at)
 
-        action = self._get_actions(state=old_state)
+        action = self._get_actions(state=old_state_array)
         new_direction = self._convert_actions_to_directions(action)
         self._game.update_direction(new_direction)
+        started_at = profiler.record("agent.inference", started_at)
         self._game.run()
         reward = self.get_reward()
         game_over = self._game.is_over()
+        self._episode_steps += 1
+        self._episode_reward += reward
+        started_at = profiler.record("agent.game_run", started_at)
 
-        self._store_direction()
-        new_state = self._state.calculate_state_from_game()
-        new_state = np.append(new_state, self._direction_store)
+        new_state = self._frame_stacker.push(self._observe_frame())
+        new_state_array = new_state.materialize(out=self._step_batch.array[1])
+        started_at = profiler.record("agent.new_state", started_at)
 
         self._train_short_memory(
-            old_state=old_state, action=action, reward=reward, new_state=new_state, is_game_over=game_over
+            old_state=old_state_array, action=action, reward=reward, new_state=new_state_array, is_game_over=game_over
         )
+        started_at = profiler.record("agent.short_memory", started_at)
         self._remember(old_state=old_state, action=action, reward=reward, new_state=new_state, is_game_over=game_over)
-
-    def _get_actions(self, state: State) -> Actions:
-        self._epsilon = 80 - self._n_games
+        live_metrics = self._live_metrics
+        live_metrics.env_steps += 1
+        live_metrics.gradient_steps += 1
+        live_metrics.replay_size = len(self._memory)
+        profiler.record("agent.replay", started_at)
+        profiler.end_step()
+
+    def _observe_frame(self) -> np.ndarray:
+        if self._grid_observation:
+            return self._grid_observation.observe()
+        return cast(np.ndarray, self._state.calculate_state_from_game())
+
+    def _get_actions(self, state: np.ndarray) -> Actions:
+        parameters = self._training_parameters
+        self._epsilon = int(parameters.epsilon_start - parameters.epsilon_decay * self._n_games)
         action = [0, 0, 0]
-        if random.randint(0, 200) < self._epsilon:
-            move = random.randint(0, 2)
-            action[move] = 1
+        prediction: Optional[torch.Tensor] = None
+        if self._random_generator.integers(0, EPSILON_RANGE, endpoint=True) < self._epsilon:
+            move = int(self._random_generator.integers(0, 3))
         else:
-            state_0 = torch.tensor(state, dtype=torch.float)
-            prediction = self._model(state_0)
+            state_0 = torch.as_tensor(state, dtype=torch.float)
+            with torch.no_grad():
+                prediction = self._model(state_0)
             move = cast(int, torch.argmax(prediction).item())
-            action[move] = 1
+        if self._reachable_area_safety:
+            move = self._avoid_enclosed_space(move, prediction)
+        action[move] = 1
         return Actions(action)
 
+    def _avoid_enclosed_space(self, move: int, prediction: Optional[torch.Tensor]) -> int:
+        safe_moves = self._state.calculate_safe_moves()
+        if safe_moves[move] or not any(safe_moves):
+            return move
+        candidates = [candidate for candidate, is_safe in enumerate(safe_moves) if is_safe]
+        if prediction is None:
+            return int(self._random_generator.choice(candidates))
+        return max(candidates, key=lambda candidate: float(prediction[candidate]))
+
     def _convert_actions_to_directions(self, action: Actions) -> Direction:
         clock_wise_directions = [Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP]
         idx = clock_wise_directions.index(self._game.get_current_direction())
@@ -224,19 +416,17 @@ class AIAgent(AbstractAgent):
 
         return new_direction
 
-    def _store_direction(self) -> None:
-        direction_as_binary = self._state.convert_direction_to_binary()
-        self._direction_store.extend(direction_as_binary)
-
     def _train_short_memory(
-        self, old_state: List[int], action: Actions, reward: int, new_state: List[int], is_game_over: bool
+        self, old_state: np.ndarray, action: Actions, reward: int, new_state: np.ndarray, is_game_over: bool
     ):
         action_value = cast(List[int], action.value)
         self._trainer.train_step(
             old_state=old_state, action=action_value, reward=reward, new_state=new_state, game_over=is_game_over
         )
 
-    def _remember(self, old_state: List[int], action: Actions, reward: int, new_state: List[int], is_game_over: bool):
+    def _remember(
+        self, old_state: LazyFrameStack, action: Actions, reward: int, new_state: LazyFrameStack, is_game_over: bool
+    ):
         action_value = cast(List[int], action.value)
         self._memory.append((old_state, action_value, reward, new_state, is_game_over))
 
@@ -245,33 +435,113 @@ class AIAgent(AbstractAgent):
             return False
         if self._game.is_over():
             self._increase_max_score()
+            score = self.get_score()
             self.restart_game()
-            self._state = self._state_factory.create_state_for_game(game=self._game)
             self._n_games += 1
-            self._train_long_memory()
-            self._model.save()
+            loss = self._train_long_memory()
+            if self._persist_model:
+                self._model.save()
+                self._live_metrics.checkpoint_saved_at = time.monotonic()
+            self._record_episode(score=score, loss=float(loss))
+            if self._periodic_evaluation:
+                self._update_periodic_evaluation()
         return True
 
+    def _record_episode(self, score: int, loss: float) -> None:
+        now = time.perf_counter()
+        metrics = EpisodeMetrics(
+            episode=self._n_games,
+            score=score,
+            steps=self._episode_steps,
+            reward_sum=self._episode_reward,
+            epsilon=self._epsilon,
+            loss=loss,
+            steps_per_second=self._episode_steps / max(now - self._episode_started_at, 1e-9),
+            replay_size=len(self._memory),
+        )
+        if self._evaluation_result:
+            metrics.evaluated_episode = self._evaluation_result.games
+            metrics.evaluation_score_mean = self._evaluation_result.report.score_mean
+            metrics.evaluation_score_max = self._evaluation_result.report.score_max
+            self._evaluation_result = None
+        self._metrics_summary.add(metrics)
+        self._live_metrics.episodes = self._n_games
+        self._live_metrics.gradient_steps += 1
+        if self._metrics_writer:
+            self._metrics_writer.write(metrics)
+        self._episode_steps = 0
+        self._episode_reward = 0
+        self._episode_started_at = now
+        if self._memory_diagnostics and self._memory_diagnostics.should_report(self._n_games):
+            self._report_memory()
+
+    def _update_periodic_evaluation(self) -> None:
+        # Polled once per episode: a finished result is written with the next episode, never waited for.
+        periodic_evaluation = cast(PeriodicEvaluation, self._periodic_evaluation)
+        evaluation_result = periodic_evaluation.poll()
+        if evaluation_result:
+            self._evaluation_result = evaluation_result
+            self._live_metrics.evaluation_score_mean = evaluation_result.report.score_mean
+            if evaluation_result.is_best:
+                self._model.save(
+                    file_name=f"best_{self._model.model_file_name}", state_dict=evaluation_result.state_dict
+                )
+        if periodic_evaluation.should_evaluate(self._n_games):
+            periodic_evaluation.submit(self._n_games, self._model)
+
+    def _report_memory(self) -> None:
+        memory_diagnostics = cast(MemoryDiagnostics, self._memory_diagnostics)
+        print(
+            memory_diagnostics.report(
+                episode=self._n_games,
+                sections={
+                    "replay memory": self._memory,
+                    "frame stacker": self._frame_stacker,
+                    "model": self._model,
+                    "optimizer": self._trainer,
+                    "observation batches": [self._step_batch, self._old_states_batch, self._new_states_batch],
+                    "game": self._game,
+                },
+            )
+        )
+
+    def get_metrics_summary(self) -> MetricsSummary:
+        return self._metrics_summary
+
+    def close(self) -> None:
+        if self._metrics_writer:
+            self._metrics_writer.close()
+        if self._metrics_server:
+            self._metrics_server.stop()
+        if self._memory_diagnostics:
+            self._memory_diagnostics.stop()
+        if self._periodic_evaluation:
+            self._periodic_evaluation.close()
+
     def _increase_max_score(self):
         new_score = self._remuneration["score"]
         if new_score > self._max_score:
             self._max_score = new_score
+            self._live_metrics.max_score = new_score
 
     def restart_game(self) -> None:
-        self._game = self._game_factory.create_snake_game()
-        self._remuneration = self._initial_remuneration
-        self._register_subscriber(self._initial_subscribers)
+        self._game.reset()
+        self._remuneration.update(self._initial_remuneration)
+        self._frame_stacker.reset(self._observe_frame())
 
-    def _train_long_memory(self):
-        batch_size = 1_000
+    def _train_long_memory(self) -> torch.Tensor:
+        batch_size = self._training_parameters.batch_size
         if len(self._memory) > batch_size:
-            mini_sample = random.sample(self._memory, batch_size)
+            indices = self._random_generator.choice(len(self._memory), size=batch_size, replace=False)
+            mini_sample: Sequence[tuple] = [self._memory[idx] for idx in indices]
         else:
             mini_sample = self._memory
 
         old_states, actions, rewards, new_states, game_overs = zip(*mini_sample)
-        self._trainer.train_step(
-            old_state=old_states, action=actions, reward=rewards, new_state=new_states, game_over=game_overs
+        old_states_batch = self._frame_stacker.materialize_batch(old_states, out=self._old_states_batch.array)
+        new_states_batch = self._frame_stacker.materialize_batch(new_states, out=self._new_states_batch.array)
+        return self._trainer.train_step(
+            old_state=old_states_batch, action=actions, reward=rewards, new_state=new_states_batch, game_over=game_overs
         )
 
     @property
@@ -287,10 +557,250 @@ class AIAgent(AbstractAgent):
     def get_max_score(self) -> int:
         return self._max_score
 
+    def get_step_profiler(self) -> AbstractStepProfiler:
+        return self._game.get_step_profiler()
+
     def get_reward(self) -> int:
         return self._remuneration["reward"]
 
 
+class MCTSAgent(AbstractAgent):
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        game_factory: SnakeGameFactory,
+        search_game_factory: SnakeGameFactory,
+        state_factory: StateFactory,
+        *,
+        simulations: int,
+        exploration: float = 1.5,
+        discount: float = 0.9,
+        frame_stack_depth: int = 2,
+        hidden_layer_size: int = 256,
+    ):
+        self._game_factory = game_factory
+        self._game = self._game_factory.create_snake_game()
+
+        self._remuneration = self._initial_remuneration
+        self._register_subscriber(self._initial_subscribers)
+
+        self._event_handler = PygameEventHandler()
+        self._state_factory = state_factory
+        self._state = self._state_factory.create_state_for_game(game=self._game)
+
+        self._frames: deque = deque(maxlen=frame_stack_depth)
+        self._reset_frames()
+        self._model = LinearQNet(
+            input_feature_size=frame_stack_depth * len(self._frames[0]),
+            hidden_layer_size=hidden_layer_size,
+            output_feature_size=3,
+        )
+        search_game = search_game_factory.create_snake_game()
+        self._search = MonteCarloTreeSearch(
+            game=search_game,
+            state=self._state_factory.create_state_for_game(game=search_game),
+            model=self._model,
+            simulations=simulations,
+            exploration=exploration,
+            discount=discount,
+        )
+        self._n_games = 0
+        self._max_score = 0
+
+    @property
+    def _initial_remuneration(self) -> Dict[str, int]:
+        return {"score": 0, "reward": 0}
+
+    @property
+    def _initial_subscribers(self) -> List[AbstractSubscriber]:
+        return [
+            ScoreSubscriber(remuneration=self._remuneration),
+            RewardSubscriber(remuneration=self._remuneration),
+            NoCollisionSubscriber(remuneration=self._remuneration),
+        ]
+
+    def _register_subscriber(self, subscribers: List[AbstractSubscriber]) -> None:
+        for subscriber in subscribers:
+            self._game.add_subscriber(subscriber)
+
+    def _observe_frame(self) -> np.ndarray:
+        return np.asarray(self._state.calculate_state_from_game(), dtype=np.float32)
+
+    def _reset_frames(self) -> None:
+        self._frames.extend([self._observe_frame()] * cast(int, self._frames.maxlen))
+
+    def play_game(self) -> None:
+        profiler = self._game.get_step_profiler()
+        started_at = profiler.begin_step()
+        self._event_handler.handle_events()
+        self._game.update_speed(
+            self._event_handler.get_updated_speed_mode(), frame_skip_change=self._event_handler.get_frame_skip_change()
+        )
+        started_at = profiler.record("agent.events", started_at)
+        action = self._search.search(root_state=self._game.snapshot(), frames=tuple(self._frames))
+        self._game.update_direction(turn(self._game.get_current_direction(), action))
+        started_at = profiler.record("agent.search", started_at)
+        self._game.run()
+        started_at = profiler.record("agent.game_run", started_at)
+        self._frames.append(self._observe_frame())
+        profiler.record("agent.new_state", started_at)
+        profiler.end_step()
+
+    def wants_to_play(self) -> bool:
+        if self._event_handler.quit_game():
+            return False
+        if self._game.is_over():
+            self._increase_max_score()
+            self.restart_game()
+            self._n_games += 1
+        return True
+
+    def _increase_max_score(self):
+        new_score = self._remuneration["score"]
+        if new_score > self._max_score:
+            self._max_score = new_score
+
+    def restart_game(self) -> None:
+        self._game.reset()
+        self._remuneration.update(self._initial_remuneration)
+        self._reset_frames()
+
+    @property
+    def game(self) -> SnakeGame:
+        return self._game
+
+    def get_snake(self) -> List[Point]:
+        return self._game.get_snake()
+
+    def get_score(self) -> int:
+        return self._remuneration["score"]
+
+    def get_max_score(self) -> int:
+        return self._max_score
+
+    def get_step_profiler(self) -> AbstractStepProfiler:
+        return self._game.get_step_profiler()
+
+    def close(self) -> None:
+        pass
+
+
+class PlannerAgent(AbstractAgent):
+    # Plays deterministically by moving to the cell chosen by a path planner, which sees the snake of this game.
+
+    def __init__(self, game_factory: SnakeGameFactory):
+        self._game_factory = game_factory
+        self._game = self._game_factory.create_snake_game()
+
+        self._remuneration = self._initial_remuneration
+        self._register_subscriber(self._initial_subscribers)
+
+        self._event_handler = PygameEventHandler()
+        self._path_planner = self._create_path_planner(self._game.get_snake_handler())
+        self._max_score = 0
+
+    @abstractmethod
+    def _create_path_planner(self, snake_handler: SnakeHandler) -> AbstractPathPlanner:
+        pass
+
+    @property
+    def _initial_remuneration(self) -> Dict[str, int]:
+        return {"score": 0, "reward": 0}
+
+    @property
+    def _initial_subscribers(self) -> List[AbstractSubscriber]:
+        return [
+            ScoreSubscriber(remuneration=self._remuneration),
+            RewardSubscriber(remuneration=self._remuneration),
+            NoCollisionSubscriber(remuneration=self._remuneration),
+        ]
+
+    def _register_subscriber(self, subscribers: List[AbstractSubscriber]) -> None:
+        for subscriber in subscribers:
+            self._game.add_subscriber(subscriber)
+
+    def play_game(self) -> None:
+        profiler = self._game.get_step_profiler()
+        started_at = profiler.begin_step()
+        self._event_handler.handle_events()
+        self._game.update_speed(
+            self._event_handler.get_updated_speed_mode(), frame_skip_change=self._event_handler.get_frame_skip_change()
+        )
+        started_at = profiler.record("agent.events", started_at)
+        self._game.update_direction(self._plan_direction())
+        started_at = profiler.record("agent.pathfinding", started_at)
+        self._game.run()
+        profiler.record("agent.game_run", started_at)
+        profiler.end_step()
+
+    def _plan_direction(self) -> Optional[Direction]:
+        next_cell = self._path_planner.next_cell(self._game.get_food_handler().get_current_food_cell())
+        if next_cell is None:
+            return None
+        snake_handler = self._game.get_snake_handler()
+        return get_direction(snake_handler.grid, snake_handler.head, next_cell)
+
+    def wants_to_play(self) -> bool:
+        if self._event_handler.quit_game():
+            return False
+        if self._game.is_over():
+            self._increase_max_score()
+            self.restart_game()
+        return True
+
+    def _increase_max_score(self):
+        new_score = self._remuneration["score"]
+        if new_score > self._max_score:
+            self._max_score = new_score
+
+    def restart_game(self) -> None:
+        self._game.reset()
+        self._remuneration.update(self._initial_remuneration)
+        self._path_planner.reset()
+
+    @property
+    def game(self) -> SnakeGame:
+        return self._game
+
+    def get_snake(self) -> List[Point]:
+        return self._game.get_snake()
+
+    def get_score(self) -> int:
+        return self._remuneration["score"]
+
+    def get_max_score(self) -> int:
+        return self._max_score
+
+    def get_step_profiler(self) -> AbstractStepProfiler:
+        return self._game.get_step_profiler()
+
+    def close(self) -> None:
+        pass
+
+
+class PathfindingAgent(PlannerAgent):
+    # Follows a cached shortest path to the food and falls back to the neighbour with the most free space when the
+    # next step would trap the snake. Deterministic, so it doubles as a source of expert trajectories.
+    def __init__(self, game_factory: SnakeGameFactory, max_expansions: int):
+        self._max_expansions = max_expansions
+        super().__init__(game_factory=game_factory)
+
+    def _create_path_planner(self, snake_handler: SnakeHandler) -> AbstractPathPlanner:
+        return PathPlanner(snake_handler=snake_handler, max_expansions=self._max_expansions)
+
+
+class HamiltonianAgent(PlannerAgent):
+    # Walks a Hamiltonian cycle with safe shortcuts and fills the whole board, which makes it a load generator for
+    # long snakes.
+    def __init__(self, game_factory: SnakeGameFactory, max_shortcut_fill: float):
+        self._max_shortcut_fill = max_shortcut_fill
+        super().__init__(game_factory=game_factory)
+
+    def _create_path_planner(self, snake_handler: SnakeHandler) -> AbstractPathPlanner:
+        return HamiltonianPlanner(snake_handler=snake_handler, max_shortcut_fill=self._max_shortcut_fill)
+
+
 class AgentFactory(ABC):
     def __init__(self, window_configuration: WindowConfig, game_configuration: GameConfig):
         self._window_config = window_configuration
@@ -321,6 +831,9 @@ class AbstractAgentFactory(AgentFactory):
         return {
             Agents.UserAgent: UserAgentFactory,
             Agents.AIAgent: AIAgentFactory,
+            Agents.MCTSAgent: MCTSAgentFactory,
+            Agents.PathfindingAgent: PathfindingAgentFactory,
+            Agents.HamiltonianAgent: HamiltonianAgentFactory,
         }
 
 
@@ -332,10 +845,81 @@ class UserAgentFactory(AgentFactory):
 
 
 class AIAgentFactory(AgentFactory):
+    def __init__(
+        self,
+        window_configuration: WindowConfig,
+        game_configuration: GameConfig,
+        headless: bool = False,
+        persist_model: bool = True,
+    ):
+        super().__init__(window_configuration=window_configuration, game_configuration=game_configuration)
+        self._headless = headless
+        self._persist_model = persist_model
+
     def create_agent(self) -> AIAgent:
+        if self._game_config.seed is not None:
+            torch.manual_seed(self._game_config.seed)
         return AIAgent(
+            game_factory=SnakeGameFactory(
+                window_configuration=self._window_config, game_configuration=self._game_config, headless=self._headless
+            ),
+            state_factory=StateFactory(game_configuration=self._game_config),
+            random_generator=create_random_generator(self._game_config.seed, RandomStream.AGENT),
+            options=AIAgentOptions.from_game_config(self._game_config, persist_model=self._persist_model),
+            components=self._create_components(),
+        )
+
+    def _create_components(self) -> AIAgentComponents:
+        game_config = self._game_config
+        return AIAgentComponents(
+            grid_observation_factory=(
+                GridObservationFactory(game_configuration=game_config)
+                if game_config.observation_type == "grid"
+                else None
+            ),
+            event_handler=HeadlessEventHandler() if self._headless else None,
+            metrics_writer=MetricsWriter(game_config.metrics_path) if game_config.metrics_path else None,
+            metrics_server=MetricsServer(game_config.metrics_port) if game_config.metrics_port else None,
+            memory_diagnostics=create_memory_diagnostics(game_config),
+            periodic_evaluation=create_periodic_evaluation(self._window_config, game_config),
+        )
+
+
+class MCTSAgentFactory(AgentFactory):
+    def create_agent(self) -> MCTSAgent:
+        if self._game_config.seed is not None:
+            torch.manual_seed(self._game_config.seed)
+        return MCTSAgent(
             game_factory=SnakeGameFactory(
                 window_configuration=self._window_config, game_configuration=self._game_config
             ),
+            search_game_factory=SnakeGameFactory(
+                window_configuration=self._window_config, game_configuration=self._game_config, headless=True
+            ),
             state_factory=StateFactory(game_configuration=self._game_config),
+            simulations=self._game_config.mcts_simulations,
+            exploration=self._game_config.mcts_exploration,
+            discount=self._game_config.mcts_discount,
+            frame_stack_depth=self._game_config.frame_stack_depth,
+            hidden_layer_size=self._game_config.hidden_layer_size,
+        )
+
+
+class PathfindingAgentFactory(AgentFactory):
+    def create_agent(self) -> PathfindingAgent:
+        return PathfindingAgent(
+            game_factory=SnakeGameFactory(
+                window_configuration=self._window_config, game_configuration=self._game_config
+            ),
+            max_expansions=self._game_config.pathfinding_max_expansions,
+        )
+
+
+class HamiltonianAgentFactory(AgentFactory):
+    def create_agent(self) -> HamiltonianAgent:
+        return HamiltonianAgent(
+            game_factory=SnakeGameFactory(
+                window_configuration=self._window_config, game_configuration=self._game_config
+            ),
+            max_shortcut_fill=self._game_config.hamiltonian_max_shortcut_fill,
         )
@@ -0,0 +1,73 @@
+from snake.game_objects.objects import AbstractSnakeListener, Point, SnakeHandler
+
+
+def popcount(board: int) -> int:
+    return bin(board).count("1")
+
+
+class SnakeBitboard(AbstractSnakeListener):
+    # Bit y * width + x of an int stands for one cell, so a whole set of cells moves one step with a shift and a
+    # column mask that stops bits from wrapping into the neighbouring row. The occupied board is updated by the snake
+    # listener calls, one bit per call.
+    def __init__(self, snake_handler: SnakeHandler):
+        self._snake_handler = snake_handler
+        self._grid = snake_handler.grid
+        self._full = (1 << self._grid.size) - 1
+        first_column = sum(1 << (y * self._grid.width) for y in range(self._grid.height))
+        self._not_first_column = self._full & ~first_column
+        self._not_last_column = self._full & ~(first_column << (self._grid.width - 1))
+        self._occupied = 0
+        self._version = 0
+
+        snake_handler.add_listener(self)
+        self.snake_reset()
+
+    @property
+    def occupied(self) -> int:
+        return self._occupied
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def snake_extended(self, old_head: Point, new_head: Point) -> None:
+        self._occupied |= self.to_bit(new_head)
+        self._version += 1
+
+    def tail_removed(self, tail: Point) -> None:
+        self._occupied &= ~self.to_bit(tail)
+        self._version += 1
+
+    def snake_reset(self) -> None:
+        self._occupied = 0
+        for point in self._snake_handler.get_snake():
+            self._occupied |= self.to_bit(point)
+        self._version += 1
+
+    def to_bit(self, point: Point) -> int:
+        return 1 << self._grid.to_cell(point) if self._grid.contains(point) else 0
+
+    def expand(self, board: int) -> int:
+        width = self._grid.width
+        return (
+            ((board << 1) & self._not_first_column)
+            | ((board >> 1) & self._not_last_column)
+            | ((board << width) & self._full)
+            | (board >> width)
+        )
+
+    def flood_fill(self, start: int, free: int, limit: int) -> int:
+        # Grows the reached cells by one step per iteration and stops early once limit cells are reached.
+        reached = frontier = start & free
+        while frontier and popcount(reached) < limit:
+            frontier = self.expand(frontier) & free & ~reached
+            reached |= frontier
+        return reached
+
+    def count_reachable_cells(self, start: Point, limit: int) -> int:
+        # Free cells reachable after the head moved to start; the tail moves away in the same step.
+        free = (self._full & ~self._occupied) | self.to_bit(self._snake_handler.body[-1])
+        start_bit = self.to_bit(start)
+        if not start_bit & free:
+            return 0
+        return min(popcount(self.flood_fill(start_bit, free, limit)), limit)
@@ -1,38 +1,69 @@
-from snake.config import GameConfig, WindowConfig
-from snake.game_objects.objects import Point, SnakeHandler
+from typing import Sequence, Union, cast
+
+import numpy as np
+
+from snake.game_objects.objects import Grid, Point, SnakeHandler
+
+Points = Union[Point, Sequence[Point], np.ndarray]
+
+
+def as_point_array(points: Points) -> np.ndarray:
+    return np.asarray(points, dtype=np.int64).reshape(-1, 2)
 
 
 class CollisionChecker:
-    def __init__(self, window_config: WindowConfig, game_config: GameConfig, snake_handler: SnakeHandler):
-        self._window_config = window_config
-        self._game_config = game_config
+    def __init__(self, grid: Grid, snake_handler: SnakeHandler):
+        self._grid = grid
         self._snake_handler = snake_handler
 
     def collision_detected(self) -> bool:
-        snake_head = self._snake_handler.head
-        return self._snake_bites_itself() or self._collision_between_point_and_window_boundary(point=snake_head)
-
-    def _snake_bites_itself(self) -> bool:
-        return self._snake_handler.snake_bites_itself()
-
-    def _collision_between_point_and_window_boundary(self, point: Point) -> bool:
-        return (
-            self.point_top_collision(point=point)
-            or self.point_bottem_collision(point=point)
-            or self.point_left_boundary_collision(point=point)
-            or self.point_right_boundary_collision(point=point)
+        head = self._snake_handler.head
+        return not self._grid.contains(head) or self._snake_handler.snake_bites_itself()
+
+    def collisions(self, points: Points) -> np.ndarray:
+        points = as_point_array(points)
+        return cast(np.ndarray, self.wall_collisions(points) | self.body_collisions(points))
+
+    def wall_collisions(self, points: Points) -> np.ndarray:
+        points = as_point_array(points)
+        return cast(
+            np.ndarray,
+            self.top_collisions(points)
+            | self.bottom_collisions(points)
+            | self.left_boundary_collisions(points)
+            | self.right_boundary_collisions(points),
         )
 
+    def body_collisions(self, points: Points) -> np.ndarray:
+        points = as_point_array(points)
+        inside = ~self.wall_collisions(points)
+        cells = np.where(inside, points[:, 1] * self._grid.width + points[:, 0], 0)
+        return cast(np.ndarray, inside & (self._snake_handler.occupancy[cells] > 0))
+
     @staticmethod
-    def point_top_collision(point: Point) -> bool:
-        return point.y < 0
+    def top_collisions(points: Points) -> np.ndarray:
+        return as_point_array(points)[:, 1] < 0
 
-    def point_bottem_collision(self, point: Point) -> bool:
-        return point.y > self._window_config.height - self._game_config.outer_block_size
+    def bottom_collisions(self, points: Points) -> np.ndarray:
+        return as_point_array(points)[:, 1] >= self._grid.height
 
     @staticmethod
-    def point_left_boundary_collision(point: Point) -> bool:
-        return point.x < 0
+    def left_boundary_collisions(points: Points) -> np.ndarray:
+        return as_point_array(points)[:, 0] < 0
+
+    def right_boundary_collisions(self, points: Points) -> np.ndarray:
+        return as_point_array(points)[:, 0] >= self._grid.width
+
+    @classmethod
+    def point_top_collision(cls, point: Point) -> bool:
+        return bool(cls.top_collisions(point)[0])
+
+    def point_bottem_collision(self, point: Point) -> bool:
+        return bool(self.bottom_collisions(point)[0])
+
+    @classmethod
+    def point_left_boundary_collision(cls, point: Point) -> bool:
+        return bool(cls.left_boundary_collisions(point)[0])
 
     def point_right_boundary_collision(self, point: Point) -> bool:
-        return point.x > self._window_config.width - self._game_config.outer_block_size
+        return bool(self.right_boundary_collisions(point)[0])
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple, cast
+from typing import List, Optional, Tuple, cast
 
 from dynaconf import Validator
 
@@ -57,7 +57,61 @@ class GameConfig:
         "inner_block_color", is_type_of=str, is_in=RGBColorCode.get_color_names(), default="LIGHTBLUE"
     )
     FOOD_COLOR_VALIDATOR = Validator("food_color", is_type_of=str, is_in=RGBColorCode.get_color_names(), default="RED")
-    AGENT_TYPE_VALIDATOR = Validator("agent_type", is_type_of=str, is_in=["UserAgent", "AIAgent"], default="AIAgent")
+    AGENT_TYPE_VALIDATOR = Validator(
+        "agent_type",
+        is_type_of=str,
+        is_in=["UserAgent", "AIAgent", "MCTSAgent", "PathfindingAgent", "HamiltonianAgent"],
+        default="AIAgent",
+    )
+    SEED_VALIDATOR = Validator("seed", is_type_of=int, gte=0)
+    SCENARIO_VALIDATOR = Validator("scenario", is_type_of=bool, default=False)
+    # Without a seed the scenario food positions come from fresh OS entropy and could not be repeated.
+    SCENARIO_SEED_VALIDATOR = Validator("seed", must_exist=True, when=Validator("scenario", eq=True))
+    RENDERER_VALIDATOR = Validator("renderer", is_type_of=str, is_in=["GameUI", "FramebufferGameUI"], default="GameUI")
+    DECOUPLED_RENDERING_VALIDATOR = Validator("decoupled_rendering", is_type_of=bool, default=False)
+    SPEED_MODE_VALIDATOR = Validator("speed_mode", is_type_of=str, is_in=["WATCH", "FAST", "DARK"], default="WATCH")
+    FRAME_SKIP_VALIDATOR = Validator("frame_skip", is_type_of=int, gt=0, default=8)
+    OBSERVATION_TYPE_VALIDATOR = Validator(
+        "observation_type", is_type_of=str, is_in=["features", "grid"], default="features"
+    )
+    OBSERVATION_BODY_AGE_VALIDATOR = Validator("observation_body_age", is_type_of=bool, default=False)
+    OBSERVATION_DOWNSAMPLING_VALIDATOR = Validator("observation_downsampling", is_type_of=int, gt=0, default=1)
+    FRAME_STACK_DEPTH_VALIDATOR = Validator("frame_stack_depth", is_type_of=int, gt=0, default=2)
+    PROFILING_VALIDATOR = Validator("profiling", is_type_of=bool, default=False)
+    PROFILING_WINDOW_VALIDATOR = Validator("profiling_window", is_type_of=int, gt=0, default=10_000)
+    PROFILING_TRACE_START_VALIDATOR = Validator("profiling_trace_start", is_type_of=int, gte=0, default=1_000)
+    PROFILING_TRACE_STEPS_VALIDATOR = Validator("profiling_trace_steps", is_type_of=int, gte=0, default=100)
+    PROFILING_TRACE_PATH_VALIDATOR = Validator("profiling_trace_path", is_type_of=str, default="step_trace.json")
+    METRICS_PATH_VALIDATOR = Validator("metrics_path", is_type_of=str)
+    METRICS_PORT_VALIDATOR = Validator("metrics_port", is_type_of=int, gte=0, lte=65_535)
+    LOOP_DETECTION_VALIDATOR = Validator("loop_detection", is_type_of=bool, default=False)
+    LOOP_PENALTY_VALIDATOR = Validator("loop_penalty", is_type_of=int, default=-10)
+    MCTS_SIMULATIONS_VALIDATOR = Validator("mcts_simulations", is_type_of=int, gt=0, default=50)
+    MCTS_EXPLORATION_VALIDATOR = Validator("mcts_exploration", is_type_of=float, gte=0, default=1.5)
+    MCTS_DISCOUNT_VALIDATOR = Validator("mcts_discount", is_type_of=float, gte=0, lte=1, default=0.9)
+    PATHFINDING_MAX_EXPANSIONS_VALIDATOR = Validator("pathfinding_max_expansions", is_type_of=int, gt=0, default=10_000)
+    HAMILTONIAN_MAX_SHORTCUT_FILL_VALIDATOR = Validator(
+        "hamiltonian_max_shortcut_fill", is_type_of=float, gte=0, lte=1, default=0.5
+    )
+    REACHABLE_AREA_FEATURES_VALIDATOR = Validator("reachable_area_features", is_type_of=bool, default=False)
+    REACHABLE_AREA_SAFETY_VALIDATOR = Validator("reachable_area_safety", is_type_of=bool, default=False)
+    EVALUATION_INTERVAL_VALIDATOR = Validator("evaluation_interval", is_type_of=int, gt=0)
+    EVALUATION_EPISODES_VALIDATOR = Validator("evaluation_episodes", is_type_of=int, gt=0, default=20)
+    EVALUATION_SEED_VALIDATOR = Validator("evaluation_seed", is_type_of=int, gte=0, default=0)
+    LEARNING_RATE_VALIDATOR = Validator("learning_rate", is_type_of=float, gt=0, default=0.001)
+    DISCOUNT_RATE_VALIDATOR = Validator("discount_rate", is_type_of=float, gte=0, lte=1, default=0.9)
+    HIDDEN_LAYER_SIZE_VALIDATOR = Validator("hidden_layer_size", is_type_of=int, gt=0, default=256)
+    BATCH_SIZE_VALIDATOR = Validator("batch_size", is_type_of=int, gt=0, default=1_000)
+    EPSILON_START_VALIDATOR = Validator("epsilon_start", is_type_of=int, gte=0, default=80)
+    EPSILON_DECAY_VALIDATOR = Validator("epsilon_decay", is_type_of=float, gte=0, default=1.0)
+    MEMORY_DIAGNOSTICS_VALIDATOR = Validator("memory_diagnostics", is_type_of=bool, default=False)
+    MEMORY_DIAGNOSTICS_INTERVAL_VALIDATOR = Validator("memory_diagnostics_interval", is_type_of=int, gt=0, default=100)
+    MEMORY_DIAGNOSTICS_TOP_ALLOCATIONS_VALIDATOR = Validator(
+        "memory_diagnostics_top_allocations", is_type_of=int, gt=0, default=10
+    )
+    MEMORY_DIAGNOSTICS_TRACEMALLOC_FRAMES_VALIDATOR = Validator(
+        "memory_diagnostics_tracemalloc_frames", is_type_of=int, gte=0, default=1
+    )
 
     frame_rate: int
     start_length: int
@@ -67,6 +121,45 @@ class GameConfig:
     inner_block_color: Tuple[int, int, int]
     food_color: Tuple[int, int, int]
     agent_type: str
+    seed: Optional[int] = None
+    scenario: bool = False
+    renderer: str = "GameUI"
+    decoupled_rendering: bool = False
+    speed_mode: str = "WATCH"
+    frame_skip: int = 8
+    observation_type: str = "features"
+    observation_body_age: bool = False
+    observation_downsampling: int = 1
+    frame_stack_depth: int = 2
+    profiling: bool = False
+    profiling_window: int = 10_000
+    profiling_trace_start: int = 1_000
+    profiling_trace_steps: int = 100
+    profiling_trace_path: str = "step_trace.json"
+    metrics_path: Optional[str] = None
+    metrics_port: Optional[int] = None
+    loop_detection: bool = False
+    loop_penalty: int = -10
+    mcts_simulations: int = 50
+    mcts_exploration: float = 1.5
+    mcts_discount: float = 0.9
+    pathfinding_max_expansions: int = 10_000
+    hamiltonian_max_shortcut_fill: float = 0.5
+    reachable_area_features: bool = False
+    reachable_area_safety: bool = False
+    evaluation_interval: Optional[int] = None
+    evaluation_episodes: int = 20
+    evaluation_seed: int = 0
+    learning_rate: float = 0.001
+    discount_rate: float = 0.9
+    hidden_layer_size: int = 256
+    batch_size: int = 1_000
+    epsilon_start: int = 80
+    epsilon_decay: float = 1.0
+    memory_diagnostics: bool = False
+    memory_diagnostics_interval: int = 100
+    memory_diagnostics_top_allocations: int = 10
+    memory_diagnostics_tracemalloc_frames: int = 1
 
     @staticmethod
     def from_dynaconf() -> GameConfig:
@@ -79,6 +172,45 @@ class GameConfig:
             inner_block_color=cast(Tuple[int, int, int], RGBColorCode[settings.get("inner_block_color")].value),
             food_color=cast(Tuple[int, int, int], RGBColorCode[settings.get("food_color")].value),
             agent_type=settings.get("agent_type"),
+            seed=settings.get("seed"),
+            scenario=settings.get("scenario", False),
+            renderer=settings.get("renderer", "GameUI"),
+            decoupled_rendering=settings.get("decoupled_rendering", False),
+            speed_mode=settings.get("speed_mode", "WATCH"),
+            frame_skip=settings.get("frame_skip", 8),
+            observation_type=settings.get("observation_type", "features"),
+            observation_body_age=settings.get("observation_body_age", False),
+            observation_downsampling=settings.get("observation_downsampling", 1),
+            frame_stack_depth=settings.get("frame_stack_depth", 2),
+            profiling=settings.get("profiling", False),
+            profiling_window=settings.get("profiling_window", 10_000),
+            profiling_trace_start=settings.get("profiling_trace_start", 1_000),
+            profiling_trace_steps=settings.get("profiling_trace_steps", 100),
+            profiling_trace_path=settings.get("profiling_trace_path", "step_trace.json"),
+            metrics_path=settings.get("metrics_path"),
+            metrics_port=settings.get("metrics_port"),
+            loop_detection=settings.get("loop_detection", False),
+            loop_penalty=settings.get("loop_penalty", -10),
+            mcts_simulations=settings.get("mcts_simulations", 50),
+            mcts_exploration=settings.get("mcts_exploration", 1.5),
+            mcts_discount=settings.get("mcts_discount", 0.9),
+            pathfinding_max_expansions=settings.get("pathfinding_max_expansions", 10_000),
+            hamiltonian_max_shortcut_fill=settings.get("hamiltonian_max_shortcut_fill", 0.5),
+            reachable_area_features=settings.get("reachable_area_features", False),
+            reachable_area_safety=settings.get("reachable_area_safety", False),
+            evaluation_interval=settings.get("evaluation_interval"),
+            evaluation_episodes=settings.get("evaluation_episodes", 20),
+            evaluation_seed=settings.get("evaluation_seed", 0),
+            learning_rate=settings.get("learning_rate", 0.001),
+            discount_rate=settings.get("discount_rate", 0.9),
+            hidden_layer_size=settings.get("hidden_layer_size", 256),
+            batch_size=settings.get("batch_size", 1_000),
+            epsilon_start=settings.get("epsilon_start", 80),
+            epsilon_decay=settings.get("epsilon_decay", 1.0),
+            memory_diagnostics=settings.get("memory_diagnostics", False),
+            memory_diagnostics_interval=settings.get("memory_diagnostics_interval", 100),
+            memory_diagnostics_top_allocations=settings.get("memory_diagnostics_top_allocations", 10),
+            memory_diagnostics_tracemalloc_frames=settings.get("memory_diagnostics_tracemalloc_frames", 1),
         )
 
     @classmethod
@@ -92,4 +224,44 @@ class GameConfig:
             cls.INNER_BLOCK_COLOR_VALIDATOR,
             cls.FOOD_COLOR_VALIDATOR,
             cls.AGENT_TYPE_VALIDATOR,
+            cls.SEED_VALIDATOR,
+            cls.SCENARIO_VALIDATOR,
+            cls.SCENARIO_SEED_VALIDATOR,
+            cls.RENDERER_VALIDATOR,
+            cls.DECOUPLED_RENDERING_VALIDATOR,
+            cls.SPEED_MODE_VALIDATOR,
+            cls.FRAME_SKIP_VALIDATOR,
+            cls.OBSERVATION_TYPE_VALIDATOR,
+            cls.OBSERVATION_BODY_AGE_VALIDATOR,
+            cls.OBSERVATION_DOWNSAMPLING_VALIDATOR,
+            cls.FRAME_STACK_DEPTH_VALIDATOR,
+            cls.PROFILING_VALIDATOR,
+            cls.PROFILING_WINDOW_VALIDATOR,
+            cls.PROFILING_TRACE_START_VALIDATOR,
+            cls.PROFILING_TRACE_STEPS_VALIDATOR,
+            cls.PROFILING_TRACE_PATH_VALIDATOR,
+            cls.METRICS_PATH_VALIDATOR,
+            cls.METRICS_PORT_VALIDATOR,
+            cls.LOOP_DETECTION_VALIDATOR,
+            cls.LOOP_PENALTY_VALIDATOR,
+            cls.MCTS_SIMULATIONS_VALIDATOR,
+            cls.MCTS_EXPLORATION_VALIDATOR,
+            cls.MCTS_DISCOUNT_VALIDATOR,
+            cls.PATHFINDING_MAX_EXPANSIONS_VALIDATOR,
+            cls.HAMILTONIAN_MAX_SHORTCUT_FILL_VALIDATOR,
+            cls.REACHABLE_AREA_FEATURES_VALIDATOR,
+            cls.REACHABLE_AREA_SAFETY_VALIDATOR,
+            cls.EVALUATION_INTERVAL_VALIDATOR,
+            cls.EVALUATION_EPISODES_VALIDATOR,
+            cls.EVALUATION_SEED_VALIDATOR,
+            cls.LEARNING_RATE_VALIDATOR,
+            cls.DISCOUNT_RATE_VALIDATOR,
+            cls.HIDDEN_LAYER_SIZE_VALIDATOR,
+            cls.BATCH_SIZE_VALIDATOR,
+            cls.EPSILON_START_VALIDATOR,
+            cls.EPSILON_DECAY_VALIDATOR,
+            cls.MEMORY_DIAGNOSTICS_VALIDATOR,
+            cls.MEMORY_DIAGNOSTICS_INTERVAL_VALIDATOR,
+            cls.MEMORY_DIAGNOSTICS_TOP_ALLOCATIONS_VALIDATOR,
+            cls.MEMORY_DIAGNOSTICS_TRACEMALLOC_FRAMES_VALIDATOR,
         ]
@@ -0,0 +1,313 @@
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from itertools import repeat
+from pathlib import Path
+from typing import Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union, cast
+
+import numpy as np
+import torch
+
+from snake.config import GameConfig, WindowConfig
+from snake.game import SnakeGameFactory
+from snake.mcts import turn
+from snake.model import ConvQNet, LinearQNet, QNet
+from snake.observations import GridObservation, GridObservationFactory
+from snake.state import StateFactory
+from snake.validators import ConfigValidator
+
+QUANTILES = (0.1, 0.5, 0.9)
+
+# A saved model file or the state dict of a model in memory.
+Checkpoint = Union[Path, Dict[str, torch.Tensor]]
+
+
+@dataclass(frozen=True)
+class EpisodeOutcome:
+    episode: int
+    score: int
+    steps: int
+
+
+@dataclass(frozen=True)
+class EvaluationReport:
+    # pylint: disable=too-many-instance-attributes
+    episodes: int
+    score_mean: float
+    score_quantiles: Dict[str, float]
+    score_max: int
+    episode_length_mean: float
+    steps_per_second: float
+    elapsed_seconds: float
+    scores: List[int]
+
+    @classmethod
+    def from_outcomes(cls, outcomes: Sequence[EpisodeOutcome], elapsed_seconds: float) -> "EvaluationReport":
+        scores = np.array([outcome.score for outcome in outcomes])
+        steps = np.array([outcome.steps for outcome in outcomes])
+        return cls(
+            episodes=len(outcomes),
+            score_mean=float(scores.mean()),
+            score_quantiles={
+                f"p{round(quantile * 100)}": float(np.quantile(scores, quantile)) for quantile in QUANTILES
+            },
+            score_max=int(scores.max()),
+            episode_length_mean=float(steps.mean()),
+            steps_per_second=float(steps.sum() / elapsed_seconds) if elapsed_seconds > 0 else 0.0,
+            elapsed_seconds=elapsed_seconds,
+            scores=scores.tolist(),
+        )
+
+    def get_summary(self) -> str:
+        quantiles = " ".join(f"{name} {value:.1f}" for name, value in self.score_quantiles.items())
+        return "\n".join(
+            [
+                f"episodes             {self.episodes}",
+                f"score mean           {self.score_mean:.2f}",
+                f"score quantiles      {quantiles}",
+                f"score max            {self.score_max}",
+                f"episode length mean  {self.episode_length_mean:.1f}",
+                f"steps/s              {self.steps_per_second:.0f}",
+                f"elapsed              {self.elapsed_seconds:.2f} s",
+            ]
+        )
+
+
+class GreedyEvaluator:
+    # Plays headless episodes with the best action of the model: no exploration, no replay memory and no gradients.
+    # The observations are built like in AIAgent, so the same configuration has to be used as for training.
+    def __init__(self, window_config: WindowConfig, game_config: GameConfig, checkpoint: Optional[Checkpoint]):
+        self._game_config = game_config
+        self._game = SnakeGameFactory(
+            window_configuration=window_config, game_configuration=game_config, headless=True
+        ).create_snake_game()
+        self._state = StateFactory(game_configuration=game_config).create_state_for_game(game=self._game)
+        self._grid_observation: Optional[GridObservation] = None
+        if game_config.observation_type == "grid":
+            self._grid_observation = GridObservationFactory(game_configuration=game_config).create_grid_observation(
+                game=self._game
+            )
+        self._frames: Deque[np.ndarray] = deque(maxlen=game_config.frame_stack_depth)
+        self._model = load_checkpoint(checkpoint, self._create_model())
+        self._model.eval()
+
+    def _create_model(self) -> QNet:
+        frame = self._observe_frame()
+        stacked_shape = (self._game_config.frame_stack_depth * frame.shape[0], *frame.shape[1:])
+        if self._grid_observation:
+            return ConvQNet(
+                input_shape=cast(Tuple[int, int, int], stacked_shape),
+                hidden_layer_size=self._game_config.hidden_layer_size,
+                load_saved_model=False,
+            )
+        return LinearQNet(
+            input_feature_size=stacked_shape[0],
+            hidden_layer_size=self._game_config.hidden_layer_size,
+            output_feature_size=3,
+            load_saved_model=False,
+        )
+
+    def _observe_frame(self) -> np.ndarray:
+        if self._grid_observation:
+            return np.array(self._grid_observation.observe(), dtype=np.float32)
+        return np.asarray(self._state.calculate_state_from_game(), dtype=np.float32)
+
+    def play_episode(self, episode: int) -> EpisodeOutcome:
+        game = self._game
+        game.reset(episode=episode)
+        self._frames.extend([self._observe_frame()] * self._game_config.frame_stack_depth)
+        steps = 0
+        with torch.no_grad():
+            while not game.is_over():
+                q_values = self._model(torch.as_tensor(np.concatenate(self._frames)))
+                game.update_direction(turn(game.get_current_direction(), self._choose_move(q_values)))
+                game.run()
+                steps += 1
+                self._frames.append(self._observe_frame())
+        return EpisodeOutcome(episode=episode, score=game.get_score(), steps=steps)
+
+    def _choose_move(self, q_values: torch.Tensor) -> int:
+        move = int(torch.argmax(q_values).item())
+        if not self._game_config.reachable_area_safety:
+            return move
+        safe_moves = self._state.calculate_safe_moves()
+        if safe_moves[move] or not any(safe_moves):
+            return move
+        return max(
+            (candidate for candidate, is_safe in enumerate(safe_moves) if is_safe),
+            key=lambda candidate: float(q_values[candidate]),
+        )
+
+
+def load_checkpoint(checkpoint: Optional[Checkpoint], model: QNet) -> QNet:
+    # Without a checkpoint, the file that training saves for this network is evaluated.
+    if checkpoint is None:
+        checkpoint = Path(model.model_file_path)
+    name = checkpoint if isinstance(checkpoint, Path) else "The model snapshot"
+    try:
+        model.load_state_dict(torch.load(checkpoint) if isinstance(checkpoint, Path) else checkpoint)
+    except RuntimeError as error:
+        raise ValueError(f"{name} does not match a {type(model).__name__} for the configured observations.") from error
+    return model
+
+
+def evaluate_episodes(
+    window_config: WindowConfig, game_config: GameConfig, checkpoint: Optional[Checkpoint], episodes: Sequence[int]
+) -> List[EpisodeOutcome]:
+    evaluator = GreedyEvaluator(window_config=window_config, game_config=game_config, checkpoint=checkpoint)
+    return [evaluator.play_episode(episode) for episode in episodes]
+
+
+def run_evaluation(
+    window_config: WindowConfig,
+    game_config: GameConfig,
+    checkpoint: Optional[Checkpoint],
+    *,
+    episodes: int,
+    workers: int,
+    seed: int,
+) -> EvaluationReport:
+    # pylint: disable=too-many-arguments
+    # Food positions only depend on seed and episode number, so the report does not depend on the number of workers.
+    game_config = replace(game_config, frame_rate=0, seed=seed, scenario=True, profiling=False)
+    workers = max(1, min(workers, episodes))
+    started_at = time.perf_counter()
+    if workers == 1:
+        outcomes = evaluate_episodes(window_config, game_config, checkpoint, range(episodes))
+    else:
+        # Every worker plays its share of the episodes on one thread, the processes are the parallelism.
+        with ProcessPoolExecutor(max_workers=workers, initializer=torch.set_num_threads, initargs=(1,)) as executor:
+            chunks = executor.map(
+                evaluate_episodes,
+                repeat(window_config),
+                repeat(game_config),
+                repeat(checkpoint),
+                [range(worker, episodes, workers) for worker in range(workers)],
+            )
+            outcomes = [outcome for chunk in chunks for outcome in chunk]
+    outcomes.sort(key=lambda outcome: outcome.episode)
+    return EvaluationReport.from_outcomes(outcomes, elapsed_seconds=time.perf_counter() - started_at)
+
+
+class EvaluationResult(NamedTuple):
+    games: int
+    report: EvaluationReport
+    state_dict: Dict[str, torch.Tensor]
+    is_best: bool
+
+
+class PeriodicEvaluation:
+    # pylint: disable=too-many-instance-attributes
+    # Snapshots of the weights are evaluated in one spawned background process on a single thread, so training only
+    # pays for copying the weights. A snapshot that comes due while the previous one is still playing is skipped.
+    def __init__(
+        self, window_config: WindowConfig, game_config: GameConfig, interval_games: int, episodes: int, seed: int
+    ):
+        # pylint: disable=too-many-arguments
+        self._window_config = window_config
+        self._game_config = game_config
+        self._interval_games = interval_games
+        self._episodes = episodes
+        self._seed = seed
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Optional[Tuple[int, Dict[str, torch.Tensor], Future]] = None
+        self._best_score_mean = -math.inf
+
+    def should_evaluate(self, games: int) -> bool:
+        return games % self._interval_games == 0 and self._pending is None
+
+    def submit(self, games: int, model: QNet) -> None:
+        state_dict = {name: tensor.detach().clone() for name, tensor in model.state_dict().items()}
+        if self._executor is None:
+            # Spawned instead of forked, the training process runs threads that must not be copied mid-operation.
+            self._executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=torch.set_num_threads,
+                initargs=(1,),
+            )
+        future = self._executor.submit(
+            run_evaluation,
+            self._window_config,
+            self._game_config,
+            state_dict,
+            episodes=self._episodes,
+            workers=1,
+            seed=self._seed,
+        )
+        self._pending = (games, state_dict, future)
+
+    def poll(self) -> Optional[EvaluationResult]:
+        if self._pending is None or not self._pending[2].done():
+            return None
+        games, state_dict, future = self._pending
+        self._pending = None
+        try:
+            report = future.result()
+        except Exception as error:  # pylint: disable=broad-except
+            # A failed evaluation must not end the training; a new worker is started for the next snapshot.
+            print(f"Evaluation after {games} games failed: {error!r}", file=sys.stderr)
+            self.close()
+            return None
+        is_best = report.score_mean > self._best_score_mean
+        if is_best:
+            self._best_score_mean = report.score_mean
+        return EvaluationResult(games=games, report=report, state_dict=state_dict, is_best=is_best)
+
+    def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def create_periodic_evaluation(window_config: WindowConfig, game_config: GameConfig) -> Optional[PeriodicEvaluation]:
+    if not game_config.evaluation_interval:
+        return None
+    return PeriodicEvaluation(
+        window_config=window_config,
+        game_config=game_config,
+        interval_games=game_config.evaluation_interval,
+        episodes=game_config.evaluation_episodes,
+        seed=game_config.evaluation_seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Evaluate a saved model greedily on seeded headless games.")
+    parser.add_argument(
+        "checkpoint", type=Path, nargs="?", help="defaults to the model file of the configured network in model/"
+    )
+    parser.add_argument("--episodes", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="also write the report as JSON")
+    parser.add_argument("--min-score-mean", type=float, help="exit with an error below this mean score")
+    args = parser.parse_args()
+
+    ConfigValidator.register_validator(*WindowConfig.get_all_validators(), *GameConfig.get_all_validators())
+    ConfigValidator.validate_all()
+    report = run_evaluation(
+        window_config=WindowConfig.from_dynaconf(),
+        game_config=GameConfig.from_dynaconf(),
+        checkpoint=args.checkpoint,
+        episodes=args.episodes,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    print(report.get_summary())
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(asdict(report), indent=2), encoding="utf-8")
+    if args.min_score_mean is not None and report.score_mean < args.min_score_mean:
+        sys.exit(f"Mean score {report.score_mean:.2f} is below {args.min_score_mean:.2f}")
+
+
+if __name__ == "__main__":
+    main()
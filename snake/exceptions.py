@@ -1,2 +1,6 @@
 class FoodPlacedInSnakeException(Exception):
     pass
+
+
+class NoHamiltonianCycleException(Exception):
+    pass
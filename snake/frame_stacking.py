@@ -0,0 +1,96 @@
+from collections import deque
+from typing import Optional, Sequence, Tuple, cast
+
+import numpy as np
+
+INITIAL_FRAME_BUFFER_SIZE = 1_024
+
+
+class FrameBuffer:
+    # The frames are allocated in doubling steps up to the capacity, so a run only holds as many frames as it has seen.
+    # Indices stay below the allocated size until the capacity is reached, and only then wrap around.
+    def __init__(self, capacity: int, frame_shape: Tuple[int, ...], initial_size: int = INITIAL_FRAME_BUFFER_SIZE):
+        self._capacity = capacity
+        self._frames = np.zeros((min(capacity, initial_size), *frame_shape), dtype=np.float32)
+        self._next_index = 0
+
+    @property
+    def frame_shape(self) -> Tuple[int, ...]:
+        return cast(Tuple[int, ...], self._frames.shape[1:])
+
+    @property
+    def allocated_size(self) -> int:
+        return len(self._frames)
+
+    def append(self, frame: np.ndarray) -> int:
+        index = self._next_index
+        if index == len(self._frames) < self._capacity:
+            self._grow()
+        self._frames[index % self._capacity] = frame
+        self._next_index += 1
+        return index
+
+    def _grow(self) -> None:
+        frames = np.zeros((min(2 * len(self._frames), self._capacity), *self.frame_shape), dtype=np.float32)
+        frames[: len(self._frames)] = self._frames
+        self._frames = frames
+
+    def gather(self, indices: np.ndarray, out: np.ndarray) -> np.ndarray:
+        return np.take(self._frames, indices % self._capacity, axis=0, out=out)
+
+
+class LazyFrameStack:
+    __slots__ = ("_frame_buffer", "_indices")
+
+    def __init__(self, frame_buffer: FrameBuffer, indices: Tuple[int, ...]):
+        self._frame_buffer = frame_buffer
+        self._indices = indices
+
+    @property
+    def indices(self) -> Tuple[int, ...]:
+        return self._indices
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        frame_shape = self._frame_buffer.frame_shape
+        return len(self._indices) * frame_shape[0], *frame_shape[1:]
+
+    def materialize(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if out is None:
+            out = np.empty(self.shape, dtype=np.float32)
+        frames = out.reshape((len(self._indices), *self._frame_buffer.frame_shape))
+        self._frame_buffer.gather(np.asarray(self._indices), out=frames)
+        return out
+
+    def __array__(self, dtype=None) -> np.ndarray:
+        return self.materialize().astype(dtype or np.float32, copy=False)
+
+
+class FrameStacker:
+    def __init__(self, frame_shape: Tuple[int, ...], depth: int, capacity: int):
+        self._frame_buffer = FrameBuffer(capacity=capacity, frame_shape=frame_shape)
+        self._depth = depth
+        self._recent_indices: deque = deque(maxlen=depth)
+
+    @property
+    def stacked_shape(self) -> Tuple[int, ...]:
+        frame_shape = self._frame_buffer.frame_shape
+        return self._depth * frame_shape[0], *frame_shape[1:]
+
+    def reset(self, frame: np.ndarray) -> LazyFrameStack:
+        index = self._frame_buffer.append(frame)
+        self._recent_indices.extend([index] * self._depth)
+        return self.current()
+
+    def push(self, frame: np.ndarray) -> LazyFrameStack:
+        self._recent_indices.append(self._frame_buffer.append(frame))
+        return self.current()
+
+    def current(self) -> LazyFrameStack:
+        return LazyFrameStack(frame_buffer=self._frame_buffer, indices=tuple(self._recent_indices))
+
+    def materialize_batch(self, stacks: Sequence[LazyFrameStack], out: np.ndarray) -> np.ndarray:
+        indices = np.array([stack.indices for stack in stacks], dtype=np.int64)
+        frames = out[: len(stacks)].reshape((indices.size, *self._frame_buffer.frame_shape))
+        self._frame_buffer.gather(indices.ravel(), out=frames)
+        return out[: len(stacks)]
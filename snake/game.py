@@ -1,31 +1,55 @@
-from typing import List, Optional
+from typing import List, NamedTuple, Optional, Tuple
 
 from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from snake.collision_checker import CollisionChecker
 from snake.config import GameConfig, WindowConfig
 from snake.exceptions import FoodPlacedInSnakeException
-from snake.game_controls import Direction
+from snake.game_controls import Direction, SpeedMode
 from snake.game_objects.factories import (
     FoodFactory,
     FoodHandlerFactory,
+    GridFactory,
     SnakeFactory,
     SnakeHandlerFactory,
 )
 from snake.game_objects.objects import FoodHandler, Point, SnakeHandler
+from snake.profiler import AbstractStepProfiler, create_step_profiler
 from snake.publisher import (
     AbstractPublisher,
     AbstractSubscriber,
     Publisher,
     PublisherEvents,
 )
-from snake.pygame_interface.game_ui import GameUI
+from snake.pygame_interface.game_ui import (
+    AbstractGameUI,
+    FramebufferGameUI,
+    GameUI,
+    HeadlessGameUI,
+)
+from snake.pygame_interface.render_loop import DecoupledGameUI
+from snake.random_generators import RandomStream, create_random_generator
+from snake.speed_governor import SpeedGovernor
+from snake.zobrist import LoopDetector, ZobristHash
 
 MAX_GAME_ITERATION = 100
+FOOD_REWARD = 10
+COLLISION_REWARD = -10
+
+
+class SnakeGameState(NamedTuple):
+    head: Point
+    body: Tuple[Point, ...]
+    food_cell: int
+    direction: Direction
+    score: int
+    game_over: bool
+    game_iteration_count: int
 
 
 class SnakeGame:
     # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-public-methods
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -34,32 +58,77 @@ class SnakeGame:
         snake_handler: SnakeHandler,
         food_handler: FoodHandler,
         publisher: AbstractPublisher,
+        *,
+        headless: bool = False,
     ):
         self._snake_handler = snake_handler
-        self._direction = Direction.RIGHT
-        self._score = 0
         self._food_handler = food_handler
-        self._food_handler.move_food_to_random_position()
-        self._collision_checker = CollisionChecker(
-            window_config=window_config, game_config=game_config, snake_handler=snake_handler
+        self._seed = game_config.seed
+        self._scenario = game_config.scenario
+        self._episode = -1
+        self._collision_checker = CollisionChecker(grid=snake_handler.grid, snake_handler=snake_handler)
+        self._zobrist_hash = ZobristHash(
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+            random_generator=create_random_generator(self._seed, RandomStream.ZOBRIST),
         )
+        self._loop_detection = game_config.loop_detection
+        self._loop_detector = LoopDetector()
+
+        self._ui = self._create_ui(window_config, game_config, headless)
+        self._speed_governor = SpeedGovernor(game_config)
+        self._profiler = create_step_profiler(game_config)
+        self._publisher = publisher
+        self._step_events: List[PublisherEvents] = []
+        self.reset()
 
-        self._ui = GameUI(
+    def _create_ui(self, window_config: WindowConfig, game_config: GameConfig, headless: bool) -> AbstractGameUI:
+        if headless:
+            return HeadlessGameUI()
+        ui_types = {"GameUI": GameUI, "FramebufferGameUI": FramebufferGameUI}
+        game_ui = ui_types[game_config.renderer](
             window_config=window_config,
             game_config=game_config,
-            snake_handler=snake_handler,
-            food_handler=food_handler,
+            snake_handler=self._snake_handler,
+            food_handler=self._food_handler,
         )
+        if game_config.decoupled_rendering:
+            return DecoupledGameUI(game_ui=game_ui, snake_handler=self._snake_handler, food_handler=self._food_handler)
+        return game_ui
+
+    def reset(self, episode: Optional[int] = None) -> None:
+        self._episode = self._episode + 1 if episode is None else episode
+        if self._scenario:
+            self._food_handler.set_random_generator(
+                create_random_generator(self._seed, RandomStream.FOOD, self._episode)
+            )
+        self._snake_handler.reset()
+        self._ui.reset()
+        self._direction = Direction.RIGHT
+        self._score = 0
         self._game_over = False
-        self._publisher = publisher
         self._game_iteration_count = 0
+        self._place_new_food()
+        self._loop_detector.reset(self.get_position_hash())
 
     def run(self):
+        profiler = self._profiler
+        started_at = profiler.begin_step()
+        self._step_events.clear()
         self._check_max_game_iteration()
+        started_at = profiler.record("game.iteration_check", started_at)
         self._move_snake_and_check_for_collision()
+        started_at = profiler.record("game.move_and_collide", started_at)
         self._handle_snake_reached_food()
+        started_at = profiler.record("game.food", started_at)
+        self._check_for_loop()
+        started_at = profiler.record("game.loop_check", started_at)
         self._reset_reward_if_needed()
+        self._publisher.publish_events(self._step_events)
+        started_at = profiler.record("game.publish", started_at)
         self._update_ui()
+        profiler.record("game.ui", started_at)
+        profiler.end_step()
 
     def _check_max_game_iteration(self) -> None:
         if self._game_iteration_count >= MAX_GAME_ITERATION * len(self.get_snake()):
@@ -81,7 +150,7 @@ class SnakeGame:
         self._snake_handler.move_snake(self._direction)
         if self.collision_detected():
             self._game_over = True
-            self._publisher.publish_one_event(PublisherEvents.COLLISION_DETECTED)
+            self._step_events.append(PublisherEvents.COLLISION_DETECTED)
 
     def collision_detected(self) -> bool:
         return self._collision_checker.collision_detected()
@@ -91,20 +160,44 @@ class SnakeGame:
             self._score += 1
             self._extend_snake_and_place_new_food()
             self.reset_game_iteration_count()
-            self._publisher.publish_one_event(PublisherEvents.REACHED_FOOD)
+            self._step_events.append(PublisherEvents.REACHED_FOOD)
 
     def _snake_reached_food(self) -> bool:
         return self._snake_handler.head == self._food_handler.get_current_food_position()
 
     def _extend_snake_and_place_new_food(self) -> None:
         self._snake_handler.extend_snake(self._food_handler.get_current_food_position())
+        if len(self.get_snake()) == self._snake_handler.grid.size:
+            # The snake fills the whole board, so there is no cell left for food.
+            self._game_over = True
+            return
         self._place_new_food()
 
     def reset_game_iteration_count(self) -> None:
         self._game_iteration_count = 0
 
-    @retry(retry=retry_if_exception_type(FoodPlacedInSnakeException), stop=stop_after_attempt(100))
+    def _check_for_loop(self) -> None:
+        if not self._loop_detection or self._game_over:
+            return
+        if PublisherEvents.REACHED_FOOD in self._step_events:
+            self._loop_detector.reset(self.get_position_hash())
+        elif self._loop_detector.visit(self.get_position_hash()):
+            # The same position since the last food means the snake is circling instead of heading for the food.
+            self._game_over = True
+            self._step_events.append(PublisherEvents.LOOP_DETECTED)
+
+    def get_position_hash(self) -> int:
+        return self._zobrist_hash.get_hash(self._direction)
+
     def _place_new_food(self) -> None:
+        try:
+            self._place_new_food_at_random_position()
+        except FoodPlacedInSnakeException:
+            # Random draws rarely hit one of the few free cells of a nearly full board, so pick one of them directly.
+            self._food_handler.move_food_to_random_free_cell(self._snake_handler.get_free_cells())
+
+    @retry(retry=retry_if_exception_type(FoodPlacedInSnakeException), stop=stop_after_attempt(100), reraise=True)
+    def _place_new_food_at_random_position(self) -> None:
         self._food_handler.move_food_to_random_position()
 
         if self._food_is_located_in_snake():
@@ -115,15 +208,67 @@ class SnakeGame:
             )
 
     def _food_is_located_in_snake(self) -> bool:
-        return self._food_handler.get_current_food_position() in self._snake_handler.get_snake()
+        return self._snake_handler.occupies(self._food_handler.get_current_food_position())
 
     def _reset_reward_if_needed(self):
-        if not (self._snake_reached_food() or self.collision_detected()):
-            self._publisher.publish_one_event(PublisherEvents.NO_COLLISION)
+        if not self._step_events:
+            self._step_events.append(PublisherEvents.NO_COLLISION)
 
     def _update_ui(self) -> None:
-        self._ui.update_snake_food_and_text(score=self._score)
-        self._ui.update_clock()
+        self._speed_governor.count_step()
+        if not self._speed_governor.should_render():
+            return
+        self._ui.update_snake_food_and_text(score=self._score, overlay=self._speed_governor.get_overlay_text())
+        if self._speed_governor.should_pace():
+            self._ui.update_clock()
+
+    def update_speed(self, speed_mode: Optional[SpeedMode], frame_skip_change: int = 0) -> None:
+        self._speed_governor.update(speed_mode, frame_skip_change=frame_skip_change)
+
+    def get_speed_governor(self) -> SpeedGovernor:
+        return self._speed_governor
+
+    def snapshot(self) -> SnakeGameState:
+        return SnakeGameState(
+            head=self._snake_handler.head,
+            body=tuple(self._snake_handler.body),
+            food_cell=self._food_handler.get_current_food_cell(),
+            direction=self._direction,
+            score=self._score,
+            game_over=self._game_over,
+            game_iteration_count=self._game_iteration_count,
+        )
+
+    def restore(self, state: SnakeGameState) -> None:
+        self._snake_handler.restore(state.head, state.body)
+        self._food_handler.set_current_food_cell(state.food_cell)
+        self._direction = state.direction
+        self._score = state.score
+        self._game_over = state.game_over
+        self._game_iteration_count = state.game_iteration_count
+
+    def simulate(self, direction: Direction) -> Tuple[int, bool]:
+        # Plays one step for a planner: no UI, no events and no new food, so the food generator stays untouched and
+        # reaching the food ends the simulated line. Returns the reward and whether the line ended.
+        self.update_direction(direction)
+        self._check_max_game_iteration()
+        if self._game_over:
+            return 0, True
+        self._snake_handler.move_snake(self._direction)
+        if self.collision_detected():
+            self._game_over = True
+            return COLLISION_REWARD, True
+        if self._snake_reached_food():
+            self._score += 1
+            self._snake_handler.extend_snake(self._food_handler.get_current_food_position())
+            return FOOD_REWARD, True
+        return 0, False
+
+    def get_step_profiler(self) -> AbstractStepProfiler:
+        return self._profiler
+
+    def get_episode(self) -> int:
+        return self._episode
 
     def is_over(self) -> bool:
         return self._game_over
@@ -140,6 +285,12 @@ class SnakeGame:
     def get_collision_checker(self) -> CollisionChecker:
         return self._collision_checker
 
+    def get_snake_handler(self) -> SnakeHandler:
+        return self._snake_handler
+
+    def get_food_handler(self) -> FoodHandler:
+        return self._food_handler
+
     def add_subscriber(self, subscriber: AbstractSubscriber):
         self._publisher.add_subscriber(subscriber)
 
@@ -148,23 +299,25 @@ class SnakeGame:
 
 
 class SnakeGameFactory:
-    def __init__(self, window_configuration: WindowConfig, game_configuration: GameConfig):
+    def __init__(self, window_configuration: WindowConfig, game_configuration: GameConfig, headless: bool = False):
         self._window_config = window_configuration
         self._game_config = game_configuration
+        self._headless = headless
 
     def create_snake_game(self) -> SnakeGame:
+        grid = GridFactory(window_config=self._window_config, game_config=self._game_config).create_grid()
         return SnakeGame(
             window_config=self._window_config,
             game_config=self._game_config,
             snake_handler=SnakeHandlerFactory(
-                snake=SnakeFactory(
-                    window_config=self._window_config,
-                    game_config=self._game_config,
-                ).create_snake()
+                snake=SnakeFactory(grid=grid, game_config=self._game_config).create_snake(),
+                grid=grid,
             ).create_snake_handler(),
             food_handler=FoodHandlerFactory(
-                food=FoodFactory(window_config=self._window_config, game_config=self._game_config).create_food(),
-                window_config=self._window_config,
+                food=FoodFactory().create_food(),
+                grid=grid,
+                random_generator=create_random_generator(self._game_config.seed, RandomStream.FOOD),
             ).create_food_handler(),
             publisher=Publisher(),
+            headless=self._headless,
         )
@@ -3,10 +3,18 @@ from enum import Enum, auto
 from typing import Dict, Optional
 
 from snake.pygame_interface.constants import (
+    PYGAME_K_D,
     PYGAME_K_DOWN,
+    PYGAME_K_EQUALS,
+    PYGAME_K_F,
+    PYGAME_K_KP_MINUS,
+    PYGAME_K_KP_PLUS,
     PYGAME_K_LEFT,
+    PYGAME_K_MINUS,
+    PYGAME_K_PLUS,
     PYGAME_K_RIGHT,
     PYGAME_K_UP,
+    PYGAME_K_W,
     PYGAME_KEYDOWN,
     PYGAME_QUIT,
 )
@@ -20,6 +28,12 @@ class Direction(Enum):
     DOWN = auto()
 
 
+class SpeedMode(Enum):
+    WATCH = auto()
+    FAST = auto()
+    DARK = auto()
+
+
 class AbstractEventHandler(ABC):
     @abstractmethod
     def handle_events(self) -> None:
@@ -33,17 +47,38 @@ class AbstractEventHandler(ABC):
     def quit_game(self) -> bool:
         pass
 
+    def get_updated_speed_mode(self) -> Optional[SpeedMode]:
+        return None
+
+    def get_frame_skip_change(self) -> int:
+        return 0
+
+
+class HeadlessEventHandler(AbstractEventHandler):
+    # Games without a window have no input to read, e.g. training jobs in worker processes.
+    def handle_events(self) -> None:
+        pass
+
+    def get_updated_direction(self) -> Optional[Direction]:
+        return None
+
+    def quit_game(self) -> bool:
+        return False
+
 
 class PygameEventHandler(AbstractEventHandler):
     def __init__(self):
         self._events = []
         self._direction: Optional[Direction] = None
+        self._speed_mode: Optional[SpeedMode] = None
+        self._frame_skip_change: int = 0
         self._quit_game: bool = False
 
     def handle_events(self) -> None:
         self._update_events()
         self._handle_game_quit_event()
         self._handle_user_input_events()
+        self._handle_speed_events()
 
     def _update_events(self) -> None:
         self._events = get_pygame_events()
@@ -68,8 +103,39 @@ class PygameEventHandler(AbstractEventHandler):
             PYGAME_K_DOWN: Direction.DOWN,
         }
 
+    def _handle_speed_events(self) -> None:
+        self._frame_skip_change = 0
+        for event in self._events:
+            if event.type == PYGAME_KEYDOWN:
+                self._speed_mode = self._speed_mode_key_registry.get(event.key, self._speed_mode)
+                self._frame_skip_change += self._frame_skip_key_registry.get(event.key, 0)
+
+    @property
+    def _speed_mode_key_registry(self) -> Dict[int, SpeedMode]:
+        return {
+            PYGAME_K_W: SpeedMode.WATCH,
+            PYGAME_K_F: SpeedMode.FAST,
+            PYGAME_K_D: SpeedMode.DARK,
+        }
+
+    @property
+    def _frame_skip_key_registry(self) -> Dict[int, int]:
+        return {
+            PYGAME_K_PLUS: 1,
+            PYGAME_K_KP_PLUS: 1,
+            PYGAME_K_EQUALS: 1,
+            PYGAME_K_MINUS: -1,
+            PYGAME_K_KP_MINUS: -1,
+        }
+
     def get_updated_direction(self) -> Optional[Direction]:
         return self._direction
 
+    def get_updated_speed_mode(self) -> Optional[SpeedMode]:
+        return self._speed_mode
+
+    def get_frame_skip_change(self) -> int:
+        return self._frame_skip_change
+
     def quit_game(self) -> bool:
         return self._quit_game
@@ -1,56 +1,68 @@
+import numpy as np
+
 from snake.config import GameConfig, WindowConfig
-from snake.game_objects.objects import Food, FoodHandler, Point, Snake, SnakeHandler
+from snake.game_objects.objects import (
+    Food,
+    FoodHandler,
+    Grid,
+    Point,
+    Snake,
+    SnakeHandler,
+)
 
 
-class SnakeFactory:
+class GridFactory:
     def __init__(self, window_config: WindowConfig, game_config: GameConfig):
         self._window_config = window_config
         self._game_config = game_config
 
+    def create_grid(self) -> Grid:
+        return Grid(
+            width=self._window_config.width // self._game_config.outer_block_size,
+            height=self._window_config.height // self._game_config.outer_block_size,
+        )
+
+
+class SnakeFactory:
+    def __init__(self, grid: Grid, game_config: GameConfig):
+        self._grid = grid
+        self._game_config = game_config
+
     def create_snake(self) -> Snake:
         return Snake(
-            head=self._get_window_center(),
+            head=self._get_grid_center(),
             body=[
-                Point(
-                    self._get_window_center().x - (i + 1) * self._game_config.outer_block_size,
-                    self._get_window_center().y,
-                )
+                Point(self._get_grid_center().x - (i + 1), self._get_grid_center().y)
                 for i in range(self._game_config.start_length)
             ],
-            block_size=self._game_config.outer_block_size,
         )
 
-    def _get_window_center(self) -> Point:
-        return Point(int(self._window_config.width / 2), int(self._window_config.height / 2))
+    def _get_grid_center(self) -> Point:
+        return Point(self._grid.width // 2, self._grid.height // 2)
 
 
 class SnakeHandlerFactory:
-    def __init__(self, snake: Snake):
+    def __init__(self, snake: Snake, grid: Grid):
         self._snake = snake
+        self._grid = grid
 
     def create_snake_handler(self) -> SnakeHandler:
         return SnakeHandler(
             snake=self._snake,
+            grid=self._grid,
         )
 
 
 class FoodFactory:
-    def __init__(self, window_config: WindowConfig, game_config: GameConfig):
-        self._window_config = window_config
-        self._game_config = game_config
-
     def create_food(self) -> Food:
-        return Food(
-            width=self._window_config.width,
-            height=self._window_config.height,
-            block_size=self._game_config.outer_block_size,
-        )
+        return Food(cell=0)
 
 
 class FoodHandlerFactory:
-    def __init__(self, food: Food, window_config: WindowConfig):
+    def __init__(self, food: Food, grid: Grid, random_generator: np.random.Generator):
         self._food = food
-        self._window_config = window_config
+        self._grid = grid
+        self._random_generator = random_generator
 
     def create_food_handler(self) -> FoodHandler:
-        return FoodHandler(food=self._food, window_config=self._window_config)
+        return FoodHandler(food=self._food, grid=self._grid, random_generator=self._random_generator)
@@ -1,8 +1,9 @@
-import random
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Callable, Dict, List, NamedTuple
+from typing import Dict, List, NamedTuple, Sequence
+
+import numpy as np
 
-from snake.config import WindowConfig
 from snake.game_controls import Direction
 
 
@@ -11,20 +12,86 @@ class Point(NamedTuple):
     y: int
 
 
+DIRECTION_DELTAS: Dict[Direction, Point] = {
+    Direction.RIGHT: Point(x=1, y=0),
+    Direction.LEFT: Point(x=-1, y=0),
+    Direction.DOWN: Point(x=0, y=1),
+    Direction.UP: Point(x=0, y=-1),
+}
+
+
+@dataclass(frozen=True)
+class Grid:
+    width: int
+    height: int
+
+    @property
+    def size(self) -> int:
+        return self.width * self.height
+
+    def contains(self, point: Point) -> bool:
+        return 0 <= point.x < self.width and 0 <= point.y < self.height
+
+    def to_cell(self, point: Point) -> int:
+        return point.y * self.width + point.x
+
+    def to_point(self, cell: int) -> Point:
+        y, x = divmod(cell, self.width)
+        return Point(x=x, y=y)
+
+
 @dataclass
 class Snake:
     head: Point
     body: List[Point]
-    block_size: int
 
     @property
     def elements(self) -> List[Point]:
         return [self.head] + self.body
 
 
+class AbstractSnakeListener(ABC):
+    @abstractmethod
+    def snake_extended(self, old_head: Point, new_head: Point) -> None:
+        pass
+
+    @abstractmethod
+    def tail_removed(self, tail: Point) -> None:
+        pass
+
+    @abstractmethod
+    def snake_reset(self) -> None:
+        pass
+
+
 class SnakeHandler:
-    def __init__(self, snake: Snake):
+    def __init__(self, snake: Snake, grid: Grid):
         self._snake = snake
+        self._grid = grid
+        self._initial_head = snake.head
+        self._initial_body = list(snake.body)
+        self._occupancy = np.zeros(grid.size, dtype=np.int32)
+        for point in snake.body:
+            self._update_occupancy(point, 1)
+        self._listeners: List[AbstractSnakeListener] = []
+        self.reset()
+
+    def add_listener(self, listener: AbstractSnakeListener) -> None:
+        self._listeners.append(listener)
+
+    def reset(self) -> None:
+        self.restore(self._initial_head, self._initial_body)
+
+    def restore(self, head: Point, body: Sequence[Point]) -> None:
+        # Only the cells of the old and the new body are updated, never the whole grid.
+        for point in self._snake.body:
+            self._update_occupancy(point, -1)
+        self._snake.head = head
+        self._snake.body[:] = body
+        for point in self._snake.body:
+            self._update_occupancy(point, 1)
+        for listener in self._listeners:
+            listener.snake_reset()
 
     def move_snake(self, direction: Direction):
         new_head = self._calculate_new_head(direction)
@@ -32,54 +99,87 @@ class SnakeHandler:
         self.remove_last_element_from_body()
 
     def _calculate_new_head(self, direction: Direction) -> Point:
-        return self._directions[direction](self.head)
-
-    @property
-    def _directions(self) -> Dict[Direction, Callable[[Point], Point]]:
-        return {
-            Direction.RIGHT: lambda point: Point(point.x + self._snake.block_size, point.y),
-            Direction.LEFT: lambda point: Point(point.x - self._snake.block_size, point.y),
-            Direction.DOWN: lambda point: Point(point.x, point.y + self._snake.block_size),
-            Direction.UP: lambda point: Point(point.x, point.y - self._snake.block_size),
-        }
+        delta = DIRECTION_DELTAS[direction]
+        return Point(x=self.head.x + delta.x, y=self.head.y + delta.y)
 
     @property
     def head(self) -> Point:
         return self._snake.head
 
+    @property
+    def body(self) -> List[Point]:
+        return self._snake.body
+
+    @property
+    def grid(self) -> Grid:
+        return self._grid
+
+    @property
+    def occupancy(self) -> np.ndarray:
+        return self._occupancy
+
     def extend_snake(self, new_head: Point) -> None:
-        self._snake.body.insert(0, self._snake.head)
+        old_head = self._snake.head
+        self._snake.body.insert(0, old_head)
+        self._update_occupancy(old_head, 1)
         self._snake.head = new_head
+        for listener in self._listeners:
+            listener.snake_extended(old_head, new_head)
 
     def remove_last_element_from_body(self) -> None:
-        self._snake.body.pop()
+        tail = self._snake.body.pop()
+        self._update_occupancy(tail, -1)
+        for listener in self._listeners:
+            listener.tail_removed(tail)
+
+    def _update_occupancy(self, point: Point, count: int) -> None:
+        if self._grid.contains(point):
+            self._occupancy[self._grid.to_cell(point)] += count
 
     def snake_bites_itself(self) -> bool:
-        return self._snake.head in self._snake.body
+        return self.body_occupies(self._snake.head)
+
+    def body_occupies(self, point: Point) -> bool:
+        return self._grid.contains(point) and bool(self._occupancy[self._grid.to_cell(point)])
+
+    def occupies(self, point: Point) -> bool:
+        return point == self._snake.head or self.body_occupies(point)
 
     def get_snake(self) -> List[Point]:
         return self._snake.elements
 
+    def get_free_cells(self) -> np.ndarray:
+        free = self._occupancy == 0
+        if self._grid.contains(self._snake.head):
+            free[self._grid.to_cell(self._snake.head)] = False
+        return np.flatnonzero(free)
+
 
 @dataclass
 class Food:
-    width: int
-    height: int
-    block_size: int
+    cell: int
 
 
 class FoodHandler:
-    def __init__(self, food: Food, window_config: WindowConfig):
+    def __init__(self, food: Food, grid: Grid, random_generator: np.random.Generator):
         self._food = food
-        self._window_config = window_config
+        self._grid = grid
+        self._random_generator = random_generator
+
+    def set_random_generator(self, random_generator: np.random.Generator) -> None:
+        self._random_generator = random_generator
 
     def move_food_to_random_position(self) -> None:
-        self._food.width = (
-            random.randint(0, self._window_config.width - 1) // self._food.block_size
-        ) * self._food.block_size
-        self._food.height = (
-            random.randint(0, self._window_config.height - 1) // self._food.block_size
-        ) * self._food.block_size
+        self._food.cell = int(self._random_generator.integers(self._grid.size))
+
+    def move_food_to_random_free_cell(self, free_cells: np.ndarray) -> None:
+        self._food.cell = int(self._random_generator.choice(free_cells))
 
     def get_current_food_position(self) -> Point:
-        return Point(x=self._food.width, y=self._food.height)
+        return self._grid.to_point(self._food.cell)
+
+    def get_current_food_cell(self) -> int:
+        return self._food.cell
+
+    def set_current_food_cell(self, cell: int) -> None:
+        self._food.cell = cell
@@ -0,0 +1,110 @@
+from functools import lru_cache
+from typing import List, Sequence
+
+from snake.exceptions import NoHamiltonianCycleException
+from snake.game_objects.objects import Grid, Point, SnakeHandler
+from snake.pathfinding import AbstractPathPlanner, create_neighbour_table
+
+# Cycle positions kept free between head and tail after a shortcut, so food eaten right after it cannot close the gap.
+SHORTCUT_MARGIN = 3
+
+
+class HamiltonianCycle:
+    # cells[position] walks the cycle and positions[cell] is its inverse, so following the cycle and measuring how far
+    # ahead a cell lies are both table lookups.
+    def __init__(self, cells: Sequence[int]):
+        self._cells = tuple(cells)
+        self._positions = [0] * len(self._cells)
+        for position, cell in enumerate(self._cells):
+            self._positions[cell] = position
+
+    @property
+    def size(self) -> int:
+        return len(self._cells)
+
+    @property
+    def cells(self) -> Sequence[int]:
+        return self._cells
+
+    def position(self, cell: int) -> int:
+        return self._positions[cell]
+
+    def successor(self, cell: int) -> int:
+        return self._cells[(self._positions[cell] + 1) % len(self._cells)]
+
+    def distance(self, from_cell: int, to_cell: int) -> int:
+        return (self._positions[to_cell] - self._positions[from_cell]) % len(self._cells)
+
+    def reversed(self) -> "HamiltonianCycle":
+        return HamiltonianCycle(self._cells[::-1])
+
+
+def _create_cycle_points(width: int, height: int) -> List[Point]:
+    # Rows are walked in alternating directions over the columns 1.., column 0 leads back up to the start.
+    points = [Point(x=0, y=0)]
+    for y in range(height):
+        columns = range(1, width) if y % 2 == 0 else range(width - 1, 0, -1)
+        points.extend(Point(x=x, y=y) for x in columns)
+    points.extend(Point(x=0, y=y) for y in range(height - 1, 0, -1))
+    return points
+
+
+@lru_cache(maxsize=None)
+def create_hamiltonian_cycle(grid: Grid) -> HamiltonianCycle:
+    if grid.width < 2 or grid.height < 2:
+        raise NoHamiltonianCycleException(f"Grid {grid.width}x{grid.height} is too narrow for a Hamiltonian cycle.")
+    if grid.height % 2 == 0:
+        points = _create_cycle_points(grid.width, grid.height)
+    elif grid.width % 2 == 0:
+        points = [Point(x=point.y, y=point.x) for point in _create_cycle_points(grid.height, grid.width)]
+    else:
+        raise NoHamiltonianCycleException(
+            f"Grid {grid.width}x{grid.height} has an odd number of cells and no Hamiltonian cycle."
+        )
+    return HamiltonianCycle([grid.to_cell(point) for point in points])
+
+
+class HamiltonianPlanner(AbstractPathPlanner):
+    # Following the cycle keeps the body on the cycle segment from tail to head, so the snake can never trap itself.
+    # A shortcut jumps ahead along the cycle towards the food, but never past the food and never so far that the
+    # head gets within SHORTCUT_MARGIN of the tail. Shortcuts stop once the snake fills max_shortcut_fill of the board.
+    def __init__(self, snake_handler: SnakeHandler, max_shortcut_fill: float = 0.5):
+        self._snake_handler = snake_handler
+        self._grid = snake_handler.grid
+        self._neighbours = create_neighbour_table(self._grid)
+        self._forward_cycle = create_hamiltonian_cycle(self._grid)
+        self._backward_cycle = self._forward_cycle.reversed()
+        self._cycle = self._forward_cycle
+        self._max_shortcut_length = int(max_shortcut_fill * self._grid.size)
+        self.reset()
+
+    @property
+    def cycle(self) -> HamiltonianCycle:
+        return self._cycle
+
+    def reset(self) -> None:
+        # Walk the cycle in the direction the start snake already lies on, so the first step is not into the body.
+        head = self._grid.to_cell(self._snake_handler.head)
+        neck = self._grid.to_cell(self._snake_handler.body[0])
+        if self._forward_cycle.successor(neck) == head:
+            self._cycle = self._forward_cycle
+        elif self._backward_cycle.successor(neck) == head:
+            self._cycle = self._backward_cycle
+        elif self._snake_handler.occupancy[self._forward_cycle.successor(head)]:
+            self._cycle = self._backward_cycle
+        else:
+            self._cycle = self._forward_cycle
+
+    def next_cell(self, food_cell: int) -> int:
+        head = self._grid.to_cell(self._snake_handler.head)
+        next_cell = self._cycle.successor(head)
+        if len(self._snake_handler.body) + 1 > self._max_shortcut_length:
+            return next_cell
+        tail = self._grid.to_cell(self._snake_handler.body[-1])
+        max_distance = min(self._cycle.distance(head, food_cell), self._cycle.distance(head, tail) - SHORTCUT_MARGIN)
+        best_distance = 1
+        for neighbour in self._neighbours[head]:
+            distance = self._cycle.distance(head, neighbour)
+            if best_distance < distance <= max_distance and not self._snake_handler.occupancy[neighbour]:
+                next_cell, best_distance = neighbour, distance
+        return next_cell
@@ -0,0 +1,105 @@
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from snake.game import FOOD_REWARD, SnakeGame, SnakeGameState
+from snake.game_controls import Direction
+from snake.model import QNet
+from snake.state import CLOCK_WISE_DIRECTIONS, State
+
+# Same order as Actions: straight, right turn, left turn.
+RELATIVE_TURNS = (0, 1, -1)
+
+Frames = Tuple[np.ndarray, ...]
+
+
+def turn(direction: Direction, action: int) -> Direction:
+    index = CLOCK_WISE_DIRECTIONS.index(direction)
+    return CLOCK_WISE_DIRECTIONS[(index + RELATIVE_TURNS[action]) % len(CLOCK_WISE_DIRECTIONS)]
+
+
+class MCTSNode:
+    # pylint: disable=too-many-instance-attributes
+    __slots__ = ("state", "frames", "reward", "terminal", "priors", "children", "visits", "value_sum")
+
+    def __init__(self, state: SnakeGameState, frames: Frames, reward: int = 0, terminal: bool = False):
+        self.state = state
+        self.frames = frames
+        self.reward = reward
+        self.terminal = terminal
+        # empty until the node is evaluated
+        self.priors: List[float] = []
+        self.children: List[Optional[MCTSNode]] = [None] * len(RELATIVE_TURNS)
+        self.visits = 0
+        self.value_sum = 0.0
+
+    @property
+    def mean_value(self) -> float:
+        return self.value_sum / self.visits if self.visits else 0.0
+
+
+class MonteCarloTreeSearch:
+    # pylint: disable=too-many-arguments
+    # Q-values of the model give the priors (softmax) and the value of a leaf (max). Children are only simulated
+    # when selected, each from its parent's snapshot, on a headless game of its own, so the played game, its UI and
+    # its listeners never see the positions of the search.
+    def __init__(
+        self, game: SnakeGame, state: State, model: QNet, *, simulations: int, exploration: float, discount: float
+    ):
+        self._game = game
+        self._state = state
+        self._model = model
+        self._simulations = simulations
+        self._exploration = exploration
+        self._discount = discount
+
+    def search(self, root_state: SnakeGameState, frames: Frames) -> int:
+        root = MCTSNode(state=root_state, frames=frames)
+        for _ in range(self._simulations):
+            self._run_simulation(root)
+        visits = [child.visits if child else 0 for child in root.children]
+        return max(range(len(visits)), key=lambda action: (visits[action], root.priors[action]))
+
+    def _run_simulation(self, root: MCTSNode) -> None:
+        node = root
+        path = [node]
+        while node.priors and not node.terminal:
+            action = self._select_action(node)
+            child = node.children[action] or self._create_child(node, action)
+            node.children[action] = child
+            node = child
+            path.append(node)
+        value = 0.0 if node.terminal else self._evaluate(node)
+        for path_node in reversed(path):
+            path_node.visits += 1
+            path_node.value_sum += value
+            value = path_node.reward + self._discount * value
+
+    def _select_action(self, node: MCTSNode) -> int:
+        exploration = self._exploration * math.sqrt(node.visits)
+        best_action, best_score = 0, -math.inf
+        for action, child in enumerate(node.children):
+            if child is None:
+                q_value, child_visits = node.mean_value, 0
+            else:
+                q_value, child_visits = child.reward + self._discount * child.mean_value, child.visits
+            score = q_value / FOOD_REWARD + exploration * node.priors[action] / (1 + child_visits)
+            if score > best_score:
+                best_action, best_score = action, score
+        return best_action
+
+    def _create_child(self, node: MCTSNode, action: int) -> MCTSNode:
+        self._game.restore(node.state)
+        reward, terminal = self._game.simulate(turn(node.state.direction, action))
+        frame = np.asarray(self._state.calculate_state_from_game(), dtype=np.float32)
+        return MCTSNode(
+            state=self._game.snapshot(), frames=node.frames[1:] + (frame,), reward=reward, terminal=terminal
+        )
+
+    def _evaluate(self, node: MCTSNode) -> float:
+        with torch.no_grad():
+            q_values = self._model(torch.as_tensor(np.concatenate(node.frames), dtype=torch.float))
+        node.priors = torch.softmax(q_values, dim=-1).tolist()
+        return float(q_values.max())
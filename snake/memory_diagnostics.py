@@ -0,0 +1,130 @@
+import sys
+import tracemalloc
+import types
+from collections import deque
+from typing import Callable, Dict, List, Optional, Set
+
+import numpy as np
+import torch
+
+from snake.config import GameConfig
+
+SKIPPED_TYPES = (type, types.ModuleType, types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+
+def deep_sizeof(obj: object, seen: Optional[Set[int]] = None) -> int:
+    # Objects already in seen are not counted again, so sharing one set across several calls attributes memory
+    # that is shared, like the frames referenced by replay entries, to the first owner only.
+    seen = set() if seen is None else seen
+    size = 0
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, SKIPPED_TYPES):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current) + _buffer_size(current, seen)
+        pending.extend(_referenced_objects(current))
+    return size
+
+
+def _buffer_size(obj: object, seen: Set[int]) -> int:
+    # Array and tensor data lives outside the object; views count their base instead and storages only once.
+    if isinstance(obj, np.ndarray) and obj.base is None:
+        return obj.nbytes
+    if isinstance(obj, torch.Tensor) and obj.data_ptr() not in seen:
+        seen.add(obj.data_ptr())
+        return obj.element_size() * obj.nelement()
+    return 0
+
+
+def _referenced_objects(obj: object) -> List[object]:
+    children: List[object] = []
+    if isinstance(obj, np.ndarray):
+        if obj.base is not None:
+            children.append(obj.base)
+    elif isinstance(obj, torch.Tensor):
+        if obj.grad is not None:
+            children.append(obj.grad)
+    elif isinstance(obj, dict):
+        children.extend(obj.keys())
+        children.extend(obj.values())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        children.extend(obj)
+    if hasattr(obj, "__dict__"):
+        children.append(vars(obj))
+    children.extend(getattr(obj, slot) for slot in getattr(type(obj), "__slots__", ()) if hasattr(obj, slot))
+    return children
+
+
+def measure_peak_allocated_bytes(function: Callable[[], object], calls: int = 100) -> int:
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    function()
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in range(calls):
+        function()
+    _, peak = tracemalloc.get_traced_memory()
+    if not was_tracing:
+        tracemalloc.stop()
+    return peak - start
+
+
+class MemoryDiagnostics:
+    def __init__(self, interval_episodes: int, top_allocations: int = 10, tracemalloc_frames: int = 1):
+        self._interval_episodes = interval_episodes
+        self._top_allocations = top_allocations
+        self._tracemalloc_frames = tracemalloc_frames
+        self._previous_snapshot: Optional[tracemalloc.Snapshot] = None
+        if tracemalloc_frames and not tracemalloc.is_tracing():
+            tracemalloc.start(tracemalloc_frames)
+
+    def should_report(self, episode: int) -> bool:
+        return episode % self._interval_episodes == 0
+
+    def measure(self, sections: Dict[str, object]) -> Dict[str, int]:
+        seen: Set[int] = set()
+        return {name: deep_sizeof(section, seen) for name, section in sections.items()}
+
+    def compare_snapshots(self) -> List[tracemalloc.StatisticDiff]:
+        if not tracemalloc.is_tracing():
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        )
+        previous_snapshot, self._previous_snapshot = self._previous_snapshot, snapshot
+        if previous_snapshot is None:
+            return []
+        key_type = "traceback" if self._tracemalloc_frames > 1 else "lineno"
+        return snapshot.compare_to(previous_snapshot, key_type)[: self._top_allocations]
+
+    def report(self, episode: int, sections: Dict[str, object]) -> str:
+        lines = [f"Memory after episode {episode}"]
+        for name, size in self.measure(sections).items():
+            lines.append(f"{name:<24} {size / 2**20:12.2f} MiB")
+        statistic_diffs = self.compare_snapshots()
+        if statistic_diffs:
+            lines.append(f"Top {len(statistic_diffs)} allocation sites since the previous report")
+            for statistic_diff in statistic_diffs:
+                frame = statistic_diff.traceback[0]
+                lines.append(
+                    f"{statistic_diff.size_diff / 2**10:+12.1f} KiB {statistic_diff.count_diff:+8d} blocks "
+                    f"{frame.filename}:{frame.lineno}"
+                )
+        return "\n".join(lines)
+
+    def stop(self) -> None:
+        if self._tracemalloc_frames and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def create_memory_diagnostics(game_config: GameConfig) -> Optional[MemoryDiagnostics]:
+    if not game_config.memory_diagnostics:
+        return None
+    return MemoryDiagnostics(
+        interval_episodes=game_config.memory_diagnostics_interval,
+        top_allocations=game_config.memory_diagnostics_top_allocations,
+        tracemalloc_frames=game_config.memory_diagnostics_tracemalloc_frames,
+    )
@@ -0,0 +1,150 @@
+import csv
+import json
+import math
+import queue
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+METRICS_FLUSH_EPISODES = 50
+SUMMARY_WINDOW = 100
+
+
+@dataclass
+class EpisodeMetrics:
+    # pylint: disable=too-many-instance-attributes
+    episode: int
+    score: int
+    steps: int
+    reward_sum: int
+    epsilon: int
+    loss: float
+    steps_per_second: float
+    replay_size: int
+    # Only set in the first episode after a background evaluation of the weights after evaluated_episode finished.
+    evaluated_episode: Optional[int] = None
+    evaluation_score_mean: Optional[float] = None
+    evaluation_score_max: Optional[int] = None
+
+    @staticmethod
+    def get_field_names() -> List[str]:
+        return [field.name for field in fields(EpisodeMetrics)]
+
+
+class MetricsWriter(threading.Thread):
+    # Episodes are buffered in memory and handed to this thread in batches, so the training loop never waits on
+    # file IO. The format follows the file suffix: .csv writes CSV, everything else JSON lines.
+    def __init__(self, path: Union[str, Path], flush_episodes: int = METRICS_FLUSH_EPISODES):
+        super().__init__(name=self.__class__.__name__, daemon=True)
+        self._path = Path(path)
+        self._flush_episodes = flush_episodes
+        self._buffer: List[EpisodeMetrics] = []
+        self._batches: queue.Queue = queue.Queue()
+
+    def write(self, metrics: EpisodeMetrics) -> None:
+        self._buffer.append(metrics)
+        if len(self._buffer) >= self._flush_episodes:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._batches.put(self._buffer)
+            self._buffer = []
+
+    def run(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        is_csv = self._path.suffix == ".csv"
+        write_header = is_csv and not (self._path.exists() and self._path.stat().st_size)
+        with open(self._path, "a", encoding="utf-8", newline="") as metrics_file:
+            csv_writer = csv.DictWriter(metrics_file, fieldnames=EpisodeMetrics.get_field_names())
+            if write_header:
+                csv_writer.writeheader()
+            while (batch := self._batches.get()) is not None:
+                for metrics in batch:
+                    if is_csv:
+                        csv_writer.writerow(asdict(metrics))
+                    else:
+                        metrics_file.write(json.dumps(asdict(metrics)) + "\n")
+                metrics_file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._batches.put(None)
+        if self.is_alive():
+            self.join()
+
+
+class StreamingStatistic:
+    def __init__(self, window: int = SUMMARY_WINDOW, smoothing: float = 0.05):
+        self._window: deque = deque(maxlen=window)
+        self._smoothing = smoothing
+        self._exponential_average: Optional[float] = None
+        self._count = 0
+        self._total = 0.0
+
+    def add(self, value: float) -> None:
+        self._window.append(value)
+        self._count += 1
+        self._total += value
+        if self._exponential_average is None:
+            self._exponential_average = value
+        else:
+            self._exponential_average += self._smoothing * (value - self._exponential_average)
+
+    def get_count(self) -> int:
+        return self._count
+
+    def get_mean(self) -> float:
+        return self._total / self._count if self._count else 0.0
+
+    def get_moving_average(self) -> float:
+        return float(np.mean(self._window)) if self._window else 0.0
+
+    def get_exponential_average(self) -> float:
+        return self._exponential_average or 0.0
+
+    def get_quantile(self, quantile: float) -> float:
+        return float(np.quantile(self._window, quantile)) if self._window else 0.0
+
+
+class MetricsSummary:
+    def __init__(self, window: int = SUMMARY_WINDOW):
+        self._statistics: Dict[str, StreamingStatistic] = {
+            name: StreamingStatistic(window=window)
+            for name in EpisodeMetrics.get_field_names()
+            if name not in ("episode", "evaluated_episode")
+        }
+
+    def add(self, metrics: EpisodeMetrics) -> None:
+        for name, value in asdict(metrics).items():
+            if name in self._statistics and value is not None:
+                self._statistics[name].add(value)
+
+    def __getitem__(self, name: str) -> StreamingStatistic:
+        return self._statistics[name]
+
+    def get_summary(self) -> str:
+        lines = [f"{'metric':<18} {'mean':>10} {'moving avg':>10} {'p10':>10} {'p50':>10} {'p90':>10}"]
+        for name, statistic in self._statistics.items():
+            lines.append(
+                f"{name:<18} {statistic.get_mean():>10.2f} {statistic.get_moving_average():>10.2f} "
+                f"{statistic.get_quantile(0.1):>10.2f} {statistic.get_quantile(0.5):>10.2f} "
+                f"{statistic.get_quantile(0.9):>10.2f}"
+            )
+        return "\n".join(lines)
+
+
+def read_metrics(path: Union[str, Path]) -> Iterator[Dict[str, float]]:
+    path = Path(path)
+    with open(path, encoding="utf-8", newline="") as metrics_file:
+        if path.suffix == ".csv":
+            for row in csv.DictReader(metrics_file):
+                yield {name: float(value) if value else math.nan for name, value in row.items()}
+        else:
+            for line in metrics_file:
+                if line.strip():
+                    yield json.loads(line)
@@ -0,0 +1,139 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+
+from snake.profiler import AbstractStepProfiler, StepProfiler
+
+METRICS_HOST = "127.0.0.1"
+METRIC_PREFIX = "snake"
+
+
+class LiveMetrics:
+    # pylint: disable=too-many-instance-attributes
+    # Written only by the game loop and read by the server thread. Single attribute loads and stores are atomic,
+    # so neither side takes a lock; a scrape may just see one counter a step ahead of another.
+    def __init__(self):
+        self.env_steps = 0
+        self.episodes = 0
+        self.gradient_steps = 0
+        self.replay_size = 0
+        self.replay_capacity = 0
+        self.max_score = 0
+        self.checkpoint_saved_at: Optional[float] = None
+        self.evaluation_score_mean: Optional[float] = None
+        self.started_at = time.monotonic()
+
+
+class MetricsExporter:
+    def __init__(self, live_metrics: LiveMetrics, step_profiler: Optional[AbstractStepProfiler] = None):
+        self._live_metrics = live_metrics
+        self._step_profiler = step_profiler
+        self._last_scrape: Tuple[float, int] = (live_metrics.started_at, 0)
+
+    def set_step_profiler(self, step_profiler: AbstractStepProfiler) -> None:
+        self._step_profiler = step_profiler
+
+    def export(self) -> str:
+        live_metrics = self._live_metrics
+        now = time.monotonic()
+        env_steps = live_metrics.env_steps
+        last_scraped_at, last_env_steps = self._last_scrape
+        self._last_scrape = (now, env_steps)
+        lines: List[str] = []
+        self._add(lines, "env_steps_total", "counter", "Environment steps played", env_steps)
+        self._add(lines, "episodes_total", "counter", "Finished episodes", live_metrics.episodes)
+        self._add(lines, "gradient_steps_total", "counter", "Optimizer steps", live_metrics.gradient_steps)
+        self._add(
+            lines,
+            "steps_per_second",
+            "gauge",
+            "Environment steps per second since the previous scrape",
+            (env_steps - last_env_steps) / max(now - last_scraped_at, 1e-9),
+        )
+        self._add(
+            lines,
+            "replay_fill_ratio",
+            "gauge",
+            "Replay memory fill ratio",
+            live_metrics.replay_size / live_metrics.replay_capacity if live_metrics.replay_capacity else 0.0,
+        )
+        self._add(lines, "max_score", "gauge", "Highest score reached so far", live_metrics.max_score)
+        checkpoint_saved_at = live_metrics.checkpoint_saved_at
+        self._add(
+            lines,
+            "checkpoint_age_seconds",
+            "gauge",
+            "Seconds since the model was last saved",
+            now - (checkpoint_saved_at if checkpoint_saved_at is not None else live_metrics.started_at),
+        )
+        if live_metrics.evaluation_score_mean is not None:
+            self._add(
+                lines,
+                "evaluation_score_mean",
+                "gauge",
+                "Mean score of the latest greedy evaluation",
+                live_metrics.evaluation_score_mean,
+            )
+        if isinstance(self._step_profiler, StepProfiler):
+            self._add_phase_latencies(lines, self._step_profiler)
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _add(lines: List[str], name: str, metric_type: str, help_text: str, value: float) -> None:
+        lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_{name} {metric_type}")
+        lines.append(f"{METRIC_PREFIX}_{name} {value}")
+
+    @staticmethod
+    def _add_phase_latencies(lines: List[str], step_profiler: StepProfiler) -> None:
+        name = f"{METRIC_PREFIX}_phase_latency_seconds"
+        lines.append(f"# HELP {name} Step phase latency over the profiling window")
+        lines.append(f"# TYPE {name} summary")
+        for phase, percentiles in step_profiler.get_percentiles_ns().items():
+            for percentile, value_ns in percentiles.items():
+                lines.append(f'{name}{{phase="{phase}",quantile="{percentile / 100}"}} {value_ns / 1e9}')
+
+
+class MetricsServer:
+    def __init__(self, port: int, host: str = METRICS_HOST):
+        self.live_metrics = LiveMetrics()
+        self._exporter = MetricsExporter(self.live_metrics)
+        self._http_server = ThreadingHTTPServer((host, port), self._create_request_handler())
+        self._thread = threading.Thread(
+            target=self._http_server.serve_forever, name=self.__class__.__name__, daemon=True
+        )
+
+    @property
+    def port(self) -> int:
+        return self._http_server.server_address[1]
+
+    def _create_request_handler(self) -> type:
+        exporter = self._exporter
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                if self.path.split("?", maxsplit=1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.export().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+                pass
+
+        return MetricsRequestHandler
+
+    def start(self, step_profiler: Optional[AbstractStepProfiler] = None) -> None:
+        if step_profiler:
+            self._exporter.set_step_profiler(step_profiler)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread.is_alive():
+            self._http_server.shutdown()
+        self._http_server.server_close()
@@ -1,27 +1,35 @@
 import os
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple, Union, cast
 
+import numpy as np
 import torch
 from torch import nn, optim
 from torch.nn import functional as torch_functional
 
+States = Union[List[int], np.ndarray, torch.Tensor]
+# a single transition or a batch of them
+ActionValues = Union[List[int], Sequence[List[int]]]
+Rewards = Union[int, Sequence[int]]
+GameOvers = Union[bool, Sequence[bool]]
 
-class LinearQNet(nn.Module):
-    def __init__(self, input_feature_size: int = 20, hidden_layer_size: int = 256, output_feature_size: int = 3):
-        super().__init__()
-        self._linear1 = nn.Linear(in_features=input_feature_size, out_features=hidden_layer_size)
-        self._linear2 = nn.Linear(in_features=hidden_layer_size, out_features=output_feature_size)
-        self.load()
+MODEL_FOLDER_PATH = "./model"
 
-    def forward(self, tensor):
-        tensor = torch_functional.relu(input=self._linear1(tensor))
-        tensor = self._linear2(tensor)
-        return tensor
 
-    def load(self, file_name: str = "model.pth") -> None:
+class QNet(nn.Module):
+    # pylint: disable=abstract-method
+    SAMPLE_DIMENSIONS = 1
+
+    @property
+    def model_file_name(self) -> str:
+        return "model.pth"
+
+    @property
+    def model_file_path(self) -> str:
+        return os.path.join(MODEL_FOLDER_PATH, self.model_file_name)
+
+    def load(self, file_name: Optional[str] = None) -> None:
         # ToDo: load and save does not seems to work...
-        model_folder_path = "./model"
-        file_name = os.path.join(model_folder_path, file_name)
+        file_name = os.path.join(MODEL_FOLDER_PATH, file_name or self.model_file_name)
         try:
             self.load_state_dict(torch.load(file_name))
         except FileNotFoundError:
@@ -29,16 +37,79 @@ class LinearQNet(nn.Module):
         else:
             print("Model loaded.")
 
-    def save(self, file_name: str = "model.pth") -> None:
-        model_folder_path = "./model"
-        if not os.path.exists(model_folder_path):
-            os.makedirs(model_folder_path)
-        file_name = os.path.join(model_folder_path, file_name)
-        torch.save(self.state_dict(), file_name)
+    def save(self, file_name: Optional[str] = None, state_dict: Optional[Dict[str, torch.Tensor]] = None) -> None:
+        if not os.path.exists(MODEL_FOLDER_PATH):
+            os.makedirs(MODEL_FOLDER_PATH)
+        file_name = os.path.join(MODEL_FOLDER_PATH, file_name or self.model_file_name)
+        torch.save(self.state_dict() if state_dict is None else state_dict, file_name)
+
+
+class LinearQNet(QNet):
+    def __init__(
+        self,
+        input_feature_size: int = 20,
+        hidden_layer_size: int = 256,
+        output_feature_size: int = 3,
+        load_saved_model: bool = True,
+    ):
+        super().__init__()
+        self._input_feature_size = input_feature_size
+        self._linear1 = nn.Linear(in_features=input_feature_size, out_features=hidden_layer_size)
+        self._linear2 = nn.Linear(in_features=hidden_layer_size, out_features=output_feature_size)
+        if load_saved_model:
+            self.load()
+
+    @property
+    def model_file_name(self) -> str:
+        return f"model_{self._input_feature_size}.pth"
+
+    def forward(self, tensor):
+        tensor = torch_functional.relu(input=self._linear1(tensor))
+        tensor = self._linear2(tensor)
+        return tensor
+
+
+class ConvQNet(QNet):
+    SAMPLE_DIMENSIONS = 3
+
+    def __init__(
+        self,
+        input_shape: Tuple[int, int, int],
+        *,
+        hidden_channels: int = 16,
+        pooled_size: int = 6,
+        hidden_layer_size: int = 256,
+        output_feature_size: int = 3,
+        load_saved_model: bool = True,
+    ):
+        # pylint: disable=too-many-arguments
+        super().__init__()
+        self._input_shape = input_shape
+        self._conv1 = nn.Conv2d(in_channels=input_shape[0], out_channels=hidden_channels, kernel_size=3, padding=1)
+        self._conv2 = nn.Conv2d(
+            in_channels=hidden_channels, out_channels=2 * hidden_channels, kernel_size=3, stride=2, padding=1
+        )
+        self._pool = nn.AdaptiveMaxPool2d(output_size=pooled_size)
+        self._linear1 = nn.Linear(in_features=2 * hidden_channels * pooled_size**2, out_features=hidden_layer_size)
+        self._linear2 = nn.Linear(in_features=hidden_layer_size, out_features=output_feature_size)
+        if load_saved_model:
+            self.load()
+
+    @property
+    def model_file_name(self) -> str:
+        return f"conv_model_{'x'.join(map(str, self._input_shape))}.pth"
+
+    def forward(self, tensor):
+        tensor = torch_functional.relu(input=self._conv1(tensor))
+        tensor = torch_functional.relu(input=self._conv2(tensor))
+        tensor = torch.flatten(self._pool(tensor), start_dim=-3)
+        tensor = torch_functional.relu(input=self._linear1(tensor))
+        tensor = self._linear2(tensor)
+        return tensor
 
 
 class QTrainer:
-    def __init__(self, model: LinearQNet, learning_rate: float = 0.001, discount_rate: float = 0.9):
+    def __init__(self, model: QNet, learning_rate: float = 0.001, discount_rate: float = 0.9):
         self._model = model
         self._learning_rate = learning_rate
         self._discount_rate = discount_rate
@@ -46,15 +117,17 @@ class QTrainer:
         self._optimizer = optim.Adam(params=self._model.parameters(), lr=self._learning_rate)
         self._criterion = nn.MSELoss()
 
-    def train_step(self, old_state: List[int], action: List[int], reward: int, new_state: List[int], game_over: bool):
-        old_state_tensor = torch.tensor(data=old_state, dtype=torch.float)
-        new_state_tensor = torch.tensor(new_state, dtype=torch.float)
-        action_tensor = torch.tensor(action, dtype=torch.long)
-        reward_tensor = torch.tensor(reward, dtype=torch.float)
+    def train_step(
+        self, old_state: States, action: ActionValues, reward: Rewards, new_state: States, game_over: GameOvers
+    ) -> torch.Tensor:
+        old_state_tensor = torch.as_tensor(data=old_state, dtype=torch.float)
+        new_state_tensor = torch.as_tensor(new_state, dtype=torch.float)
+        action_tensor = torch.as_tensor(action, dtype=torch.long)
+        reward_tensor = torch.as_tensor(reward, dtype=torch.float)
         game_over_tensor = (game_over,)
         # ToDo: check game_over implementation
 
-        if len(old_state_tensor.shape) == 1:
+        if old_state_tensor.dim() == self._model.SAMPLE_DIMENSIONS:
             old_state_tensor = torch.unsqueeze(input=old_state_tensor, dim=0)
             new_state_tensor = torch.unsqueeze(new_state_tensor, 0)
             action_tensor = torch.unsqueeze(action_tensor, 0)
@@ -78,3 +151,4 @@ class QTrainer:
         loss.backward()
 
         self._optimizer.step()
+        return cast(torch.Tensor, loss.detach())
@@ -0,0 +1,148 @@
+from enum import IntEnum
+from typing import Optional, Sequence, Tuple, cast
+
+import numpy as np
+import torch
+
+from snake.config import GameConfig
+from snake.game import SnakeGame
+from snake.game_objects.objects import (
+    AbstractSnakeListener,
+    FoodHandler,
+    Point,
+    SnakeHandler,
+)
+
+
+class GridChannel(IntEnum):
+    HEAD = 0
+    BODY = 1
+    FOOD = 2
+    BODY_AGE = 3
+
+
+class GridObservation(AbstractSnakeListener):
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self, snake_handler: SnakeHandler, food_handler: FoodHandler, body_age: bool = False, downsampling: int = 1
+    ):
+        self._snake_handler = snake_handler
+        self._food_handler = food_handler
+        self._body_age = body_age
+        self._downsampling = downsampling
+
+        grid = snake_handler.grid
+        self._height = -(-grid.height // downsampling)
+        self._width = -(-grid.width // downsampling)
+        channel_count = len(GridChannel) if body_age else GridChannel.BODY_AGE
+        self._channels = np.zeros(
+            (channel_count, self._height * downsampling, self._width * downsampling), dtype=np.float32
+        )
+        self._entered_body_at = np.zeros((grid.height, grid.width), dtype=np.int64)
+        self._body_length = 0
+        self._step = 0
+        self._food: Optional[Point] = None
+
+        snake_handler.add_listener(self)
+        self.snake_reset()
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        return self._channels.shape[0], self._height, self._width
+
+    def snake_extended(self, old_head: Point, new_head: Point) -> None:
+        self._step += 1
+        self._body_length += 1
+        self._add(GridChannel.HEAD, old_head, -1.0)
+        self._add(GridChannel.BODY, old_head, 1.0)
+        self._add(GridChannel.HEAD, new_head, 1.0)
+        if self._body_age and self._snake_handler.grid.contains(old_head):
+            self._entered_body_at[old_head.y, old_head.x] = self._step
+
+    def tail_removed(self, tail: Point) -> None:
+        self._body_length -= 1
+        self._add(GridChannel.BODY, tail, -1.0)
+
+    def snake_reset(self) -> None:
+        self._channels.fill(0.0)
+        self._food = None
+        self._add(GridChannel.HEAD, self._snake_handler.head, 1.0)
+        body = self._snake_handler.body
+        self._body_length = len(body)
+        for age, point in enumerate(body):
+            self._add(GridChannel.BODY, point, 1.0)
+            if self._body_age and self._snake_handler.grid.contains(point):
+                self._entered_body_at[point.y, point.x] = self._step - age
+
+    def _add(self, channel: GridChannel, point: Point, value: float) -> None:
+        if self._snake_handler.grid.contains(point):
+            self._channels[channel, point.y, point.x] += value
+
+    def observe(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        self._update_food()
+        if self._body_age:
+            self._update_body_age()
+        if self._downsampling == 1:
+            if out is None:
+                return self._channels
+            np.copyto(out, self._channels)
+            return out
+        blocks = self._channels.reshape(
+            (self._channels.shape[0], self._height, self._downsampling, self._width, self._downsampling)
+        )
+        return cast(np.ndarray, blocks.mean(axis=(2, 4), out=out))
+
+    def _update_food(self) -> None:
+        food = self._food_handler.get_current_food_position()
+        if food != self._food:
+            if self._food is not None:
+                self._add(GridChannel.FOOD, self._food, -1.0)
+            self._add(GridChannel.FOOD, food, 1.0)
+            self._food = food
+
+    def _update_body_age(self) -> None:
+        grid = self._snake_handler.grid
+        body_age = self._channels[GridChannel.BODY_AGE, : grid.height, : grid.width]
+        body_age.fill(0.0)
+        np.divide(
+            self._step - self._entered_body_at + 1,
+            max(self._body_length, 1),
+            out=body_age,
+            where=self._channels[GridChannel.BODY, : grid.height, : grid.width] > 0,
+        )
+
+
+class ObservationBatch:
+    def __init__(self, batch_size: int, shape: Tuple[int, ...]):
+        self._tensor = torch.zeros((batch_size, *shape), dtype=torch.float)
+        self._array = self._tensor.numpy()
+
+    @property
+    def tensor(self) -> torch.Tensor:
+        return self._tensor
+
+    @property
+    def array(self) -> np.ndarray:
+        return self._array
+
+    def write(self, index: int, observation: GridObservation) -> torch.Tensor:
+        observation.observe(out=self._array[index])
+        return self._tensor[index]
+
+    def stack(self, observations: Sequence[np.ndarray]) -> torch.Tensor:
+        size = len(observations)
+        np.stack(observations, out=self._array[:size])
+        return self._tensor[:size]
+
+
+class GridObservationFactory:
+    def __init__(self, game_configuration: GameConfig):
+        self._game_config = game_configuration
+
+    def create_grid_observation(self, game: SnakeGame) -> GridObservation:
+        return GridObservation(
+            snake_handler=game.get_snake_handler(),
+            food_handler=game.get_food_handler(),
+            body_age=self._game_config.observation_body_age,
+            downsampling=self._game_config.observation_downsampling,
+        )
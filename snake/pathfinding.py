@@ -0,0 +1,184 @@
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from snake.game_controls import Direction
+from snake.game_objects.objects import DIRECTION_DELTAS, Grid, Point, SnakeHandler
+
+MAX_EXPANSIONS = 10_000
+
+IsBlocked = Callable[[int], bool]
+
+DIRECTIONS_BY_DELTA = {delta: direction for direction, delta in DIRECTION_DELTAS.items()}
+
+
+def create_neighbour_table(grid: Grid) -> List[List[int]]:
+    neighbours: List[List[int]] = []
+    for cell in range(grid.size):
+        y, x = divmod(cell, grid.width)
+        neighbours.append(
+            [
+                neighbour_y * grid.width + neighbour_x
+                for neighbour_x, neighbour_y in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))
+                if 0 <= neighbour_x < grid.width and 0 <= neighbour_y < grid.height
+            ]
+        )
+    return neighbours
+
+
+def get_direction(grid: Grid, head: Point, neighbour_cell: int) -> Direction:
+    neighbour = grid.to_point(neighbour_cell)
+    return DIRECTIONS_BY_DELTA[Point(x=neighbour.x - head.x, y=neighbour.y - head.y)]
+
+
+def find_path(
+    grid: Grid,
+    neighbours: List[List[int]],
+    start: int,
+    goal: int,
+    is_blocked: IsBlocked,
+    *,
+    max_expansions: int = MAX_EXPANSIONS,
+) -> Optional[List[int]]:
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-locals
+    # A* with the Manhattan distance; returns the cells after start up to and including goal.
+    goal_y, goal_x = divmod(goal, grid.width)
+
+    def heuristic(cell: int) -> int:
+        y, x = divmod(cell, grid.width)
+        return abs(x - goal_x) + abs(y - goal_y)
+
+    came_from = {start: start}
+    costs = {start: 0}
+    frontier = [(heuristic(start), 0, start)]
+    expansions = 0
+    while frontier and expansions < max_expansions:
+        _, cost, cell = heapq.heappop(frontier)
+        if cell == goal:
+            path = []
+            while cell != start:
+                path.append(cell)
+                cell = came_from[cell]
+            return path[::-1]
+        if cost > costs[cell]:
+            continue
+        expansions += 1
+        for neighbour in neighbours[cell]:
+            if neighbour != goal and is_blocked(neighbour):
+                continue
+            if cost + 1 < costs.get(neighbour, grid.size):
+                costs[neighbour] = cost + 1
+                came_from[neighbour] = cell
+                heapq.heappush(frontier, (cost + 1 + heuristic(neighbour), cost + 1, neighbour))
+    return None
+
+
+def count_reachable_cells(neighbours: List[List[int]], start: int, is_blocked: IsBlocked, limit: int) -> int:
+    # Breadth-first flood fill that stops as soon as limit cells were reached.
+    seen = {start}
+    frontier: Deque[int] = deque([start])
+    while frontier and len(seen) < limit:
+        for neighbour in neighbours[frontier.popleft()]:
+            if neighbour not in seen and not is_blocked(neighbour):
+                seen.add(neighbour)
+                frontier.append(neighbour)
+    return min(len(seen), limit)
+
+
+class AbstractPathPlanner(ABC):
+    @abstractmethod
+    def next_cell(self, food_cell: int) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        pass
+
+
+class PathPlanner(AbstractPathPlanner):
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, snake_handler: SnakeHandler, max_expansions: int = MAX_EXPANSIONS):
+        self._snake_handler = snake_handler
+        self._grid = snake_handler.grid
+        self._neighbours = create_neighbour_table(self._grid)
+        self._max_expansions = max_expansions
+        self._path: Deque[int] = deque()
+        self._goal: Optional[int] = None
+        self._tail = -1
+        self._replans = 0
+        self._repairs = 0
+
+    def reset(self) -> None:
+        self._path.clear()
+        self._goal = None
+
+    def get_replan_count(self) -> int:
+        return self._replans
+
+    def get_repair_count(self) -> int:
+        return self._repairs
+
+    def next_cell(self, food_cell: int) -> Optional[int]:
+        head = self._grid.to_cell(self._snake_handler.head)
+        self._tail = self._grid.to_cell(self._snake_handler.body[-1])
+        if food_cell != self._goal or not self._path:
+            self._replan(head, food_cell)
+        elif self._is_blocked(self._path[0]) and not self._repair(head):
+            self._replan(head, food_cell)
+        if self._path and self._is_safe(head, self._path[0]):
+            return self._path.popleft()
+        self._path.clear()
+        return self._most_spacious_neighbour(head)
+
+    def _replan(self, head: int, food_cell: int) -> None:
+        self._replans += 1
+        self._goal = food_cell
+        path = find_path(
+            self._grid, self._neighbours, head, food_cell, self._is_blocked, max_expansions=self._max_expansions
+        )
+        self._path = deque(path or [])
+
+    def _repair(self, head: int) -> bool:
+        # Detour around the blocked cells to the first free cell of the cached path and keep the rest of it.
+        for index, cell in enumerate(self._path):
+            if not self._is_blocked(cell):
+                detour = find_path(
+                    self._grid, self._neighbours, head, cell, self._is_blocked, max_expansions=self._max_expansions
+                )
+                if detour is None:
+                    return False
+                remaining = list(self._path)[index + 1 :]
+                self._path = deque(detour + remaining)
+                self._repairs += 1
+                return True
+        return False
+
+    def _is_blocked(self, cell: int) -> bool:
+        # The tail moves away during the next step, so its cell counts as free.
+        return bool(self._snake_handler.occupancy[cell]) and cell != self._tail
+
+    def _is_safe(self, head: int, cell: int) -> bool:
+        snake_length = len(self._snake_handler.body) + 1
+        reachable_cells = count_reachable_cells(
+            self._neighbours,
+            cell,
+            lambda neighbour: neighbour == head or self._is_blocked(neighbour),
+            limit=snake_length,
+        )
+        return reachable_cells >= snake_length
+
+    def _most_spacious_neighbour(self, head: int) -> Optional[int]:
+        limit = len(self._snake_handler.body) + 1
+        candidates = [
+            (
+                count_reachable_cells(
+                    self._neighbours, neighbour, lambda cell: cell == head or self._is_blocked(cell), limit=limit
+                ),
+                neighbour,
+            )
+            for neighbour in self._neighbours[head]
+            if not self._is_blocked(neighbour)
+        ]
+        return max(candidates)[1] if candidates else None
@@ -0,0 +1,59 @@
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from snake.metrics import SUMMARY_WINDOW, read_metrics
+
+PLOTTED_METRICS = ["score", "reward_sum", "steps", "loss", "epsilon", "steps_per_second"]
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    cumulative = np.cumsum(np.insert(values, 0, 0.0))
+    counts = np.minimum(np.arange(1, len(values) + 1), window)
+    averages: np.ndarray = (cumulative[1:] - cumulative[np.arange(1, len(values) + 1) - counts]) / counts
+    return averages
+
+
+def load_columns(path: Path) -> Dict[str, np.ndarray]:
+    rows: List[Dict[str, float]] = list(read_metrics(path))
+    return {name: np.array([row[name] for row in rows], dtype=float) for name in rows[0]} if rows else {}
+
+
+def plot_metrics(path: Path, output: Path, window: int) -> None:
+    # matplotlib is only needed for plotting, never for training.
+    import matplotlib  # pylint: disable=import-outside-toplevel
+
+    matplotlib.use("Agg")
+    from matplotlib import pyplot  # pylint: disable=import-outside-toplevel
+
+    columns = load_columns(path)
+    if not columns:
+        raise ValueError(f"No metrics found in {path}.")
+    figure, axes = pyplot.subplots(nrows=len(PLOTTED_METRICS), sharex=True, figsize=(10, 2.5 * len(PLOTTED_METRICS)))
+    for axis, name in zip(axes, PLOTTED_METRICS):
+        axis.plot(columns["episode"], columns[name], alpha=0.3, label=name)
+        axis.plot(columns["episode"], moving_average(columns[name], window), label=f"moving average ({window})")
+        axis.set_ylabel(name)
+        axis.legend(loc="upper left")
+    axes[-1].set_xlabel("episode")
+    figure.tight_layout()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    figure.savefig(output)
+    pyplot.close(figure)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Plot learning progress from a training metrics file.")
+    parser.add_argument("path", type=Path, nargs="?", default=Path("metrics/training.jsonl"))
+    parser.add_argument("--output", type=Path, default=Path("metrics/training.png"))
+    parser.add_argument("--window", type=int, default=SUMMARY_WINDOW)
+    args = parser.parse_args()
+
+    plot_metrics(args.path, args.output, args.window)
+    print(f"Saved plot to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+
+from snake.config import GameConfig
+
+PERCENTILES = (50, 99)
+
+
+class PhaseHistogram:
+    def __init__(self, window: int):
+        self._durations_ns = np.zeros(window, dtype=np.int64)
+        self._count = 0
+
+    def add(self, duration_ns: int) -> None:
+        self._durations_ns[self._count % len(self._durations_ns)] = duration_ns
+        self._count += 1
+
+    def get_count(self) -> int:
+        return self._count
+
+    def get_percentiles_ns(self) -> Dict[int, float]:
+        durations_ns = self._durations_ns[: min(self._count, len(self._durations_ns))]
+        if not durations_ns.size:
+            return {percentile: 0.0 for percentile in PERCENTILES}
+        return dict(zip(PERCENTILES, np.percentile(durations_ns, PERCENTILES).tolist()))
+
+
+class AbstractStepProfiler(ABC):
+    @abstractmethod
+    def begin_step(self) -> int:
+        pass
+
+    @abstractmethod
+    def record(self, phase: str, started_at_ns: int) -> int:
+        pass
+
+    @abstractmethod
+    def end_step(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_summary(self) -> str:
+        pass
+
+
+class NoStepProfiler(AbstractStepProfiler):
+    def begin_step(self) -> int:
+        return 0
+
+    def record(self, phase: str, started_at_ns: int) -> int:
+        return 0
+
+    def end_step(self) -> None:
+        pass
+
+    def get_summary(self) -> str:
+        return ""
+
+
+class StepProfiler(AbstractStepProfiler):
+    # pylint: disable=too-many-instance-attributes
+    def __init__(
+        self,
+        window: int,
+        trace_start: int = 0,
+        trace_steps: int = 0,
+        trace_path: Union[str, Path] = "step_trace.json",
+    ):
+        self._window = window
+        self._histograms: Dict[str, PhaseHistogram] = {}
+        self._trace_start = trace_start
+        self._trace_stop = trace_start + trace_steps
+        self._trace_path = Path(trace_path)
+        self._trace_events: List[Dict] = []
+        self._tracing = False
+        self._step = 0
+        self._depth = 0
+
+    def begin_step(self) -> int:
+        if self._depth == 0:
+            self._tracing = self._trace_start <= self._step < self._trace_stop
+        self._depth += 1
+        return time.perf_counter_ns()
+
+    def record(self, phase: str, started_at_ns: int) -> int:
+        now_ns = time.perf_counter_ns()
+        histogram = self._histograms.get(phase)
+        if histogram is None:
+            histogram = self._histograms[phase] = PhaseHistogram(self._window)
+        histogram.add(now_ns - started_at_ns)
+        if self._tracing:
+            self._trace_events.append(
+                {
+                    "name": phase,
+                    "cat": phase.split(".", maxsplit=1)[0],
+                    "ph": "X",
+                    "ts": started_at_ns / 1_000,
+                    "dur": (now_ns - started_at_ns) / 1_000,
+                    "pid": 0,
+                    "tid": 0,
+                    "args": {"step": self._step},
+                }
+            )
+        # Read the clock again so the bookkeeping above is not billed to the next phase.
+        return time.perf_counter_ns()
+
+    def end_step(self) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+        self._step += 1
+        if self._tracing and self._step == self._trace_stop:
+            self.write_chrome_trace(self._trace_path)
+
+    def write_chrome_trace(self, path: Union[str, Path]) -> None:
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump({"traceEvents": self._trace_events, "displayTimeUnit": "ns"}, trace_file)
+
+    def get_step_count(self) -> int:
+        return self._step
+
+    def get_percentiles_ns(self) -> Dict[str, Dict[int, float]]:
+        # Copy the items first, the metrics server reads them while the game loop may add a phase.
+        return {phase: histogram.get_percentiles_ns() for phase, histogram in list(self._histograms.items())}
+
+    def get_summary(self) -> str:
+        lines = [f"{'phase':<24} {'calls':>10} {'p50 ns':>12} {'p99 ns':>12}"]
+        for phase, histogram in self._histograms.items():
+            percentiles = histogram.get_percentiles_ns()
+            lines.append(f"{phase:<24} {histogram.get_count():>10} {percentiles[50]:>12.0f} {percentiles[99]:>12.0f}")
+        return "\n".join(lines)
+
+
+def create_step_profiler(game_config: GameConfig) -> AbstractStepProfiler:
+    if not game_config.profiling:
+        return NoStepProfiler()
+    return StepProfiler(
+        window=game_config.profiling_window,
+        trace_start=game_config.profiling_trace_start,
+        trace_steps=game_config.profiling_trace_steps,
+        trace_path=game_config.profiling_trace_path,
+    )
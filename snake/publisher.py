@@ -1,31 +1,29 @@
 from abc import ABC, abstractmethod
 from enum import Enum, auto
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Iterable, List
 
 
 class PublisherEvents(Enum):
     COLLISION_DETECTED = auto()
     REACHED_FOOD = auto()
     NO_COLLISION = auto()
+    LOOP_DETECTED = auto()
 
 
 class AbstractSubscriber(ABC):
     def get_notified(self, event: PublisherEvents) -> None:
-        if self._subscribed(event):
-            handler = self._get_handler_for_event(event)
+        handler = self._subscribed_events.get(event)
+        if handler:
             handler()
 
-    def _subscribed(self, event: PublisherEvents) -> bool:
-        return event in self._subscribed_events
+    def get_event_handlers(self) -> Dict[PublisherEvents, Callable]:
+        return self._subscribed_events
 
     @property
     @abstractmethod
     def _subscribed_events(self) -> Dict[PublisherEvents, Callable]:
         pass
 
-    def _get_handler_for_event(self, event: PublisherEvents) -> Callable:
-        return self._subscribed_events[event]
-
 
 class ScoreSubscriber(AbstractSubscriber):
     def __init__(self, remuneration: Dict[str, int]):
@@ -42,14 +40,16 @@ class ScoreSubscriber(AbstractSubscriber):
 
 
 class RewardSubscriber(AbstractSubscriber):
-    def __init__(self, remuneration: Dict[str, int]):
+    def __init__(self, remuneration: Dict[str, int], loop_penalty: int = -10):
         self._remuneration = remuneration
+        self._loop_penalty = loop_penalty
 
     @property
     def _subscribed_events(self) -> Dict[PublisherEvents, Callable]:
         return {
             PublisherEvents.REACHED_FOOD: self._increase_reward,
             PublisherEvents.COLLISION_DETECTED: self._decrease_reward,
+            PublisherEvents.LOOP_DETECTED: self._penalize_loop,
         }
 
     def _increase_reward(self) -> None:
@@ -58,6 +58,9 @@ class RewardSubscriber(AbstractSubscriber):
     def _decrease_reward(self) -> None:
         self._remuneration["reward"] = -10
 
+    def _penalize_loop(self) -> None:
+        self._remuneration["reward"] = self._loop_penalty
+
 
 class NoCollisionSubscriber(AbstractSubscriber):
     def __init__(self, remuneration: Dict[str, int]):
@@ -82,17 +85,29 @@ class AbstractPublisher(ABC):
     def publish_one_event(self, event: PublisherEvents) -> None:
         pass
 
+    @abstractmethod
+    def publish_events(self, events: Iterable[PublisherEvents]) -> None:
+        pass
+
 
 class Publisher(AbstractPublisher):
     def __init__(self):
         self._subscribers: List[AbstractSubscriber] = []
+        self._handlers: Dict[PublisherEvents, List[Callable]] = {event: [] for event in PublisherEvents}
 
     def add_subscriber(self, subscriber: AbstractSubscriber):
         self._subscribers.append(subscriber)
+        for event, handler in subscriber.get_event_handlers().items():
+            self._handlers[event].append(handler)
 
     def publish_one_event(self, event: PublisherEvents) -> None:
-        for subscriber in self._subscribers:
-            subscriber.get_notified(event)
+        for handler in self._handlers[event]:
+            handler()
+
+    def publish_events(self, events: Iterable[PublisherEvents]) -> None:
+        for event in events:
+            for handler in self._handlers[event]:
+                handler()
 
     @property
     def subscribers(self) -> List[AbstractSubscriber]:
@@ -1,8 +1,31 @@
-from pygame import K_DOWN, K_LEFT, K_RIGHT, K_UP, KEYDOWN, QUIT
+from pygame import (
+    K_DOWN,
+    K_EQUALS,
+    K_KP_MINUS,
+    K_KP_PLUS,
+    K_LEFT,
+    K_MINUS,
+    K_PLUS,
+    K_RIGHT,
+    K_UP,
+    KEYDOWN,
+    QUIT,
+    K_d,
+    K_f,
+    K_w,
+)
 
 PYGAME_K_DOWN = K_DOWN
 PYGAME_K_LEFT = K_LEFT
 PYGAME_K_RIGHT = K_RIGHT
 PYGAME_K_UP = K_UP
+PYGAME_K_W = K_w
+PYGAME_K_F = K_f
+PYGAME_K_D = K_d
+PYGAME_K_PLUS = K_PLUS
+PYGAME_K_KP_PLUS = K_KP_PLUS
+PYGAME_K_EQUALS = K_EQUALS
+PYGAME_K_MINUS = K_MINUS
+PYGAME_K_KP_MINUS = K_KP_MINUS
 PYGAME_KEYDOWN = KEYDOWN
 PYGAME_QUIT = QUIT
@@ -1,13 +1,75 @@
-from typing import Tuple
+from __future__ import annotations
 
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
 import pygame
 
 from snake.config import GameConfig, WindowConfig
-from snake.fonts import Arial
 from snake.game_objects.objects import FoodHandler, Point, SnakeHandler
+from snake.pygame_interface.render_assets import RenderAssets
+
+
+@dataclass(frozen=True)
+class GameSnapshot:
+    snake: Tuple[Point, ...]
+    food: Point
+    score: int
+    overlay: str = ""
+
+    @staticmethod
+    def from_handlers(
+        snake_handler: SnakeHandler, food_handler: FoodHandler, score: int, overlay: str = ""
+    ) -> GameSnapshot:
+        return GameSnapshot(
+            snake=tuple(snake_handler.get_snake()),
+            food=food_handler.get_current_food_position(),
+            score=score,
+            overlay=overlay,
+        )
+
+
+class AbstractGameUI(ABC):
+    @abstractmethod
+    def update_snake_food_and_text(self, score: int, overlay: str = "") -> None:
+        pass
+
+    @abstractmethod
+    def draw(self, snapshot: GameSnapshot) -> None:
+        pass
+
+    @abstractmethod
+    def update_clock(self) -> None:
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        pass
+
+
+class HeadlessGameUI(AbstractGameUI):
+    def update_snake_food_and_text(self, score: int, overlay: str = "") -> None:
+        pass
+
+    def draw(self, snapshot: GameSnapshot) -> None:
+        pass
+
+    def update_clock(self) -> None:
+        pass
 
+    def reset(self) -> None:
+        pass
 
-class GameUI:
+
+class GameUI(AbstractGameUI):
+    # pylint: disable=too-many-instance-attributes
+    # Frames are drawn from snapshots only, so a render thread never reads the snake while the game moves it. Between
+    # two snapshots of the same game the snake gained new head cells and lost tail cells; finding the previous head in
+    # the new snapshot gives both, so a frame only redraws those cells and never walks the body. Snapshots that do not
+    # continue the drawn one, e.g. after a restore, are drawn from scratch.
     def __init__(
         self,
         window_config: WindowConfig,
@@ -19,60 +81,207 @@ class GameUI:
         self._game_config = game_config
         self._display = pygame.display.set_mode((window_config.width, window_config.height))
         self._clock = pygame.time.Clock()
+        self._assets = RenderAssets(window_config=window_config, game_config=game_config)
         self._snake_handler = snake_handler
         self._food_handler = food_handler
 
+        self._drawn_snake: Tuple[Point, ...] = ()
+        self._drawn_snake_cells: Counter[Point] = Counter()
+        self._drawn_food: Optional[Point] = None
+        self._drawn_text: Optional[Tuple[int, str]] = None
+        self._text_rect = pygame.Rect(0, 0, 0, 0)
+        self._full_redraw_needed = True
+
         pygame.display.set_caption(self.__class__.__name__)
 
-    def update_snake_food_and_text(self, score: int):
+    def reset(self) -> None:
+        self._full_redraw_needed = True
+
+    def update_snake_food_and_text(self, score: int, overlay: str = ""):
+        self.draw(GameSnapshot.from_handlers(self._snake_handler, self._food_handler, score=score, overlay=overlay))
+
+    def draw(self, snapshot: GameSnapshot) -> None:
+        snake_changes = None if self._full_redraw_needed else self._find_snake_changes(snapshot.snake)
+        if snake_changes is None:
+            self._redraw_everything(snapshot)
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._redraw_changes(snapshot, *snake_changes))
+
+    def _find_snake_changes(self, snake: Tuple[Point, ...]) -> Optional[Tuple[Tuple[Point, ...], Tuple[Point, ...]]]:
+        drawn_snake = self._drawn_snake
+        if not drawn_snake:
+            return None
+        for moves, cell in enumerate(snake):
+            if cell == drawn_snake[0]:
+                kept = len(snake) - moves
+                if kept <= len(drawn_snake) and snake[-1] == drawn_snake[kept - 1]:
+                    return snake[:moves], drawn_snake[kept:]
+                return None
+        return None
+
+    def _redraw_everything(self, snapshot: GameSnapshot) -> None:
+        self._full_redraw_needed = False
+        food = snapshot.food
+        self._drawn_snake = snapshot.snake
+        self._drawn_snake_cells = Counter(snapshot.snake)
         self._set_background_color()
-        self._draw_snake()
-        self._draw_food()
-        self._draw_score_text(score)
-        pygame.display.flip()
+        self._draw_cells([*snapshot.snake, food], food=food)
+        self._draw_text(snapshot)
+        self._drawn_food = food
+
+    def _redraw_changes(
+        self, snapshot: GameSnapshot, new_cells: Tuple[Point, ...], left_cells: Tuple[Point, ...]
+    ) -> List[pygame.Rect]:
+        food = snapshot.food
+        self._drawn_snake = snapshot.snake
+        self._drawn_snake_cells.update(new_cells)
+        self._drawn_snake_cells.subtract(left_cells)
+        for cell in left_cells:
+            if self._drawn_snake_cells[cell] <= 0:
+                del self._drawn_snake_cells[cell]
+        changed_cells = {*new_cells, *left_cells}
+        if food != self._drawn_food:
+            changed_cells.add(food)
+            if self._drawn_food is not None:
+                changed_cells.add(self._drawn_food)
+
+        self._draw_cells(changed_cells, food=food)
+        dirty_rects = [self._calculate_cell_rect(cell) for cell in changed_cells]
+
+        if (snapshot.score, snapshot.overlay) != self._drawn_text or self._text_rect.collidelist(dirty_rects) != -1:
+            dirty_rects.append(self._redraw_text_area(snapshot, food=food))
+
+        self._drawn_food = food
+        return dirty_rects
+
+    def _draw_cells(self, cells: Iterable[Point], food: Point) -> None:
+        self._display.blits(
+            [(self._select_block(cell, food=food), self._convert_cell_to_pixels(cell)) for cell in cells],
+            doreturn=False,
+        )
+
+    def _select_block(self, cell: Point, food: Point) -> pygame.Surface:
+        if cell in self._drawn_snake_cells:
+            return self._assets.snake_block
+        if cell == food:
+            return self._assets.food_block
+        return self._assets.background_block
+
+    def _calculate_cell_rect(self, cell: Point) -> pygame.Rect:
+        block_size = self._game_config.outer_block_size
+        return pygame.Rect(cell.x * block_size, cell.y * block_size, block_size, block_size)
+
+    def _redraw_text_area(self, snapshot: GameSnapshot, food: Point) -> pygame.Rect:
+        text_area = self._text_rect.union(self._calculate_text_rect(snapshot))
+        self._draw_cells(self._calculate_cells_in_area(text_area), food=food)
+        self._draw_text(snapshot)
+        return text_area
+
+    def _calculate_text_rect(self, snapshot: GameSnapshot) -> pygame.Rect:
+        score_rect = self._assets.get_score_text(snapshot.score).get_rect()
+        if not snapshot.overlay:
+            return score_rect
+        return score_rect.union(self._assets.get_overlay_text(snapshot.overlay).get_rect(top=score_rect.bottom))
+
+    def _calculate_cells_in_area(self, area: pygame.Rect) -> List[Point]:
+        block_size = self._game_config.outer_block_size
+        return [
+            Point(x=x, y=y)
+            for x in range(area.left // block_size, (area.right - 1) // block_size + 1)
+            for y in range(area.top // block_size, (area.bottom - 1) // block_size + 1)
+        ]
 
     def _set_background_color(self) -> None:
         self._display.fill(self._window_config.background_color)
 
-    def _draw_snake(self) -> None:
-        block_margin = self._calculate_block_margin()
-        for element in self._snake_handler.get_snake():
-            self._draw_square(
-                x=element.x,
-                y=element.y,
-                color=self._game_config.outer_block_color,
-                size=self._game_config.outer_block_size,
-            )
-            self._draw_square(
-                x=element.x + block_margin,
-                y=element.y + block_margin,
-                color=self._game_config.inner_block_color,
-                size=self._game_config.inner_block_size,
-            )
-
-    def _calculate_block_margin(self) -> int:
-        return abs(self._game_config.outer_block_size - self._game_config.inner_block_size) // 2
-
-    def _draw_square(self, x: int, y: int, color: Tuple[int, int, int], size: int) -> None:
-        pygame.draw.rect(surface=self._display, color=color, rect=pygame.Rect(x, y, size, size))
-
-    def _draw_food(self) -> None:
-        food_position = self._calculate_food_position_with_margin()
-        self._draw_square(
-            *food_position,
-            color=self._game_config.food_color,
-            size=self._game_config.inner_block_size,
+    def _convert_cell_to_pixels(self, point: Point) -> Point:
+        return Point(x=point.x * self._game_config.outer_block_size, y=point.y * self._game_config.outer_block_size)
+
+    def _draw_text(self, snapshot: GameSnapshot):
+        score_text = self._assets.get_score_text(snapshot.score)
+        self._display.blit(score_text, [0, 0])
+        if snapshot.overlay:
+            self._display.blit(self._assets.get_overlay_text(snapshot.overlay), [0, score_text.get_height()])
+        self._text_rect = self._calculate_text_rect(snapshot)
+        self._drawn_text = (snapshot.score, snapshot.overlay)
+
+    def update_clock(self) -> None:
+        self._clock.tick(self._game_config.frame_rate)
+
+
+class FramebufferGameUI(AbstractGameUI):
+    # pylint: disable=too-many-instance-attributes
+    BACKGROUND, SNAKE, FOOD = range(3)
+
+    def __init__(
+        self,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+    ):
+        self._window_config = window_config
+        self._game_config = game_config
+        self._display = pygame.display.set_mode((window_config.width, window_config.height))
+        self._clock = pygame.time.Clock()
+        self._assets = RenderAssets(window_config=window_config, game_config=game_config)
+        self._snake_handler = snake_handler
+        self._food_handler = food_handler
+
+        grid = snake_handler.grid
+        self._palette = np.array(
+            [window_config.background_color, game_config.inner_block_color, game_config.food_color], dtype=np.uint8
+        )
+        self._labels = np.zeros(grid.size, dtype=np.intp)
+        self._frame = np.zeros((grid.width, grid.height, 3), dtype=np.uint8)
+        self._cell_surface = pygame.Surface((grid.width, grid.height))
+        self._board = self._display.subsurface(
+            pygame.Rect(0, 0, grid.width * game_config.outer_block_size, grid.height * game_config.outer_block_size)
         )
 
-    def _calculate_food_position_with_margin(self) -> Point:
-        block_margin = self._calculate_block_margin()
-        food_position = self._food_handler.get_current_food_position()
-        return Point(x=food_position.x + block_margin, y=food_position.y + block_margin)
+        pygame.display.set_caption(self.__class__.__name__)
+
+    def reset(self) -> None:
+        pass
+
+    def update_snake_food_and_text(self, score: int, overlay: str = "") -> None:
+        self._update_labels_from_handlers()
+        self._present_frame(score, overlay)
+
+    def draw(self, snapshot: GameSnapshot) -> None:
+        self._update_labels_from_snapshot(snapshot)
+        self._present_frame(snapshot.score, snapshot.overlay)
+
+    def _present_frame(self, score: int, overlay: str) -> None:
+        grid = self._snake_handler.grid
+        self._palette.take(self._labels.reshape(grid.height, grid.width).T, axis=0, out=self._frame)
+        pygame.surfarray.blit_array(self._cell_surface, self._frame)
+        pygame.transform.scale(self._cell_surface, self._board.get_size(), self._board)
+        score_text = self._assets.get_score_text(score)
+        self._display.blit(score_text, (0, 0))
+        if overlay:
+            self._display.blit(self._assets.get_overlay_text(overlay), (0, score_text.get_height()))
+        pygame.display.flip()
+
+    def _update_labels_from_handlers(self) -> None:
+        grid = self._snake_handler.grid
+        np.minimum(self._snake_handler.occupancy, self.SNAKE, out=self._labels)
+        head = self._snake_handler.head
+        if grid.contains(head):
+            self._labels[grid.to_cell(head)] = self.SNAKE
+        self._labels[self._food_handler.get_current_food_cell()] = self.FOOD
+
+    def _update_labels_from_snapshot(self, snapshot: GameSnapshot) -> None:
+        grid = self._snake_handler.grid
+        snake = np.array(snapshot.snake, dtype=np.intp).reshape(-1, 2)
+        on_grid = (snake[:, 0] >= 0) & (snake[:, 0] < grid.width) & (snake[:, 1] >= 0) & (snake[:, 1] < grid.height)
+        self._labels.fill(self.BACKGROUND)
+        self._labels[snake[on_grid, 1] * grid.width + snake[on_grid, 0]] = self.SNAKE
+        self._labels[grid.to_cell(snapshot.food)] = self.FOOD
 
-    def _draw_score_text(self, score: int):
-        font = Arial(font_size=25).font
-        text = font.render(f"Score {score}", True, self._window_config.font_color)
-        self._display.blit(text, [0, 0])
+    def get_frame(self) -> np.ndarray:
+        return self._frame
 
     def update_clock(self) -> None:
         self._clock.tick(self._game_config.frame_rate)
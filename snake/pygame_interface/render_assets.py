@@ -0,0 +1,52 @@
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from snake.config import GameConfig, WindowConfig
+from snake.fonts import Arial
+
+SCORE_FONT_SIZE = 25
+
+
+class RenderAssets:
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, window_config: WindowConfig, game_config: GameConfig):
+        self._window_config = window_config
+        self._game_config = game_config
+        self._font = Arial(font_size=SCORE_FONT_SIZE).font
+        self._score_texts: Dict[int, pygame.Surface] = {}
+        self._overlay_text = ""
+        self._overlay_surface = self._font.render("", True, window_config.font_color)
+
+        self.snake_block = self._create_block(game_config.outer_block_color, inner_color=game_config.inner_block_color)
+        self.food_block = self._create_block(window_config.background_color, inner_color=game_config.food_color)
+        self.background_block = self._create_block(window_config.background_color)
+
+    def _create_block(
+        self, outer_color: Tuple[int, int, int], inner_color: Optional[Tuple[int, int, int]] = None
+    ) -> pygame.Surface:
+        block_size = self._game_config.outer_block_size
+        block = pygame.Surface((block_size, block_size))
+        block.fill(outer_color)
+        if inner_color is not None:
+            block.fill(inner_color, self._calculate_inner_rect())
+        return block
+
+    def _calculate_inner_rect(self) -> pygame.Rect:
+        block_margin = abs(self._game_config.outer_block_size - self._game_config.inner_block_size) // 2
+        return pygame.Rect(
+            block_margin, block_margin, self._game_config.inner_block_size, self._game_config.inner_block_size
+        )
+
+    def get_score_text(self, score: int) -> pygame.Surface:
+        text = self._score_texts.get(score)
+        if text is None:
+            text = self._font.render(f"Score {score}", True, self._window_config.font_color)
+            self._score_texts[score] = text
+        return text
+
+    def get_overlay_text(self, text: str) -> pygame.Surface:
+        if text != self._overlay_text:
+            self._overlay_surface = self._font.render(text, True, self._window_config.font_color)
+            self._overlay_text = text
+        return self._overlay_surface
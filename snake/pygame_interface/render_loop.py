@@ -0,0 +1,83 @@
+import threading
+from typing import Optional
+
+import pygame
+
+from snake.game_objects.objects import FoodHandler, SnakeHandler
+from snake.pygame_interface.game_ui import AbstractGameUI, GameSnapshot
+
+
+class SnapshotBuffer:
+    # The simulation and the render thread hand snapshots over by swapping a single reference. Snapshots are
+    # immutable, so the reader keeps drawing its front buffer while the writer fills the next one.
+    def __init__(self):
+        self._latest: Optional[GameSnapshot] = None
+        self._snapshot_requested: bool = True
+
+    def snapshot_requested(self) -> bool:
+        return self._snapshot_requested
+
+    def request_snapshot(self) -> None:
+        self._snapshot_requested = True
+
+    def publish(self, snapshot: GameSnapshot) -> None:
+        self._snapshot_requested = False
+        self._latest = snapshot
+
+    def latest(self) -> Optional[GameSnapshot]:
+        return self._latest
+
+
+class RenderThread(threading.Thread):
+    def __init__(self, game_ui: AbstractGameUI, snapshot_buffer: SnapshotBuffer):
+        super().__init__(name=self.__class__.__name__, daemon=True)
+        self._game_ui = game_ui
+        self._snapshot_buffer = snapshot_buffer
+        self._stop_event = threading.Event()
+        self._drawn_snapshot: Optional[GameSnapshot] = None
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            self.render_latest_snapshot()
+            self._game_ui.update_clock()
+
+    def render_latest_snapshot(self) -> None:
+        snapshot = self._snapshot_buffer.latest()
+        if snapshot is not None and snapshot is not self._drawn_snapshot:
+            self._game_ui.draw(snapshot)
+            self._drawn_snapshot = snapshot
+        self._snapshot_buffer.request_snapshot()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
+
+class DecoupledGameUI(AbstractGameUI):
+    def __init__(self, game_ui: AbstractGameUI, snake_handler: SnakeHandler, food_handler: FoodHandler):
+        self._game_ui = game_ui
+        self._snake_handler = snake_handler
+        self._food_handler = food_handler
+        self._snapshot_buffer = SnapshotBuffer()
+        self._render_thread = RenderThread(game_ui=game_ui, snapshot_buffer=self._snapshot_buffer)
+        self._render_thread.start()
+        pygame.register_quit(self.close)  # pylint: disable=E1101
+
+    def update_snake_food_and_text(self, score: int, overlay: str = "") -> None:
+        if self._snapshot_buffer.snapshot_requested():
+            self._snapshot_buffer.publish(
+                GameSnapshot.from_handlers(self._snake_handler, self._food_handler, score=score, overlay=overlay)
+            )
+
+    def draw(self, snapshot: GameSnapshot) -> None:
+        self._snapshot_buffer.publish(snapshot)
+
+    def update_clock(self) -> None:
+        pass
+
+    def reset(self) -> None:
+        self._game_ui.reset()
+
+    def close(self) -> None:
+        self._render_thread.stop()
@@ -0,0 +1,21 @@
+from enum import IntEnum, auto
+from typing import Optional
+
+import numpy as np
+
+
+class RandomStream(IntEnum):
+    FOOD = auto()
+    AGENT = auto()
+    ZOBRIST = auto()
+    SWEEP = auto()
+
+
+def create_random_generator(seed: Optional[int], stream: RandomStream, *keys: int) -> np.random.Generator:
+    return np.random.default_rng(np.random.SeedSequence(entropy=seed, spawn_key=(int(stream), *keys)))
+
+
+def derive_seed(seed: Optional[int], *keys: int) -> Optional[int]:
+    if seed is None:
+        return None
+    return int(np.random.SeedSequence(entropy=seed, spawn_key=keys).generate_state(n_words=1)[0])
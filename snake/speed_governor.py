@@ -0,0 +1,70 @@
+import time
+from typing import Optional
+
+from snake.config import GameConfig
+from snake.game_controls import SpeedMode
+
+MAX_FRAME_SKIP = 4_096
+STEP_RATE_INTERVAL_S = 0.5
+
+
+class StepRateMeter:
+    def __init__(self, interval_s: float = STEP_RATE_INTERVAL_S):
+        self._interval_s = interval_s
+        self._steps = 0
+        self._started_at = time.perf_counter()
+        self._steps_per_second = 0.0
+
+    def count_step(self) -> None:
+        self._steps += 1
+        now = time.perf_counter()
+        elapsed = now - self._started_at
+        if elapsed >= self._interval_s:
+            self._steps_per_second = self._steps / elapsed
+            self._steps = 0
+            self._started_at = now
+
+    def get_steps_per_second(self) -> float:
+        return self._steps_per_second
+
+
+class SpeedGovernor:
+    def __init__(self, game_config: GameConfig):
+        self._speed_mode = SpeedMode[game_config.speed_mode]
+        self._frame_skip = game_config.frame_skip
+        self._step_rate_meter = StepRateMeter()
+        self._steps = 0
+
+    def update(self, speed_mode: Optional[SpeedMode], frame_skip_change: int = 0) -> None:
+        self._speed_mode = speed_mode or self._speed_mode
+        if frame_skip_change >= 0:
+            frame_skip = self._frame_skip << frame_skip_change
+        else:
+            frame_skip = self._frame_skip >> -frame_skip_change
+        self._frame_skip = min(max(frame_skip, 1), MAX_FRAME_SKIP)
+
+    def count_step(self) -> None:
+        self._steps += 1
+        self._step_rate_meter.count_step()
+
+    def should_render(self) -> bool:
+        if self._speed_mode is SpeedMode.DARK:
+            return False
+        if self._speed_mode is SpeedMode.FAST:
+            return self._steps % self._frame_skip == 0
+        return True
+
+    def should_pace(self) -> bool:
+        return self._speed_mode is SpeedMode.WATCH
+
+    def get_overlay_text(self) -> str:
+        overlay = f"{self._speed_mode.name} {self._step_rate_meter.get_steps_per_second():.0f} steps/s"
+        if self._speed_mode is SpeedMode.FAST:
+            overlay += f" 1/{self._frame_skip}"
+        return overlay
+
+    def get_speed_mode(self) -> SpeedMode:
+        return self._speed_mode
+
+    def get_frame_skip(self) -> int:
+        return self._frame_skip
@@ -1,18 +1,27 @@
-from typing import List
+from typing import List, Optional, Tuple, cast
 
 import numpy as np
 
+from snake.bitboard import SnakeBitboard
 from snake.collision_checker import CollisionChecker
 from snake.config import GameConfig
 from snake.game import SnakeGame
 from snake.game_controls import Direction
 from snake.game_objects.objects import Point
 
+CLOCK_WISE_DIRECTIONS = [Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP]
+CLOCK_WISE_UNIT_STEPS = np.array([[1, 0], [0, 1], [-1, 0], [0, -1]])
+
 
 class State:
-    def __init__(self, game: SnakeGame, game_config: GameConfig):
+    def __init__(
+        self, game: SnakeGame, snake_bitboard: Optional[SnakeBitboard] = None, reachable_area_features: bool = False
+    ):
         self._game = game
-        self._block_size = game_config.outer_block_size
+        self._snake_bitboard = snake_bitboard
+        self._reachable_area_features = reachable_area_features
+        self._reachable_cells_key: Optional[Tuple[int, Direction]] = None
+        self._reachable_cells: List[int] = []
 
     @property
     def _collision_checker(self) -> CollisionChecker:
@@ -24,43 +33,44 @@ class State:
         hazards = self.calculate_location_of_hazard_as_binary()
         direction = self.convert_direction_to_binary()
         food_position = self.calculate_current_food_position_relative_to_snake_as_binary()
+        if self._reachable_area_features:
+            hazards = hazards + self.calculate_enclosed_space_as_binary()
 
         return np.array(hazards + direction + food_position, dtype=int)
 
-    # ToDo: refactor
     def calculate_location_of_hazard_as_binary(self) -> List[int]:
         snake_head = self._game.get_snake()[0]
         direction = self._game.get_current_direction()
+        neighbours = self._calculate_relative_neighbours(snake_head, direction)
+        return cast(List[int], self._collision_checker.wall_collisions(neighbours).tolist())
 
-        point_above = Point(x=snake_head.x, y=snake_head.y - self._block_size)
-        point_below = Point(x=snake_head.x, y=snake_head.y + self._block_size)
-        point_left_side = Point(x=snake_head.x - self._block_size, y=snake_head.y)
-        point_right_side = Point(x=snake_head.x + self._block_size, y=snake_head.y)
+    def calculate_enclosed_space_as_binary(self) -> List[int]:
+        # 1 for a relative move into an area with fewer free cells than the snake is long, which traps the snake.
+        return [int(not is_safe) for is_safe in self.calculate_safe_moves()]
 
-        hazard_straight = (
-            (direction is Direction.RIGHT and self._collision_checker.point_right_boundary_collision(point_right_side))
-            or (direction is Direction.LEFT and self._collision_checker.point_left_boundary_collision(point_left_side))
-            or (direction is Direction.UP and self._collision_checker.point_top_collision(point_above))
-            or (direction is Direction.DOWN and self._collision_checker.point_bottem_collision(point_below))
-        )
-
-        hazard_right = (
-            (direction is Direction.RIGHT and self._collision_checker.point_bottem_collision(point_below))
-            or (direction is Direction.LEFT and self._collision_checker.point_top_collision(point_above))
-            or (direction is Direction.UP and self._collision_checker.point_right_boundary_collision(point_right_side))
-            or (direction is Direction.DOWN and self._collision_checker.point_left_boundary_collision(point_left_side))
-        )
+    def calculate_safe_moves(self) -> List[bool]:
+        snake_length = len(self._game.get_snake())
+        return [reachable_cells >= snake_length for reachable_cells in self.calculate_reachable_cells()]
 
-        hazard_left = (
-            (direction is Direction.RIGHT and self._collision_checker.point_top_collision(point_above))
-            or (direction is Direction.LEFT and self._collision_checker.point_bottem_collision(point_below))
-            or (direction is Direction.UP and self._collision_checker.point_left_boundary_collision(point_left_side))
-            or (
-                direction is Direction.DOWN and self._collision_checker.point_right_boundary_collision(point_right_side)
-            )
-        )
-
-        return [hazard_straight, hazard_right, hazard_left]
+    def calculate_reachable_cells(self) -> List[int]:
+        # Counts are capped at the snake length. They only change when the snake moves or turns, so the features and
+        # the safety filter of the same step share one flood fill per relative move.
+        snake_bitboard = cast(SnakeBitboard, self._snake_bitboard)
+        direction = self._game.get_current_direction()
+        key = (snake_bitboard.version, direction)
+        if key != self._reachable_cells_key:
+            snake = self._game.get_snake()
+            neighbours = self._calculate_relative_neighbours(snake[0], direction)
+            self._reachable_cells = [
+                snake_bitboard.count_reachable_cells(Point(x=int(x), y=int(y)), limit=len(snake)) for x, y in neighbours
+            ]
+            self._reachable_cells_key = key
+        return self._reachable_cells
+
+    def _calculate_relative_neighbours(self, point: Point, direction: Direction) -> np.ndarray:
+        idx = CLOCK_WISE_DIRECTIONS.index(direction)
+        relative_directions = [idx, (idx + 1) % 4, (idx - 1) % 4]
+        return cast(np.ndarray, np.asarray(point) + CLOCK_WISE_UNIT_STEPS[relative_directions])
 
     def convert_direction_to_binary(self) -> List[int]:
         current_direction = self._game.get_current_direction()
@@ -82,4 +92,11 @@ class StateFactory:
         self._game_config = game_configuration
 
     def create_state_for_game(self, game: SnakeGame) -> State:
-        return State(game=game, game_config=self._game_config)
+        game_config = self._game_config
+        if not (game_config.reachable_area_features or game_config.reachable_area_safety):
+            return State(game=game)
+        return State(
+            game=game,
+            snake_bitboard=SnakeBitboard(game.get_snake_handler()),
+            reachable_area_features=game_config.reachable_area_features,
+        )
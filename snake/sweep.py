@@ -0,0 +1,267 @@
+import argparse
+import csv
+import json
+import math
+import multiprocessing
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields, replace
+from itertools import product
+from pathlib import Path
+from typing import Any, ContextManager, Dict, List, MutableMapping, Optional, Sequence
+
+import numpy as np
+import torch
+
+from snake.agents import AIAgentFactory, TrainingParameters
+from snake.config import GameConfig, WindowConfig
+from snake.random_generators import RandomStream, create_random_generator, derive_seed
+from snake.validators import ConfigValidator
+
+SWEEP_PARAMETERS = tuple(field.name for field in fields(TrainingParameters))
+
+
+@dataclass(frozen=True)
+class SweepTrial:
+    trial: int
+    parameters: Dict[str, Any]
+    seed: Optional[int]
+
+
+@dataclass(frozen=True)
+class TrialResult:
+    # pylint: disable=too-many-instance-attributes
+    trial: int
+    parameters: Dict[str, Any]
+    seed: Optional[int]
+    games: int
+    score_mean: float
+    score_moving_average: float
+    score_max: int
+    stopped_early: bool
+    elapsed_seconds: float
+
+    def to_row(self) -> Dict[str, Any]:
+        row = asdict(self)
+        return {"trial": row.pop("trial"), **row.pop("parameters"), **row}
+
+
+def create_trials(spec: Dict[str, Any], seed: Optional[int]) -> List[SweepTrial]:
+    # A grid spec lists the values of every parameter, a random spec draws "trials" combinations from lists of values
+    # or from {"min": ..., "max": ..., "log": true} ranges. Parameters that are not part of the spec keep their
+    # configured value.
+    parameters: Dict[str, Any] = spec.get("parameters", {})
+    unknown = sorted(set(parameters) - set(SWEEP_PARAMETERS))
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters {unknown}, choose from {list(SWEEP_PARAMETERS)}.")
+    method = spec.get("method", "grid")
+    if method == "grid":
+        for name, values in parameters.items():
+            if not isinstance(values, list) or not values:
+                raise ValueError(f"The grid values of {name} have to be a non-empty list.")
+        combinations = [dict(zip(parameters, values)) for values in product(*parameters.values())]
+    elif method == "random":
+        random_generator = create_random_generator(seed, RandomStream.SWEEP)
+        combinations = [
+            {name: _sample(name, domain, random_generator) for name, domain in parameters.items()}
+            for _ in range(spec.get("trials", 10))
+        ]
+    else:
+        raise ValueError(f"Unknown sweep method {method}, choose from ['grid', 'random'].")
+    return [
+        SweepTrial(
+            trial=trial,
+            parameters={name: _coerce(name, value) for name, value in combination.items()},
+            seed=derive_seed(seed, int(RandomStream.SWEEP), trial),
+        )
+        for trial, combination in enumerate(combinations)
+    ]
+
+
+def _sample(name: str, domain: Any, random_generator: np.random.Generator) -> Any:
+    if isinstance(domain, list) and domain:
+        return domain[int(random_generator.integers(len(domain)))]
+    if not isinstance(domain, dict) or not {"min", "max"} <= set(domain):
+        raise ValueError(f"The random domain of {name} has to be a non-empty list or a min/max range.")
+    low, high = domain["min"], domain["max"]
+    if domain.get("log", False):
+        return math.exp(random_generator.uniform(math.log(low), math.log(high)))
+    if isinstance(low, int) and isinstance(high, int):
+        return int(random_generator.integers(low, high, endpoint=True))
+    return float(random_generator.uniform(low, high))
+
+
+def _coerce(name: str, value: Any) -> Any:
+    # Sampled values take the type of the default, so integer parameters stay integers on a log scale.
+    default = getattr(TrainingParameters(), name)
+    return round(value) if isinstance(default, int) else type(default)(value)
+
+
+class MedianStoppingRule:
+    # Every rung_games games a trial reports the moving average of its scores and stops if it is below the median of
+    # the trials that already reported at the same number of games. The reports are shared between the processes of
+    # a sweep, so which trials stop depends on the order in which they reach a rung.
+    def __init__(
+        self,
+        rung_games: int,
+        min_trials: int,
+        reports: MutableMapping[int, List[float]],
+        lock: ContextManager,
+    ):
+        self._rung_games = rung_games
+        self._min_trials = min_trials
+        self._reports = reports
+        self._lock = lock
+
+    def should_stop(self, games: int, score: float) -> bool:
+        if games % self._rung_games:
+            return False
+        with self._lock:
+            peers = self._reports.get(games, [])
+            self._reports[games] = [*peers, score]
+        return bool(peers) and len(peers) >= self._min_trials and score < statistics.median(peers)
+
+
+def train_trial(
+    window_config: WindowConfig,
+    game_config: GameConfig,
+    trial: SweepTrial,
+    games: int,
+    stopping_rule: Optional[MedianStoppingRule],
+) -> TrialResult:
+    started_at = time.perf_counter()
+    agent = AIAgentFactory(
+        window_configuration=window_config,
+        game_configuration=replace(game_config, seed=trial.seed, **trial.parameters),
+        headless=True,
+        persist_model=False,
+    ).create_agent()
+    scores = agent.get_metrics_summary()["score"]
+    reported_games = 0
+    stopped_early = False
+    try:
+        while agent.wants_to_play() and scores.get_count() < games:
+            if scores.get_count() > reported_games:
+                reported_games = scores.get_count()
+                if stopping_rule and stopping_rule.should_stop(reported_games, scores.get_moving_average()):
+                    stopped_early = True
+                    break
+            agent.play_game()
+    finally:
+        agent.close()
+    return TrialResult(
+        trial=trial.trial,
+        parameters=trial.parameters,
+        seed=trial.seed,
+        games=scores.get_count(),
+        score_mean=scores.get_mean(),
+        score_moving_average=scores.get_moving_average(),
+        score_max=agent.get_max_score(),
+        stopped_early=stopped_early,
+        elapsed_seconds=time.perf_counter() - started_at,
+    )
+
+
+def run_sweep(
+    window_config: WindowConfig,
+    game_config: GameConfig,
+    trials: Sequence[SweepTrial],
+    *,
+    games: int,
+    workers: int,
+    threads_per_trial: int = 1,
+    rung_games: Optional[int] = None,
+    min_trials: int = 4,
+) -> List[TrialResult]:
+    # pylint: disable=too-many-arguments
+    # Trials train headless without saving models, metrics files, live metrics or background evaluations.
+    game_config = replace(
+        game_config,
+        frame_rate=0,
+        profiling=False,
+        metrics_path=None,
+        metrics_port=None,
+        evaluation_interval=None,
+        memory_diagnostics=False,
+    )
+    workers = max(1, min(workers, len(trials)))
+    if workers == 1:
+        stopping_rule = MedianStoppingRule(rung_games, min_trials, {}, threading.Lock()) if rung_games else None
+        results = []
+        for trial in trials:
+            results.append(train_trial(window_config, game_config, trial, games, stopping_rule))
+            print(_format_result(results[-1]))
+    else:
+        with multiprocessing.Manager() as manager:
+            stopping_rule = (
+                MedianStoppingRule(rung_games, min_trials, manager.dict(), manager.Lock()) if rung_games else None
+            )
+            # Each process trains one trial at a time on threads_per_trial threads, the processes are the parallelism.
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=torch.set_num_threads, initargs=(threads_per_trial,)
+            ) as executor:
+                futures = [
+                    executor.submit(train_trial, window_config, game_config, trial, games, stopping_rule)
+                    for trial in trials
+                ]
+                results = []
+                for future in as_completed(futures):
+                    results.append(future.result())
+                    print(_format_result(results[-1]))
+    return sorted(results, key=lambda result: result.score_moving_average, reverse=True)
+
+
+def _format_result(result: TrialResult) -> str:
+    parameters = " ".join(f"{name}={value}" for name, value in result.parameters.items())
+    status = "stopped" if result.stopped_early else "finished"
+    return (
+        f"trial {result.trial:>3} {status:<8} games {result.games:>5} score avg {result.score_moving_average:>6.2f} "
+        f"max {result.score_max:>3}  {parameters}"
+    )
+
+
+def write_results(results: Sequence[TrialResult], path: Path) -> None:
+    rows = [result.to_row() for result in results]
+    field_names = list(dict.fromkeys(name for row in rows for name in row))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as results_file:
+        csv_writer = csv.DictWriter(results_file, fieldnames=field_names)
+        csv_writer.writeheader()
+        csv_writer.writerows(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Train the AIAgent headless with many hyperparameters in parallel.")
+    parser.add_argument("spec", type=Path, help="JSON grid or random search spec")
+    parser.add_argument("--games", type=int, default=500, help="games per trial")
+    parser.add_argument("--threads-per-trial", type=int, default=1)
+    parser.add_argument("--workers", type=int, help="parallel trials, all cores by default")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rung-games", type=int, default=100, help="compare trials every this many games, 0 never")
+    parser.add_argument("--min-trials", type=int, default=4, help="reports at a rung before trials are stopped")
+    parser.add_argument("--output", type=Path, default=Path("metrics/sweep.csv"))
+    args = parser.parse_args()
+
+    ConfigValidator.register_validator(*WindowConfig.get_all_validators(), *GameConfig.get_all_validators())
+    ConfigValidator.validate_all()
+    trials = create_trials(json.loads(args.spec.read_text(encoding="utf-8")), seed=args.seed)
+    results = run_sweep(
+        window_config=WindowConfig.from_dynaconf(),
+        game_config=GameConfig.from_dynaconf(),
+        trials=trials,
+        games=args.games,
+        workers=args.workers or max(1, (os.cpu_count() or 1) // args.threads_per_trial),
+        threads_per_trial=args.threads_per_trial,
+        rung_games=args.rung_games or None,
+        min_trials=args.min_trials,
+    )
+    print("\n".join(_format_result(result) for result in results))
+    write_results(results, args.output)
+    print(f"{len(results)} trials written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+from typing import Dict, List, Set, cast
+
+import numpy as np
+
+from snake.game_controls import Direction
+from snake.game_objects.objects import (
+    AbstractSnakeListener,
+    FoodHandler,
+    Point,
+    SnakeHandler,
+)
+
+ZOBRIST_KEY_BITS = 63
+BODY_LINKS = 4
+
+
+class ZobristHash(AbstractSnakeListener):
+    # pylint: disable=too-many-instance-attributes
+    # Every head cell, body cell, food cell and direction owns a random key and a position hashes to the XOR of the
+    # keys of its parts. Body keys also depend on the side on which the next segment towards the head lies, so the
+    # same cells in a different body order hash differently. A move only touches the old head, the new head and the
+    # tail, so the snake part of the hash is updated in constant time; food and direction are mixed in when the hash
+    # is read.
+    def __init__(self, snake_handler: SnakeHandler, food_handler: FoodHandler, random_generator: np.random.Generator):
+        self._snake_handler = snake_handler
+        self._food_handler = food_handler
+        self._grid = snake_handler.grid
+        size = self._grid.size
+        self._head_keys = self._create_keys(random_generator, size)
+        self._body_keys = self._create_keys(random_generator, size * BODY_LINKS)
+        self._food_keys = self._create_keys(random_generator, size)
+        self._direction_keys: Dict[Direction, int] = dict(
+            zip(Direction, self._create_keys(random_generator, len(Direction)))
+        )
+        self._snake_hash = 0
+
+        snake_handler.add_listener(self)
+        self.snake_reset()
+
+    @staticmethod
+    def _create_keys(random_generator: np.random.Generator, count: int) -> List[int]:
+        return cast(List[int], random_generator.integers(0, 2**ZOBRIST_KEY_BITS, size=count, dtype=np.int64).tolist())
+
+    def snake_extended(self, old_head: Point, new_head: Point) -> None:
+        self._toggle_head(old_head)
+        self._toggle_body(old_head, new_head)
+        self._toggle_head(new_head)
+
+    def tail_removed(self, tail: Point) -> None:
+        body = self._snake_handler.body
+        self._toggle_body(tail, body[-1] if body else self._snake_handler.head)
+
+    def snake_reset(self) -> None:
+        self._snake_hash = 0
+        successor = self._snake_handler.head
+        self._toggle_head(successor)
+        for point in self._snake_handler.body:
+            self._toggle_body(point, successor)
+            successor = point
+
+    def _toggle_head(self, point: Point) -> None:
+        if self._grid.contains(point):
+            self._snake_hash ^= self._head_keys[self._grid.to_cell(point)]
+
+    def _toggle_body(self, point: Point, successor: Point) -> None:
+        if self._grid.contains(point):
+            self._snake_hash ^= self._body_keys[self._grid.to_cell(point) * BODY_LINKS + self._link(point, successor)]
+
+    @staticmethod
+    def _link(point: Point, successor: Point) -> int:
+        if successor.x != point.x:
+            return 0 if successor.x > point.x else 1
+        return 2 if successor.y > point.y else 3
+
+    def get_hash(self, direction: Direction) -> int:
+        food_key = self._food_keys[self._food_handler.get_current_food_cell()]
+        return int(self._snake_hash ^ food_key ^ self._direction_keys[direction])
+
+
+class LoopDetector:
+    def __init__(self):
+        self._seen_hashes: Set[int] = set()
+
+    def reset(self, position_hash: int) -> None:
+        self._seen_hashes.clear()
+        self._seen_hashes.add(position_hash)
+
+    def visit(self, position_hash: int) -> bool:
+        if position_hash in self._seen_hashes:
+            return True
+        self._seen_hashes.add(position_hash)
+        return False
@@ -1,13 +1,21 @@
 from typing import Tuple, cast
 from unittest.mock import patch
 
+import numpy as np
 import pygame
 import pytest
 
 from snake.colors import RGBColorCode
 from snake.config import GameConfig, WindowConfig
 from snake.game import SnakeGame
-from snake.game_objects.objects import Food, FoodHandler, Point, Snake, SnakeHandler
+from snake.game_objects.objects import (
+    Food,
+    FoodHandler,
+    Grid,
+    Point,
+    Snake,
+    SnakeHandler,
+)
 from tests.fake_classes import FakePublisher, FakeSubscriber
 
 
@@ -19,6 +27,12 @@ def init_pygame():
     pygame.quit()
 
 
+@pytest.fixture(autouse=True)
+def keep_saved_models(tmp_path, monkeypatch):
+    # Models trained by the tests must neither load nor overwrite the models in ./model.
+    monkeypatch.setattr("snake.model.MODEL_FOLDER_PATH", str(tmp_path / "model"))
+
+
 @pytest.fixture(name="window_config")
 def fixture_window_config() -> WindowConfig:
     return WindowConfig(
@@ -43,24 +57,32 @@ def fixture_game_config() -> GameConfig:
     )
 
 
+@pytest.fixture(name="grid")
+def fixture_grid(window_config: WindowConfig, game_config: GameConfig) -> Grid:
+    return Grid(
+        width=window_config.width // game_config.outer_block_size,
+        height=window_config.height // game_config.outer_block_size,
+    )
+
+
 @pytest.fixture(name="food")
-def fixture_food(window_config: WindowConfig, game_config: GameConfig) -> Food:
-    return Food(width=window_config.width, height=window_config.height, block_size=game_config.outer_block_size)
+def fixture_food() -> Food:
+    return Food(cell=0)
 
 
 @pytest.fixture(name="snake")
 def fixture_snake() -> Snake:
-    return Snake(head=Point(x=50, y=25), body=[Point(x=45, y=25), Point(x=40, y=25)], block_size=5)
+    return Snake(head=Point(x=10, y=5), body=[Point(x=9, y=5), Point(x=8, y=5)])
 
 
 @pytest.fixture(name="snake_handler")
-def fixture_snake_handler(snake: Snake) -> SnakeHandler:
-    return SnakeHandler(snake=snake)
+def fixture_snake_handler(snake: Snake, grid: Grid) -> SnakeHandler:
+    return SnakeHandler(snake=snake, grid=grid)
 
 
 @pytest.fixture(name="food_handler")
-def fixture_food_handler(food: Food, window_config: WindowConfig) -> FoodHandler:
-    return FoodHandler(food=food, window_config=window_config)
+def fixture_food_handler(food: Food, grid: Grid) -> FoodHandler:
+    return FoodHandler(food=food, grid=grid, random_generator=np.random.default_rng(seed=0))
 
 
 @pytest.fixture(name="fake_publisher")
@@ -1,4 +1,5 @@
-from typing import Callable, Dict, List
+from functools import partial
+from typing import Callable, Dict, Iterable, List
 
 from snake.publisher import AbstractPublisher, AbstractSubscriber, PublisherEvents
 
@@ -14,6 +15,9 @@ class FakePublisher(AbstractPublisher):
     def publish_one_event(self, event: PublisherEvents) -> None:
         self._published_events.append(event)
 
+    def publish_events(self, events: Iterable[PublisherEvents]) -> None:
+        self._published_events.extend(events)
+
     @property
     def all_events(self) -> List[PublisherEvents]:
         return self._published_events
@@ -27,12 +31,9 @@ class FakeSubscriber(AbstractSubscriber):
     def __init__(self):
         self._received_events: List[PublisherEvents] = []
 
-    def get_notified(self, event: PublisherEvents) -> None:
-        self._received_events.append(event)
-
     @property
     def _subscribed_events(self) -> Dict[PublisherEvents, Callable]:
-        pass
+        return {event: partial(self._received_events.append, event) for event in PublisherEvents}
 
     @property
     def received_notifications(self) -> List[PublisherEvents]:
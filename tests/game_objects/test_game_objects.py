@@ -1,20 +1,28 @@
 from typing import List
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
-from snake.config import WindowConfig
 from snake.game_controls import Direction
-from snake.game_objects.objects import Food, FoodHandler, Point, SnakeHandler
+from snake.game_objects.objects import (
+    AbstractSnakeListener,
+    Food,
+    FoodHandler,
+    Grid,
+    Point,
+    SnakeHandler,
+)
 
 
 class TestSnakeHandler:
     @pytest.mark.parametrize(
         "direction, expected_snake",
         (
-            (Direction.RIGHT, [Point(x=55, y=25), Point(x=50, y=25), Point(x=45, y=25)]),
-            (Direction.LEFT, [Point(x=45, y=25), Point(x=50, y=25), Point(x=45, y=25)]),
-            (Direction.DOWN, [Point(x=50, y=30), Point(x=50, y=25), Point(x=45, y=25)]),
-            (Direction.UP, [Point(x=50, y=20), Point(x=50, y=25), Point(x=45, y=25)]),
+            (Direction.RIGHT, [Point(x=11, y=5), Point(x=10, y=5), Point(x=9, y=5)]),
+            (Direction.LEFT, [Point(x=9, y=5), Point(x=10, y=5), Point(x=9, y=5)]),
+            (Direction.DOWN, [Point(x=10, y=6), Point(x=10, y=5), Point(x=9, y=5)]),
+            (Direction.UP, [Point(x=10, y=4), Point(x=10, y=5), Point(x=9, y=5)]),
         ),
         ids=[
             "move right",
@@ -28,13 +36,13 @@ class TestSnakeHandler:
         assert snake_handler.get_snake() == expected_snake
 
     def test_extend_snake(self, snake_handler: SnakeHandler):
-        snake_handler.extend_snake(Point(55, 25))
+        snake_handler.extend_snake(Point(11, 5))
         actual_snake = snake_handler.get_snake()
         expected_snake = [
-            Point(55, 25),
-            Point(50, 25),
-            Point(45, 25),
-            Point(40, 25),
+            Point(11, 5),
+            Point(10, 5),
+            Point(9, 5),
+            Point(8, 5),
         ]
         assert expected_snake == actual_snake
 
@@ -42,40 +50,96 @@ class TestSnakeHandler:
         snake_handler.remove_last_element_from_body()
         actual_snake = snake_handler.get_snake()
         expected_snake = [
-            Point(50, 25),
-            Point(45, 25),
+            Point(10, 5),
+            Point(9, 5),
         ]
         assert expected_snake == actual_snake
 
     def test_snake_bites_itself(self, snake_handler: SnakeHandler):
-        snake_handler.extend_snake(Point(45, 25))
+        snake_handler.extend_snake(Point(9, 5))
         assert snake_handler.snake_bites_itself()
 
     def test_snake_does_not_bite_itself(self, snake_handler: SnakeHandler):
         assert not snake_handler.snake_bites_itself()
 
+    def test_occupancy_follows_snake_body(self, snake_handler: SnakeHandler, grid: Grid):
+        snake_handler.move_snake(Direction.DOWN)
+        expected_cells = sorted(grid.to_cell(point) for point in snake_handler.body)
+        assert snake_handler.occupancy.nonzero()[0].tolist() == expected_cells
+        assert snake_handler.occupies(snake_handler.head)
+        assert not snake_handler.occupies(Point(8, 5))
+
+    def test_occupancy_follows_restored_snake_body(self, snake_handler: SnakeHandler, grid: Grid):
+        snake_handler.move_snake(Direction.DOWN)
+        snake_handler.restore(Point(x=3, y=3), [Point(x=2, y=3), Point(x=2, y=4), Point(x=2, y=3)])
+
+        assert snake_handler.occupancy[grid.to_cell(Point(x=2, y=3))] == 2
+        assert snake_handler.occupancy.nonzero()[0].tolist() == sorted(
+            [grid.to_cell(Point(x=2, y=3)), grid.to_cell(Point(x=2, y=4))]
+        )
+
+    def test_listeners_are_notified_about_snake_changes(self, snake_handler: SnakeHandler):
+        listener = MagicMock(spec=AbstractSnakeListener)
+        snake_handler.add_listener(listener)
+
+        snake_handler.move_snake(Direction.RIGHT)
+        snake_handler.reset()
+
+        listener.snake_extended.assert_called_once_with(Point(10, 5), Point(11, 5))
+        listener.tail_removed.assert_called_once_with(Point(8, 5))
+        listener.snake_reset.assert_called_once_with()
+
+    def test_get_free_cells_excludes_head_and_body(self, snake_handler: SnakeHandler, grid: Grid):
+        free_cells = snake_handler.get_free_cells()
+
+        assert len(free_cells) == grid.size - 3
+        assert not set(free_cells.tolist()) & {grid.to_cell(point) for point in snake_handler.get_snake()}
+
     def test_get_snake(self, snake_handler: SnakeHandler):
         actual_snake = snake_handler.get_snake()
         expected_snake = [
-            Point(50, 25),
-            Point(45, 25),
-            Point(40, 25),
+            Point(10, 5),
+            Point(9, 5),
+            Point(8, 5),
         ]
         assert expected_snake == actual_snake
 
 
+class TestGrid:
+    @pytest.mark.parametrize(
+        "point, expected_cell",
+        ((Point(0, 0), 0), (Point(19, 0), 19), (Point(0, 1), 20), (Point(19, 9), 199)),
+    )
+    def test_cell_conversion(self, grid: Grid, point: Point, expected_cell: int):
+        assert grid.to_cell(point) == expected_cell
+        assert grid.to_point(expected_cell) == point
+
+    @pytest.mark.parametrize(
+        "point, expected_answer",
+        (
+            (Point(0, 0), True),
+            (Point(19, 9), True),
+            (Point(-1, 0), False),
+            (Point(20, 0), False),
+            (Point(0, 10), False),
+        ),
+    )
+    def test_contains(self, grid: Grid, point: Point, expected_answer: bool):
+        assert grid.contains(point) == expected_answer
+
+
 class TestFoodHandler:
-    def test_get_current_food_position(self, food: Food, window_config: WindowConfig):
-        food_handler = FoodHandler(food=food, window_config=window_config)
-        assert food_handler.get_current_food_position() == Point(window_config.width, window_config.height)
+    def test_get_current_food_position(self, grid: Grid):
+        food_handler = FoodHandler(food=Food(cell=43), grid=grid, random_generator=np.random.default_rng(seed=0))
+        assert food_handler.get_current_food_position() == Point(3, 2)
 
     @pytest.mark.parametrize(
         "test_food",
         [
-            Food(width=0, height=0, block_size=5),
-            Food(width=100, height=0, block_size=5),
-            Food(width=0, height=50, block_size=5),
-            Food(width=100, height=50, block_size=5),
+            Food(cell=0),
+            Food(cell=19),
+            Food(cell=180),
+            Food(cell=199),
         ],
         ids=[
             "Food position: top left hand corner",
@@ -84,11 +148,24 @@ class TestFoodHandler:
             "Food position: bottom right hand corner",
         ],
     )
-    def test_move_food_to_random_position_within_window_boundary(self, test_food: Food, window_config: WindowConfig):
-        food_handler = FoodHandler(food=test_food, window_config=window_config)
+    def test_move_food_to_random_position_within_grid_boundary(self, test_food: Food, grid: Grid):
+        food_handler = FoodHandler(food=test_food, grid=grid, random_generator=np.random.default_rng(seed=0))
         food_handler.move_food_to_random_position()
         current_position = food_handler.get_current_food_position()
         assert current_position.x >= 0
-        assert current_position.x <= window_config.width - test_food.block_size
+        assert current_position.x < grid.width
         assert current_position.y >= 0
-        assert current_position.y <= window_config.height - test_food.block_size
+        assert current_position.y < grid.height
+
+    def test_move_food_to_random_free_cell(self, grid: Grid):
+        food_handler = FoodHandler(food=Food(cell=0), grid=grid, random_generator=np.random.default_rng(seed=0))
+        food_handler.move_food_to_random_free_cell(np.array([42]))
+        assert food_handler.get_current_food_cell() == 42
+
+    def test_move_food_to_random_position_is_reproducible(self, grid: Grid):
+        first_food_handler = FoodHandler(food=Food(cell=0), grid=grid, random_generator=np.random.default_rng(seed=3))
+        second_food_handler = FoodHandler(food=Food(cell=0), grid=grid, random_generator=np.random.default_rng(seed=3))
+        for _ in range(10):
+            first_food_handler.move_food_to_random_position()
+            second_food_handler.move_food_to_random_position()
+            assert first_food_handler.get_current_food_position() == second_food_handler.get_current_food_position()
@@ -1,8 +1,11 @@
 from unittest.mock import patch
 
+import pygame
+
 from snake.config import GameConfig, WindowConfig
-from snake.game_objects.objects import FoodHandler, SnakeHandler
-from snake.pygame_interface.game_ui import GameUI
+from snake.game_controls import Direction
+from snake.game_objects.objects import FoodHandler, Point, SnakeHandler
+from snake.pygame_interface.game_ui import FramebufferGameUI, GameSnapshot, GameUI
 
 
 @patch("snake.pygame_interface.game_ui.pygame.display")
@@ -31,7 +34,7 @@ class TestPyGameUI:
 
     def test_update_snake_food_and_text(
         self,
-        _,
+        mocked_display,
         window_config: WindowConfig,
         game_config: GameConfig,
         snake_handler: SnakeHandler,
@@ -44,14 +47,243 @@ class TestPyGameUI:
             food_handler=food_handler,
         )
         test_score = 100
-        with patch("snake.pygame_interface.game_ui.pygame.draw.rect") as mocked_draw_rect:
-            pygame_ui.update_snake_food_and_text(score=test_score)
+        pygame_ui.update_snake_food_and_text(score=test_score)
+
+        head_size = 1
+        snake_block_count = head_size + game_config.start_length
+        food_count = 1
+        expected_number_of_blocks = snake_block_count + food_count
+
+        mocked_blits = mocked_display.set_mode.return_value.blits
+        assert mocked_blits.call_count == 1
+        actual_number_of_blocks = len(mocked_blits.call_args.args[0])
+        assert actual_number_of_blocks == expected_number_of_blocks
+
+    def test_update_snake_food_and_text_only_pushes_changed_cells(
+        self,
+        mocked_display,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+    ):
+        mocked_display.set_mode.return_value = pygame.Surface((window_config.width, window_config.height))
+        pygame_ui = GameUI(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+        )
+        pygame_ui.update_snake_food_and_text(score=0)
+        snake_handler.move_snake(Direction.RIGHT)
+        pygame_ui.update_snake_food_and_text(score=0)
 
-            head_size = 1
-            outer_block_count = head_size + game_config.start_length
-            inner_block_count = head_size + game_config.start_length
-            food_count = 1
-            expected_number_of_rectangles = outer_block_count + inner_block_count + food_count
+        assert mocked_display.flip.call_count == 1
+        dirty_rects = mocked_display.update.call_args.args[0]
+        assert pygame.Rect(55, 25, 5, 5) in dirty_rects
+        assert pygame.Rect(40, 25, 5, 5) in dirty_rects
+        assert pygame.Rect(50, 25, 5, 5) not in dirty_rects
+
+    def test_update_snake_food_and_text_only_blits_cells_that_changed(
+        self,
+        mocked_display,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+    ):
+        mocked_display.set_mode.return_value = pygame.Surface((window_config.width, window_config.height))
+        pygame_ui = GameUI(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+        )
+        pygame_ui.update_snake_food_and_text(score=0)
+        snake_handler.extend_snake(Point(x=11, y=5))
+        snake_handler.extend_snake(Point(x=12, y=5))
+        snake_handler.remove_last_element_from_body()
+
+        with patch.object(pygame_ui, "_display") as display:
+            pygame_ui.update_snake_food_and_text(score=0)
+
+        blitted_positions = {position for _, position in display.blits.call_args.args[0]}
+        assert blitted_positions == {Point(x=55, y=25), Point(x=60, y=25), Point(x=40, y=25)}
+
+    def test_restored_snake_forces_full_redraw(
+        self,
+        mocked_display,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+    ):
+        mocked_display.set_mode.return_value = pygame.Surface((window_config.width, window_config.height))
+        pygame_ui = GameUI(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+        )
+        pygame_ui.update_snake_food_and_text(score=0)
+        snake_handler.restore(Point(x=3, y=3), [Point(x=2, y=3), Point(x=1, y=3)])
+        pygame_ui.update_snake_food_and_text(score=0)
+
+        assert mocked_display.flip.call_count == 2
+        assert mocked_display.update.call_count == 0
+
+    def test_draw_takes_snake_from_snapshot(
+        self,
+        mocked_display,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+    ):
+        mocked_display.set_mode.return_value = pygame.Surface((window_config.width, window_config.height))
+        pygame_ui = GameUI(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+        )
+        pygame_ui.update_snake_food_and_text(score=0)
+        snake_handler.move_snake(Direction.RIGHT)
+        snapshot = GameSnapshot.from_handlers(snake_handler, food_handler, score=0)
+        snake_handler.move_snake(Direction.RIGHT)
+
+        with patch.object(pygame_ui, "_display") as display:
+            pygame_ui.draw(snapshot)
+
+        blitted_blocks = {position: block for block, position in display.blits.call_args.args[0]}
+        assert set(blitted_blocks) == {Point(x=55, y=25), Point(x=40, y=25)}
+        # pylint: disable=W0212
+        assert blitted_blocks[Point(x=55, y=25)] is pygame_ui._assets.snake_block
+        assert blitted_blocks[Point(x=40, y=25)] is pygame_ui._assets.background_block
+
+    def test_snapshot_after_undrawn_moves_only_redraws_changed_cells(
+        self,
+        mocked_display,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+    ):
+        mocked_display.set_mode.return_value = pygame.Surface((window_config.width, window_config.height))
+        pygame_ui = GameUI(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+        )
+        pygame_ui.update_snake_food_and_text(score=0)
+        snake_handler.move_snake(Direction.RIGHT)
+        snake_handler.move_snake(Direction.RIGHT)
+
+        with patch.object(pygame_ui, "_display") as display:
+            pygame_ui.update_snake_food_and_text(score=0)
+
+        blitted_positions = {position for _, position in display.blits.call_args.args[0]}
+        assert blitted_positions == {Point(x=60, y=25), Point(x=55, y=25), Point(x=45, y=25), Point(x=40, y=25)}
+        assert mocked_display.flip.call_count == 1
+
+    def test_update_snake_food_and_text_redraws_text_when_overlay_changes(
+        self,
+        mocked_display,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+    ):
+        mocked_display.set_mode.return_value = pygame.Surface((window_config.width, window_config.height))
+        pygame_ui = GameUI(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+        )
+        pygame_ui.update_snake_food_and_text(score=0, overlay="WATCH 30 steps/s")
+        pygame_ui.update_snake_food_and_text(score=0, overlay="WATCH 30 steps/s")
+        assert mocked_display.update.call_args.args[0] == []
+
+        pygame_ui.update_snake_food_and_text(score=0, overlay="FAST 900 steps/s")
+        dirty_rects = mocked_display.update.call_args.args[0]
+        assert len(dirty_rects) == 1
+        assert dirty_rects[0].top == 0
+
+    def test_reset_forces_full_redraw(
+        self,
+        mocked_display,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+    ):
+        mocked_display.set_mode.return_value = pygame.Surface((window_config.width, window_config.height))
+        pygame_ui = GameUI(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+        )
+        pygame_ui.update_snake_food_and_text(score=0)
+        pygame_ui.update_snake_food_and_text(score=0)
+        pygame_ui.reset()
+        pygame_ui.update_snake_food_and_text(score=0)
+
+        assert mocked_display.flip.call_count == 2
+        assert mocked_display.update.call_count == 1
+
+
+@patch("snake.pygame_interface.game_ui.pygame.display")
+class TestFramebufferGameUI:
+    def test_update_snake_food_and_text_paints_one_pixel_per_cell(
+        self,
+        mocked_display,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+    ):
+        mocked_display.set_mode.return_value = pygame.Surface((window_config.width, window_config.height))
+        pygame_ui = FramebufferGameUI(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+        )
+        pygame_ui.update_snake_food_and_text(score=0)
+
+        frame = pygame_ui.get_frame()
+        food = food_handler.get_current_food_position()
+        assert frame.shape == (snake_handler.grid.width, snake_handler.grid.height, 3)
+        assert all(
+            tuple(frame[element.x, element.y]) == game_config.inner_block_color for element in snake_handler.get_snake()
+        )
+        assert tuple(frame[food.x, food.y]) == game_config.food_color
+        assert tuple(frame[0, snake_handler.grid.height - 1]) == window_config.background_color
+        assert mocked_display.flip.call_count == 1
+
+    def test_board_is_scaled_to_window(
+        self,
+        mocked_display,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+    ):
+        display = pygame.Surface((window_config.width, window_config.height))
+        mocked_display.set_mode.return_value = display
+        pygame_ui = FramebufferGameUI(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+        )
+        pygame_ui.update_snake_food_and_text(score=0)
 
-            actual_number_of_rectangles = mocked_draw_rect.call_count
-            assert actual_number_of_rectangles == expected_number_of_rectangles
+        head = snake_handler.head
+        block_size = game_config.outer_block_size
+        for x in range(head.x * block_size, (head.x + 1) * block_size):
+            for y in range(head.y * block_size, (head.y + 1) * block_size):
+                assert display.get_at((x, y)) == pygame.Color(game_config.inner_block_color)
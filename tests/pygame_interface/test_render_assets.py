@@ -0,0 +1,22 @@
+import pygame
+
+from snake.config import GameConfig, WindowConfig
+from snake.pygame_interface.render_assets import RenderAssets
+
+
+class TestRenderAssets:
+    def test_score_text_is_rendered_once_per_value(self, window_config: WindowConfig, game_config: GameConfig):
+        assets = RenderAssets(window_config=window_config, game_config=game_config)
+
+        assert assets.get_score_text(3) is assets.get_score_text(3)
+        assert assets.get_score_text(3) is not assets.get_score_text(4)
+
+    def test_blocks_match_configured_colors(self, window_config: WindowConfig, game_config: GameConfig):
+        assets = RenderAssets(window_config=window_config, game_config=game_config)
+        center = game_config.outer_block_size // 2
+
+        assert assets.snake_block.get_at((0, 0)) == pygame.Color(game_config.outer_block_color)
+        assert assets.snake_block.get_at((center, center)) == pygame.Color(game_config.inner_block_color)
+        assert assets.food_block.get_at((0, 0)) == pygame.Color(window_config.background_color)
+        assert assets.food_block.get_at((center, center)) == pygame.Color(game_config.food_color)
+        assert assets.background_block.get_at((center, center)) == pygame.Color(window_config.background_color)
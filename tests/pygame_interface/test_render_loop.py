@@ -0,0 +1,87 @@
+from unittest.mock import MagicMock
+
+from snake.game_objects.objects import FoodHandler, Point, SnakeHandler
+from snake.pygame_interface.game_ui import GameSnapshot
+from snake.pygame_interface.render_loop import (
+    DecoupledGameUI,
+    RenderThread,
+    SnapshotBuffer,
+)
+
+
+def create_snapshot(score: int = 0) -> GameSnapshot:
+    return GameSnapshot(snake=(Point(x=1, y=0), Point(x=0, y=0)), food=Point(x=3, y=3), score=score)
+
+
+class TestSnapshotBuffer:
+    def test_publish_answers_request(self):
+        snapshot_buffer = SnapshotBuffer()
+        snapshot = create_snapshot()
+
+        assert snapshot_buffer.snapshot_requested()
+        snapshot_buffer.publish(snapshot)
+
+        assert not snapshot_buffer.snapshot_requested()
+        assert snapshot_buffer.latest() is snapshot
+
+    def test_request_snapshot(self):
+        snapshot_buffer = SnapshotBuffer()
+        snapshot_buffer.publish(create_snapshot())
+        snapshot_buffer.request_snapshot()
+
+        assert snapshot_buffer.snapshot_requested()
+
+
+class TestRenderThread:
+    def test_render_latest_snapshot_draws_each_snapshot_once(self):
+        game_ui = MagicMock()
+        snapshot_buffer = SnapshotBuffer()
+        render_thread = RenderThread(game_ui=game_ui, snapshot_buffer=snapshot_buffer)
+        snapshot = create_snapshot()
+
+        render_thread.render_latest_snapshot()
+        snapshot_buffer.publish(snapshot)
+        render_thread.render_latest_snapshot()
+        render_thread.render_latest_snapshot()
+
+        game_ui.draw.assert_called_once_with(snapshot)
+        assert snapshot_buffer.snapshot_requested()
+
+    def test_stop(self):
+        render_thread = RenderThread(game_ui=MagicMock(), snapshot_buffer=SnapshotBuffer())
+        render_thread.start()
+        render_thread.stop()
+
+        assert not render_thread.is_alive()
+
+
+class TestDecoupledGameUI:
+    def test_update_snake_food_and_text_publishes_only_requested_snapshots(
+        self, snake_handler: SnakeHandler, food_handler: FoodHandler
+    ):
+        game_ui = MagicMock()
+        decoupled_game_ui = DecoupledGameUI(game_ui=game_ui, snake_handler=snake_handler, food_handler=food_handler)
+        decoupled_game_ui.close()
+        # pylint: disable=W0212
+        snapshot_buffer = decoupled_game_ui._snapshot_buffer
+        snapshot_buffer.request_snapshot()
+
+        decoupled_game_ui.update_snake_food_and_text(score=1)
+        decoupled_game_ui.update_snake_food_and_text(score=2)
+
+        snapshot = snapshot_buffer.latest()
+        assert snapshot is not None
+        assert snapshot.score == 1
+        assert snapshot.snake == tuple(snake_handler.get_snake())
+
+    def test_update_clock_does_not_pace_the_simulation(self, snake_handler: SnakeHandler, food_handler: FoodHandler):
+        game_ui = MagicMock()
+        decoupled_game_ui = DecoupledGameUI(game_ui=game_ui, snake_handler=snake_handler, food_handler=food_handler)
+        decoupled_game_ui.close()
+        game_ui.reset_mock()
+
+        decoupled_game_ui.update_clock()
+        decoupled_game_ui.reset()
+
+        game_ui.update_clock.assert_not_called()
+        game_ui.reset.assert_called_once()
@@ -1,14 +1,32 @@
 from enum import Enum, auto
 from typing import List, Optional
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
-
-from snake.agents import Actions, AIAgentFactory, UserAgent
+import torch
+
+from snake.agents import (
+    AbstractAgentFactory,
+    Actions,
+    Agents,
+    AIAgentFactory,
+    HamiltonianAgent,
+    MCTSAgent,
+    PathfindingAgent,
+    UserAgent,
+)
 from snake.config import GameConfig, WindowConfig
+from snake.evaluation import (
+    EpisodeOutcome,
+    EvaluationReport,
+    EvaluationResult,
+    PeriodicEvaluation,
+)
 from snake.game import SnakeGameFactory
 from snake.game_controls import AbstractEventHandler, Direction
-from snake.game_objects.objects import Point
+from snake.game_objects.objects import Grid, Point
+from snake.model import ConvQNet
 
 
 class FakeEvents(Enum):
@@ -128,6 +146,54 @@ class TestUserAgent:
 
             assert agent.wants_to_play() == expected_answer
 
+    def test_wants_to_play_records_finished_episode(
+        self,
+        _,
+        ai_agent_factory: AIAgentFactory,
+    ):
+        with (
+            patch("snake.agents.SnakeGame.is_over", return_value=True),
+            patch("snake.agents.AIAgent._train_long_memory", return_value=torch.tensor(0.25)),
+        ):
+            agent = ai_agent_factory.create_agent()
+            agent.play_game()
+            agent.play_game()
+            agent.wants_to_play()
+
+        metrics_summary = agent.get_metrics_summary()
+        assert metrics_summary["steps"].get_count() == 1
+        assert metrics_summary["steps"].get_mean() == 2
+        assert metrics_summary["loss"].get_mean() == pytest.approx(0.25)
+        assert metrics_summary["replay_size"].get_mean() == 2
+
+    def test_wants_to_play_records_periodic_evaluation_and_saves_best_weights(
+        self,
+        _,
+        ai_agent_factory: AIAgentFactory,
+    ):
+        periodic_evaluation = MagicMock(spec=PeriodicEvaluation)
+        periodic_evaluation.poll.return_value = EvaluationResult(
+            games=0,
+            report=EvaluationReport.from_outcomes([EpisodeOutcome(episode=0, score=3, steps=30)], elapsed_seconds=1),
+            state_dict={},
+            is_best=True,
+        )
+        periodic_evaluation.should_evaluate.return_value = True
+        with (
+            patch("snake.agents.SnakeGame.is_over", return_value=True),
+            patch("snake.agents.AIAgent._train_long_memory", return_value=torch.tensor(0.25)),
+            patch("snake.model.QNet.save") as save,
+        ):
+            agent = ai_agent_factory.create_agent()
+            # pylint: disable=W0212
+            agent._periodic_evaluation = periodic_evaluation
+            agent.wants_to_play()
+            agent.wants_to_play()
+
+        save.assert_any_call(file_name="best_model_22.pth", state_dict={})
+        periodic_evaluation.submit.assert_called_with(2, agent._model)  # pylint: disable=W0212
+        assert agent.get_metrics_summary()["evaluation_score_mean"].get_mean() == 3
+
     def test_restart_game_gets_called_if_agent_wants_to_play_again(
         self,
         _,
@@ -144,7 +210,7 @@ class TestUserAgent:
             assert agent.wants_to_play()
             assert mocked_restart_game.call_count == 1
 
-    def test_reset_game_creates_new_game_instance(
+    def test_restart_game_resets_game_in_place(
         self,
         _,
         snake_game_factory: SnakeGameFactory,
@@ -153,16 +219,31 @@ class TestUserAgent:
             agent = UserAgent(game_factory=snake_game_factory)
             agent.restart_game()
 
-            assert mocked_create_snake_game.call_count == 2
+            assert mocked_create_snake_game.call_count == 1
+            assert mocked_create_snake_game.return_value.reset.call_count == 1
+
+    def test_restart_game_resets_remuneration_in_place(
+        self,
+        _,
+        snake_game_factory: SnakeGameFactory,
+    ):
+        agent = UserAgent(game_factory=snake_game_factory)
+        # pylint: disable=W0212
+        remuneration = agent._remuneration
+        remuneration["score"] = 5
+        agent.restart_game()
+
+        assert agent._remuneration is remuneration
+        assert agent.get_score() == 0
 
     @pytest.mark.integration
     @pytest.mark.parametrize(
         "input_event, expected_snake",
         (
-            ([], [Point(x=55, y=25), Point(x=50, y=25), Point(x=45, y=25)]),
-            ([FakeEvents.RIGHT], [Point(x=55, y=25), Point(x=50, y=25), Point(x=45, y=25)]),
-            ([FakeEvents.UP], [Point(x=50, y=20), Point(x=50, y=25), Point(x=45, y=25)]),
-            ([FakeEvents.DOWN], [Point(x=50, y=30), Point(x=50, y=25), Point(x=45, y=25)]),
+            ([], [Point(x=11, y=5), Point(x=10, y=5), Point(x=9, y=5)]),
+            ([FakeEvents.RIGHT], [Point(x=11, y=5), Point(x=10, y=5), Point(x=9, y=5)]),
+            ([FakeEvents.UP], [Point(x=10, y=4), Point(x=10, y=5), Point(x=9, y=5)]),
+            ([FakeEvents.DOWN], [Point(x=10, y=6), Point(x=10, y=5), Point(x=9, y=5)]),
         ),
         ids=[
             "no input from user -> snake has to move to the right side (default)",
@@ -206,7 +287,7 @@ class TestUserAgent:
                 fake_event_handler.add_test_events([fake_event])
                 agent.play_game()
 
-            assert agent.get_snake() == [Point(x=80, y=25), Point(x=75, y=25), Point(x=70, y=25)]
+            assert agent.get_snake() == [Point(x=16, y=5), Point(x=15, y=5), Point(x=14, y=5)]
             assert not agent.wants_to_play()
 
 
@@ -270,24 +351,139 @@ class TestAIAgent:
             assert agent.wants_to_play()
             assert mocked_restart_game.call_count == 1
 
-    def test_reset_game_creates_new_game_instance(
+    def test_restart_game_resets_game_in_place(
         self,
         _,
         ai_agent_factory: AIAgentFactory,
     ):
-        with patch("snake.agents.SnakeGameFactory.create_snake_game") as mocked_create_snake_game:
+        with (
+            patch("snake.agents.SnakeGameFactory.create_snake_game") as mocked_create_snake_game,
+            patch("snake.agents.AIAgent._observe_frame", return_value=np.zeros(11)),
+        ):
             agent = ai_agent_factory.create_agent()
             agent.restart_game()
 
-            assert mocked_create_snake_game.call_count == 2
+            assert mocked_create_snake_game.call_count == 1
+            assert mocked_create_snake_game.return_value.reset.call_count == 1
+
+    def test_restart_game_resets_remuneration_in_place(
+        self,
+        _,
+        ai_agent_factory: AIAgentFactory,
+    ):
+        agent = ai_agent_factory.create_agent()
+        # pylint: disable=W0212
+        remuneration = agent._remuneration
+        remuneration["score"] = 5
+        agent.restart_game()
+
+        assert agent._remuneration is remuneration
+        assert agent.get_score() == 0
+
+    def test_seeded_agents_choose_the_same_actions(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+    ):
+        game_config.seed = 7
+        first_agent = AIAgentFactory(window_configuration=window_config, game_configuration=game_config).create_agent()
+        second_agent = AIAgentFactory(window_configuration=window_config, game_configuration=game_config).create_agent()
+        state = np.zeros(22)
+
+        # pylint: disable=W0212
+        first_actions = [first_agent._get_actions(state) for _ in range(20)]
+        second_actions = [second_agent._get_actions(state) for _ in range(20)]
+
+        assert first_actions == second_actions
+
+    def test_safety_filter_replaces_move_into_enclosed_space(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+    ):
+        game_config.reachable_area_safety = True
+        agent = AIAgentFactory(window_configuration=window_config, game_configuration=game_config).create_agent()
+        # pylint: disable=W0212
+        agent._n_games = 1_000
+
+        with patch("snake.state.State.calculate_safe_moves", return_value=[False, False, True]):
+            assert agent._get_actions(np.zeros(22)) == Actions.LEFT_TURN
+        with patch("snake.state.State.calculate_safe_moves", return_value=[False, False, False]):
+            assert agent._get_actions(np.zeros(22)) in list(Actions)
+
+    def test_play_game_with_grid_observations(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        grid: Grid,
+    ):
+        game_config.observation_type = "grid"
+        agent = AIAgentFactory(window_configuration=window_config, game_configuration=game_config).create_agent()
+        agent.play_game()
+        agent.play_game()
+
+        # pylint: disable=W0212
+        old_state, _, _, new_state, _ = agent._memory[-1]
+        assert isinstance(agent._model, ConvQNet)
+        assert old_state.shape == new_state.shape == (6, grid.height, grid.width)
+        assert old_state.indices == agent._memory[0][3].indices
+        np.testing.assert_array_equal(old_state.materialize(), agent._memory[0][3].materialize())
+
+    def test_headless_agent_trains_with_configured_parameters(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+    ):
+        game_config.hidden_layer_size = 32
+        game_config.batch_size = 4
+        game_config.epsilon_start = 10
+        game_config.epsilon_decay = 0.5
+        with (
+            patch("snake.agents.PygameEventHandler") as pygame_event_handler,
+            patch("snake.model.QNet.load") as load,
+            patch("snake.model.QNet.save") as save,
+            patch("snake.agents.SnakeGame.is_over", return_value=True),
+        ):
+            agent = AIAgentFactory(
+                window_configuration=window_config, game_configuration=game_config, headless=True, persist_model=False
+            ).create_agent()
+            for _ in range(4):
+                agent.play_game()
+                agent.wants_to_play()
+
+        # pylint: disable=W0212
+        assert isinstance(agent._model._linear1, torch.nn.Linear)
+        assert agent._model._linear1.out_features == 32
+        assert agent._old_states_batch.array.shape[0] == 4
+        assert agent.get_metrics_summary()["epsilon"].get_mean() == pytest.approx((10 + 9 + 9 + 8) / 4)
+        assert pygame_event_handler.call_count == load.call_count == save.call_count == 0
+
+    def test_remembered_states_share_their_frames(
+        self,
+        _,
+        ai_agent_factory: AIAgentFactory,
+    ):
+        agent = ai_agent_factory.create_agent()
+        for _ in range(3):
+            agent.play_game()
+
+        # pylint: disable=W0212
+        first_step, second_step, third_step = agent._memory
+        assert first_step[0].indices == (0, 0)
+        assert first_step[3].indices == second_step[0].indices == (0, 1)
+        assert third_step[3].indices == (2, 3)
 
     @pytest.mark.integration
     @pytest.mark.parametrize(
         "action, new_direction, expected_snake",
         (
-            (Actions.STRAIGHT, Direction.RIGHT, [Point(x=55, y=25), Point(x=50, y=25), Point(x=45, y=25)]),
-            (Actions.RIGHT_TURN, Direction.DOWN, [Point(x=50, y=30), Point(x=50, y=25), Point(x=45, y=25)]),
-            (Actions.LEFT_TURN, Direction.UP, [Point(x=50, y=20), Point(x=50, y=25), Point(x=45, y=25)]),
+            (Actions.STRAIGHT, Direction.RIGHT, [Point(x=11, y=5), Point(x=10, y=5), Point(x=9, y=5)]),
+            (Actions.RIGHT_TURN, Direction.DOWN, [Point(x=10, y=6), Point(x=10, y=5), Point(x=9, y=5)]),
+            (Actions.LEFT_TURN, Direction.UP, [Point(x=10, y=4), Point(x=10, y=5), Point(x=9, y=5)]),
         ),
         ids=[
             "Initial direction is 'right' (default), action is 'straight' hence new direction will remain 'right.",
@@ -323,4 +519,71 @@ class TestAIAgent:
             with patch("snake.agents.AIAgent._get_actions", return_value=action):
                 agent.play_game()
 
-        assert agent.get_snake() == [Point(x=65, y=35), Point(x=60, y=35), Point(x=55, y=35)]
+        assert agent.get_snake() == [Point(x=13, y=7), Point(x=12, y=7), Point(x=11, y=7)]
+
+
+@patch("snake.game.GameUI")
+class TestMCTSAgent:
+    def test_abstract_agent_factory_creates_mcts_agent_that_plays(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+    ):
+        game_config.mcts_simulations = 5
+        agent = AbstractAgentFactory(
+            window_configuration=window_config, game_configuration=game_config, agent_type=Agents.MCTSAgent
+        ).create_agent()
+        assert isinstance(agent, MCTSAgent)
+        snake = agent.get_snake()
+
+        agent.play_game()
+
+        assert agent.get_snake() != snake
+        assert len(agent.get_snake()) == len(snake)
+
+
+@patch("snake.game.GameUI")
+class TestPathfindingAgent:
+    def test_abstract_agent_factory_creates_pathfinding_agent_that_reaches_food(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+    ):
+        agent = AbstractAgentFactory(
+            window_configuration=window_config, game_configuration=game_config, agent_type=Agents.PathfindingAgent
+        ).create_agent()
+
+        for _iteration in range(100):
+            agent.play_game()
+            if agent.get_score() > 0:
+                break
+
+        assert isinstance(agent, PathfindingAgent)
+        assert agent.get_score() == 1
+        assert not agent.game.is_over()
+
+
+@patch("snake.game.GameUI")
+class TestHamiltonianAgent:
+    def test_abstract_agent_factory_creates_hamiltonian_agent_that_fills_board(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+    ):
+        window_config.width, window_config.height = 30, 20
+        agent = AbstractAgentFactory(
+            window_configuration=window_config, game_configuration=game_config, agent_type=Agents.HamiltonianAgent
+        ).create_agent()
+        assert isinstance(agent, HamiltonianAgent)
+        board_size = 6 * 4
+
+        for _iteration in range(10_000):
+            agent.play_game()
+            if agent.game.is_over():
+                break
+
+        assert len(agent.get_snake()) == board_size
+        assert agent.get_score() == board_size - 3
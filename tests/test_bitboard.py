@@ -0,0 +1,62 @@
+from snake.bitboard import SnakeBitboard, popcount
+from snake.game_controls import Direction
+from snake.game_objects.objects import Grid, Point, Snake, SnakeHandler
+
+
+def occupied_cells(snake_bitboard: SnakeBitboard, grid: Grid) -> list:
+    return [cell for cell in range(grid.size) if snake_bitboard.occupied >> cell & 1]
+
+
+class TestSnakeBitboard:
+    def test_occupied_board_follows_snake(self, snake_handler: SnakeHandler, grid: Grid):
+        snake_bitboard = SnakeBitboard(snake_handler)
+
+        for direction in [Direction.UP, Direction.LEFT, Direction.LEFT]:
+            snake_handler.move_snake(direction)
+        snake_handler.extend_snake(Point(x=8, y=3))
+
+        assert occupied_cells(snake_bitboard, grid) == sorted(
+            grid.to_cell(point) for point in snake_handler.get_snake()
+        )
+        snake_handler.reset()
+        assert popcount(snake_bitboard.occupied) == 3
+
+    def test_count_on_open_board_is_capped_at_limit(self, snake_handler: SnakeHandler):
+        snake_bitboard = SnakeBitboard(snake_handler)
+
+        assert snake_bitboard.count_reachable_cells(Point(x=11, y=5), limit=3) == 3
+        assert snake_bitboard.count_reachable_cells(Point(x=11, y=5), limit=1_000) == 200 - 2
+
+    def test_count_for_blocked_or_outside_cell_is_zero(self, snake_handler: SnakeHandler):
+        snake_bitboard = SnakeBitboard(snake_handler)
+
+        assert snake_bitboard.count_reachable_cells(Point(x=9, y=5), limit=3) == 0
+        assert snake_bitboard.count_reachable_cells(Point(x=20, y=5), limit=3) == 0
+
+    def test_count_treats_tail_as_free(self, snake_handler: SnakeHandler):
+        snake_bitboard = SnakeBitboard(snake_handler)
+
+        assert snake_bitboard.count_reachable_cells(Point(x=8, y=5), limit=3) == 3
+
+    def test_flood_fill_does_not_wrap_between_rows(self):
+        grid = Grid(width=4, height=2)
+        snake_handler = SnakeHandler(
+            snake=Snake(head=Point(x=1, y=0), body=[Point(x=1, y=1), Point(x=2, y=1)]), grid=grid
+        )
+        snake_bitboard = SnakeBitboard(snake_handler)
+
+        assert snake_bitboard.count_reachable_cells(Point(x=0, y=0), limit=8) == 2
+        assert snake_bitboard.count_reachable_cells(Point(x=3, y=0), limit=8) == 4
+
+    def test_count_in_enclosed_pocket(self):
+        snake_handler = SnakeHandler(
+            snake=Snake(
+                head=Point(x=1, y=1),
+                body=[Point(x=2, y=1), Point(x=2, y=0), Point(x=2, y=2), Point(x=0, y=1), Point(x=0, y=2)],
+            ),
+            grid=Grid(width=5, height=5),
+        )
+        snake_bitboard = SnakeBitboard(snake_handler)
+
+        assert snake_bitboard.count_reachable_cells(Point(x=1, y=0), limit=6) == 2
+        assert snake_bitboard.count_reachable_cells(Point(x=1, y=2), limit=6) == 6
@@ -1,18 +1,23 @@
+import numpy as np
 import pytest
 
 from snake.collision_checker import CollisionChecker
-from snake.config import GameConfig, WindowConfig
-from snake.game_objects.objects import Point, Snake, SnakeHandler
+from snake.game_objects.objects import Grid, Point, Snake, SnakeHandler
+
+
+@pytest.fixture(name="collision_checker")
+def fixture_collision_checker(grid: Grid, snake_handler: SnakeHandler) -> CollisionChecker:
+    return CollisionChecker(grid=grid, snake_handler=snake_handler)
 
 
 class TestCollisionChecker:
     @pytest.mark.parametrize(
         "test_snake, expected_collision",
         [
-            (Snake(head=Point(x=50, y=-1), body=[Point(0, 0), Point(0, 0)], block_size=5), True),
-            (Snake(head=Point(x=50, y=46), body=[Point(0, 0), Point(0, 0)], block_size=5), True),
-            (Snake(head=Point(x=-1, y=25), body=[Point(0, 0), Point(0, 0)], block_size=5), True),
-            (Snake(head=Point(x=96, y=25), body=[Point(0, 0), Point(0, 0)], block_size=5), True),
+            (Snake(head=Point(x=10, y=-1), body=[Point(0, 0), Point(0, 0)]), True),
+            (Snake(head=Point(x=10, y=10), body=[Point(0, 0), Point(0, 0)]), True),
+            (Snake(head=Point(x=-1, y=5), body=[Point(0, 0), Point(0, 0)]), True),
+            (Snake(head=Point(x=20, y=5), body=[Point(0, 0), Point(0, 0)]), True),
         ],
         ids=[
             "snake hit top",
@@ -21,23 +26,19 @@ class TestCollisionChecker:
             "snake hit right side",
         ],
     )
-    def test_collision_detected_with_window_boundaries(
-        self, test_snake: Snake, expected_collision: bool, window_config: WindowConfig, game_config: GameConfig
-    ):
-        snake_handler = SnakeHandler(snake=test_snake)
-        collision_checker = CollisionChecker(
-            window_config=window_config, game_config=game_config, snake_handler=snake_handler
-        )
+    def test_collision_detected_with_window_boundaries(self, test_snake: Snake, expected_collision: bool, grid: Grid):
+        snake_handler = SnakeHandler(snake=test_snake, grid=grid)
+        collision_checker = CollisionChecker(grid=grid, snake_handler=snake_handler)
         assert collision_checker.collision_detected() == expected_collision
 
     @pytest.mark.parametrize(
         "test_snake, expected_collision",
         [
-            (Snake(head=Point(x=50, y=0), body=[Point(0, 0), Point(0, 0)], block_size=5), False),
-            (Snake(head=Point(x=50, y=45), body=[Point(0, 0), Point(0, 0)], block_size=5), False),
-            (Snake(head=Point(x=0, y=25), body=[Point(0, 0), Point(0, 0)], block_size=5), False),
-            (Snake(head=Point(x=95, y=25), body=[Point(0, 0), Point(0, 0)], block_size=5), False),
-            (Snake(head=Point(x=50, y=25), body=[Point(0, 0), Point(0, 0)], block_size=5), False),
+            (Snake(head=Point(x=10, y=0), body=[Point(0, 0), Point(0, 0)]), False),
+            (Snake(head=Point(x=10, y=9), body=[Point(0, 0), Point(0, 0)]), False),
+            (Snake(head=Point(x=0, y=5), body=[Point(0, 0), Point(0, 0)]), False),
+            (Snake(head=Point(x=19, y=5), body=[Point(0, 0), Point(0, 0)]), False),
+            (Snake(head=Point(x=10, y=5), body=[Point(0, 0), Point(0, 0)]), False),
         ],
         ids=[
             "snake does not hit top",
@@ -47,11 +48,31 @@ class TestCollisionChecker:
             "snake is in window center",
         ],
     )
-    def test_collision_detected_with_no_collision(
-        self, test_snake: Snake, expected_collision: bool, window_config: WindowConfig, game_config: GameConfig
-    ):
-        snake_handler = SnakeHandler(snake=test_snake)
-        collision_checker = CollisionChecker(
-            window_config=window_config, game_config=game_config, snake_handler=snake_handler
-        )
+    def test_collision_detected_with_no_collision(self, test_snake: Snake, expected_collision: bool, grid: Grid):
+        snake_handler = SnakeHandler(snake=test_snake, grid=grid)
+        collision_checker = CollisionChecker(grid=grid, snake_handler=snake_handler)
         assert collision_checker.collision_detected() == expected_collision
+
+    def test_wall_collisions_for_batch_of_points(self, collision_checker: CollisionChecker):
+        points = [Point(x=10, y=-1), Point(x=10, y=10), Point(x=-1, y=5), Point(x=20, y=5), Point(x=0, y=0)]
+        actual_collisions = collision_checker.wall_collisions(points)
+        assert actual_collisions.tolist() == [True, True, True, True, False]
+
+    def test_body_collisions_for_batch_of_points(self, collision_checker: CollisionChecker):
+        points = [Point(x=9, y=5), Point(x=8, y=5), Point(x=10, y=5), Point(x=11, y=5)]
+        actual_collisions = collision_checker.body_collisions(points)
+        assert actual_collisions.tolist() == [True, True, False, False]
+
+    def test_collisions_combines_wall_and_body_collisions(self, collision_checker: CollisionChecker):
+        points = np.array([[9, 5], [20, 5], [11, 5]])
+        actual_collisions = collision_checker.collisions(points)
+        assert actual_collisions.tolist() == [True, True, False]
+
+    def test_collisions_for_empty_batch(self, collision_checker: CollisionChecker):
+        assert collision_checker.collisions([]).shape == (0,)
+
+    def test_collision_detected_when_snake_bites_itself(
+        self, snake_handler: SnakeHandler, collision_checker: CollisionChecker
+    ):
+        snake_handler.extend_snake(Point(x=9, y=5))
+        assert collision_checker.collision_detected()
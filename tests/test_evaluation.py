@@ -0,0 +1,138 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+import torch
+
+from snake.config import GameConfig, WindowConfig
+from snake.evaluation import (
+    EpisodeOutcome,
+    EvaluationReport,
+    EvaluationResult,
+    PeriodicEvaluation,
+    run_evaluation,
+)
+from snake.model import LinearQNet
+
+
+@pytest.fixture(name="checkpoint")
+def fixture_checkpoint(tmp_path: Path) -> Path:
+    torch.manual_seed(0)
+    checkpoint = tmp_path / "model.pth"
+    torch.save(LinearQNet(input_feature_size=22).state_dict(), checkpoint)
+    return checkpoint
+
+
+class TestEvaluationReport:
+    def test_from_outcomes(self):
+        outcomes = [EpisodeOutcome(episode=episode, score=episode, steps=10) for episode in range(5)]
+
+        report = EvaluationReport.from_outcomes(outcomes, elapsed_seconds=2.0)
+
+        assert report.episodes == 5
+        assert report.score_mean == 2.0
+        assert report.score_quantiles == pytest.approx({"p10": 0.4, "p50": 2.0, "p90": 3.6})
+        assert report.score_max == 4
+        assert report.episode_length_mean == 10.0
+        assert report.steps_per_second == 25.0
+        assert "score mean" in report.get_summary()
+
+
+class TestRunEvaluation:
+    def test_seeded_evaluation_is_reproducible(
+        self, window_config: WindowConfig, game_config: GameConfig, checkpoint: Path
+    ):
+        first_report = run_evaluation(window_config, game_config, checkpoint, episodes=3, workers=1, seed=5)
+        second_report = run_evaluation(window_config, game_config, checkpoint, episodes=3, workers=1, seed=5)
+
+        assert first_report.episodes == 3
+        assert first_report.episode_length_mean > 0
+        assert first_report.scores == second_report.scores
+
+    def test_parallel_evaluation_matches_serial_evaluation(
+        self, window_config: WindowConfig, game_config: GameConfig, checkpoint: Path
+    ):
+        serial_report = run_evaluation(window_config, game_config, checkpoint, episodes=4, workers=1, seed=5)
+        parallel_report = run_evaluation(window_config, game_config, checkpoint, episodes=4, workers=2, seed=5)
+
+        assert parallel_report.scores == serial_report.scores
+
+    def test_without_checkpoint_evaluates_model_file_of_configured_network(
+        self, window_config: WindowConfig, game_config: GameConfig, checkpoint: Path, tmp_path: Path
+    ):
+        (tmp_path / "model").mkdir()
+        checkpoint.rename(tmp_path / "model" / "model_22.pth")
+
+        report = run_evaluation(window_config, game_config, None, episodes=1, workers=1, seed=0)
+
+        assert report.episodes == 1
+
+    def test_checkpoint_for_other_network_raises(
+        self, window_config: WindowConfig, game_config: GameConfig, tmp_path: Path
+    ):
+        checkpoint = tmp_path / "other.pth"
+        torch.save(LinearQNet(input_feature_size=5).state_dict(), checkpoint)
+
+        with pytest.raises(ValueError):
+            run_evaluation(window_config, game_config, checkpoint, episodes=1, workers=1, seed=0)
+
+
+def wait_for_result(periodic_evaluation: PeriodicEvaluation) -> EvaluationResult:
+    result: Optional[EvaluationResult] = None
+    while result is None:
+        time.sleep(0.01)
+        result = periodic_evaluation.poll()
+    return result
+
+
+class TestPeriodicEvaluation:
+    def test_snapshots_are_evaluated_in_background_and_best_is_tracked(
+        self, window_config: WindowConfig, game_config: GameConfig
+    ):
+        model = LinearQNet(input_feature_size=22, load_saved_model=False)
+        periodic_evaluation = PeriodicEvaluation(
+            window_config=window_config, game_config=game_config, interval_games=10, episodes=2, seed=0
+        )
+
+        with patch("snake.evaluation.ProcessPoolExecutor", lambda **_: ThreadPoolExecutor(max_workers=1)):
+            assert not periodic_evaluation.should_evaluate(5)
+            assert periodic_evaluation.should_evaluate(10)
+            periodic_evaluation.submit(10, model)
+            assert not periodic_evaluation.should_evaluate(20)
+            first_result = wait_for_result(periodic_evaluation)
+
+            periodic_evaluation.submit(20, model)
+            second_result = wait_for_result(periodic_evaluation)
+            periodic_evaluation.close()
+
+        assert first_result.games == 10
+        assert first_result.report.episodes == 2
+        assert first_result.is_best
+        assert second_result.report.scores == first_result.report.scores
+        assert not second_result.is_best
+        for name, tensor in model.state_dict().items():
+            assert torch.equal(first_result.state_dict[name], tensor)
+
+    def test_failed_evaluation_is_reported_without_stopping_training(
+        self, window_config: WindowConfig, game_config: GameConfig, capsys: pytest.CaptureFixture
+    ):
+        model = LinearQNet(input_feature_size=22, load_saved_model=False)
+        periodic_evaluation = PeriodicEvaluation(
+            window_config=window_config, game_config=game_config, interval_games=10, episodes=2, seed=0
+        )
+
+        with patch("snake.evaluation.ProcessPoolExecutor", lambda **_: ThreadPoolExecutor(max_workers=1)):
+            with patch("snake.evaluation.run_evaluation", side_effect=RuntimeError("worker died")):
+                periodic_evaluation.submit(10, model)
+                while not periodic_evaluation.should_evaluate(20):
+                    time.sleep(0.01)
+                    assert periodic_evaluation.poll() is None
+            periodic_evaluation.submit(20, model)
+            result = wait_for_result(periodic_evaluation)
+            periodic_evaluation.close()
+
+        assert "Evaluation after 10 games failed: RuntimeError('worker died')" in capsys.readouterr().err
+        assert result.games == 20
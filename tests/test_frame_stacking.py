@@ -0,0 +1,76 @@
+import numpy as np
+
+from snake.frame_stacking import FrameBuffer, FrameStacker
+
+
+def create_frame(value: float) -> np.ndarray:
+    return np.full((1, 2, 2), value, dtype=np.float32)
+
+
+class TestFrameBuffer:
+    def test_append_overwrites_oldest_frame_when_full(self):
+        frame_buffer = FrameBuffer(capacity=2, frame_shape=(1, 2, 2))
+        indices = [frame_buffer.append(create_frame(value)) for value in range(3)]
+        out = np.empty((2, 1, 2, 2), dtype=np.float32)
+
+        frame_buffer.gather(np.array([1, 2]), out=out)
+
+        assert indices == [0, 1, 2]
+        np.testing.assert_array_equal(out, np.stack([create_frame(1), create_frame(2)]))
+
+    def test_append_grows_allocation_up_to_capacity(self):
+        frame_buffer = FrameBuffer(capacity=5, frame_shape=(1, 2, 2), initial_size=2)
+        allocated_sizes = []
+        for value in range(7):
+            frame_buffer.append(create_frame(value))
+            allocated_sizes.append(frame_buffer.allocated_size)
+        out = np.empty((5, 1, 2, 2), dtype=np.float32)
+
+        frame_buffer.gather(np.arange(2, 7), out=out)
+
+        assert allocated_sizes == [2, 2, 4, 4, 5, 5, 5]
+        np.testing.assert_array_equal(out, np.stack([create_frame(value) for value in range(2, 7)]))
+
+
+class TestFrameStacker:
+    def test_reset_repeats_first_frame(self):
+        frame_stacker = FrameStacker(frame_shape=(1, 2, 2), depth=3, capacity=8)
+
+        stack = frame_stacker.reset(create_frame(5))
+
+        assert stack.indices == (0, 0, 0)
+        assert stack.shape == frame_stacker.stacked_shape == (3, 2, 2)
+        np.testing.assert_array_equal(stack.materialize(), np.full((3, 2, 2), 5))
+
+    def test_push_keeps_most_recent_frames_in_order(self):
+        frame_stacker = FrameStacker(frame_shape=(3,), depth=2, capacity=8)
+        frame_stacker.reset(np.array([1, 2, 3]))
+
+        first_stack = frame_stacker.push(np.array([4, 5, 6]))
+        second_stack = frame_stacker.push(np.array([7, 8, 9]))
+
+        assert second_stack.shape == (6,)
+        np.testing.assert_array_equal(first_stack.materialize(), [1, 2, 3, 4, 5, 6])
+        np.testing.assert_array_equal(second_stack.materialize(), [4, 5, 6, 7, 8, 9])
+
+    def test_stacks_share_frames_instead_of_copying_them(self):
+        frame_stacker = FrameStacker(frame_shape=(1, 2, 2), depth=4, capacity=16)
+        frame_stacker.reset(create_frame(0))
+        stacks = [frame_stacker.push(create_frame(value)) for value in range(1, 6)]
+
+        assert stacks[-1].indices == (2, 3, 4, 5)
+        assert stacks[-2].indices == (1, 2, 3, 4)
+
+    def test_materialize_batch_writes_into_given_array(self):
+        frame_stacker = FrameStacker(frame_shape=(1, 2, 2), depth=2, capacity=8)
+        frame_stacker.reset(create_frame(0))
+        stacks = [frame_stacker.push(create_frame(value)) for value in range(1, 4)]
+        out = np.zeros((5, 2, 2, 2), dtype=np.float32)
+
+        batch = frame_stacker.materialize_batch([stacks[2], stacks[0]], out=out)
+
+        assert np.shares_memory(batch, out)
+        assert batch.shape == (2, 2, 2, 2)
+        np.testing.assert_array_equal(batch[0], stacks[2].materialize())
+        np.testing.assert_array_equal(batch[1], stacks[0].materialize())
+        assert not out[2:].any()
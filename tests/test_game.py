@@ -1,12 +1,21 @@
-from typing import List
-from unittest.mock import patch
+from typing import List, cast
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from snake.config import GameConfig, WindowConfig
+from snake.exceptions import FoodPlacedInSnakeException
 from snake.game import SnakeGame, SnakeGameFactory
-from snake.game_controls import Direction
-from snake.game_objects.objects import Food, FoodHandler, Point, Snake, SnakeHandler
+from snake.game_controls import Direction, SpeedMode
+from snake.game_objects.objects import (
+    Food,
+    FoodHandler,
+    Grid,
+    Point,
+    Snake,
+    SnakeHandler,
+)
 from snake.publisher import PublisherEvents, ScoreSubscriber
 from tests.fake_classes import FakePublisher, FakeSubscriber
 
@@ -14,6 +23,7 @@ from tests.fake_classes import FakePublisher, FakeSubscriber
 @patch("snake.game.GameUI")
 class TestSnakeGame:
     # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-public-methods
     # pylint: disable=duplicate-code
     def test_run_sets_game_over_on_max_game_iteration(self, _, snake_game: SnakeGame):
         with patch("snake.game.SnakeGame._move_snake_and_check_for_collision"):
@@ -24,10 +34,10 @@ class TestSnakeGame:
     @pytest.mark.parametrize(
         "input_direction, expected_snake",
         (
-            (None, [Point(x=55, y=25), Point(x=50, y=25), Point(x=45, y=25)]),
-            (Direction.RIGHT, [Point(x=55, y=25), Point(x=50, y=25), Point(x=45, y=25)]),
-            (Direction.UP, [Point(x=50, y=20), Point(x=50, y=25), Point(x=45, y=25)]),
-            (Direction.DOWN, [Point(x=50, y=30), Point(x=50, y=25), Point(x=45, y=25)]),
+            (None, [Point(x=11, y=5), Point(x=10, y=5), Point(x=9, y=5)]),
+            (Direction.RIGHT, [Point(x=11, y=5), Point(x=10, y=5), Point(x=9, y=5)]),
+            (Direction.UP, [Point(x=10, y=4), Point(x=10, y=5), Point(x=9, y=5)]),
+            (Direction.DOWN, [Point(x=10, y=6), Point(x=10, y=5), Point(x=9, y=5)]),
         ),
         ids=[
             "no input from user -> snake has to move to the right side (default)",
@@ -51,10 +61,10 @@ class TestSnakeGame:
     @pytest.mark.parametrize(
         "initial_direction, updated_direction, expected_snake",
         (
-            (Direction.RIGHT, Direction.LEFT, [Point(x=60, y=25), Point(x=55, y=25), Point(x=50, y=25)]),
-            (Direction.LEFT, Direction.RIGHT, [Point(x=60, y=25), Point(x=55, y=25), Point(x=50, y=25)]),
-            (Direction.UP, Direction.DOWN, [Point(x=50, y=15), Point(x=50, y=20), Point(x=50, y=25)]),
-            (Direction.DOWN, Direction.UP, [Point(x=50, y=35), Point(x=50, y=30), Point(x=50, y=25)]),
+            (Direction.RIGHT, Direction.LEFT, [Point(x=12, y=5), Point(x=11, y=5), Point(x=10, y=5)]),
+            (Direction.LEFT, Direction.RIGHT, [Point(x=12, y=5), Point(x=11, y=5), Point(x=10, y=5)]),
+            (Direction.UP, Direction.DOWN, [Point(x=10, y=3), Point(x=10, y=4), Point(x=10, y=5)]),
+            (Direction.DOWN, Direction.UP, [Point(x=10, y=7), Point(x=10, y=6), Point(x=10, y=5)]),
         ),
         ids=[
             "initial direction right, updated direction left -> snake must not change direction.",
@@ -91,7 +101,71 @@ class TestSnakeGame:
             snake_game.update_direction(direction)
             snake_game.run()
 
-        assert snake_handler.get_snake() == [Point(x=60, y=40), Point(x=60, y=35), Point(x=60, y=30)]
+        assert snake_handler.get_snake() == [Point(x=12, y=8), Point(x=12, y=7), Point(x=12, y=6)]
+
+    def test_run_ends_game_when_position_repeats_without_food(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        snake_handler: SnakeHandler,
+        food_handler: FoodHandler,
+        fake_publisher: FakePublisher,
+        fake_subscriber: FakeSubscriber,
+    ):
+        game_config.loop_detection = True
+        game = SnakeGame(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+            publisher=fake_publisher,
+        )
+        game.add_subscriber(fake_subscriber)
+        with patch("snake.game.SnakeGame._handle_snake_reached_food"):
+            for direction in [Direction.UP, Direction.LEFT, Direction.DOWN, Direction.RIGHT, Direction.UP]:
+                assert not game.is_over()
+                game.update_direction(direction)
+                game.run()
+
+        assert game.is_over()
+        assert fake_publisher.all_events[-1] == PublisherEvents.LOOP_DETECTED
+
+    def test_run_ignores_repeated_positions_without_loop_detection(self, _, snake_game: SnakeGame):
+        with patch("snake.game.SnakeGame._handle_snake_reached_food"):
+            for direction in [Direction.UP, Direction.LEFT, Direction.DOWN, Direction.RIGHT] * 2:
+                snake_game.update_direction(direction)
+                snake_game.run()
+
+        assert not snake_game.is_over()
+
+    def test_restore_returns_to_snapshot(self, _, snake_game: SnakeGame):
+        snapshot = snake_game.snapshot()
+        snake = snake_game.get_snake()
+        food = snake_game.get_food()
+
+        for direction in [Direction.UP, Direction.LEFT]:
+            snake_game.update_direction(direction)
+            snake_game.run()
+        snake_game.restore(snapshot)
+
+        assert snake_game.snapshot() == snapshot
+        assert snake_game.get_snake() == snake
+        assert snake_game.get_food() == food
+        assert snake_game.get_current_direction() is Direction.RIGHT
+        assert not snake_game.collision_detected()
+
+    def test_simulate_steps_without_events_or_new_food(
+        self, _, snake_game: SnakeGame, fake_publisher: FakePublisher, grid: Grid
+    ):
+        snake_game.get_food_handler().set_current_food_cell(grid.to_cell(Point(x=11, y=5)))
+
+        with patch("snake.game.FoodHandler.move_food_to_random_position") as mocked_move_food:
+            assert snake_game.simulate(Direction.RIGHT) == (10, True)
+
+        assert snake_game.get_score() == 1
+        assert mocked_move_food.call_count == 0
+        assert not fake_publisher.all_events
 
     def test_run_quits_game_on_collision(self, _, snake_game: SnakeGame):
         with patch("snake.game.CollisionChecker.collision_detected", return_value=True):
@@ -126,13 +200,14 @@ class TestSnakeGame:
         _,
         window_config: WindowConfig,
         game_config: GameConfig,
+        grid: Grid,
         fake_publisher: FakePublisher,
     ):
-        snake = Snake(head=Point(x=50, y=25), body=[Point(x=45, y=25), Point(x=40, y=25)], block_size=5)
-        snake_handler = SnakeHandler(snake=snake)
+        snake = Snake(head=Point(x=10, y=5), body=[Point(x=9, y=5), Point(x=8, y=5)])
+        snake_handler = SnakeHandler(snake=snake, grid=grid)
 
-        food = Food(width=55, height=25, block_size=game_config.outer_block_size)
-        food_handler = FoodHandler(food=food, window_config=window_config)
+        food = Food(cell=grid.to_cell(Point(x=11, y=5)))
+        food_handler = FoodHandler(food=food, grid=grid, random_generator=np.random.default_rng(seed=0))
 
         with patch("snake.game.FoodHandler.move_food_to_random_position"), patch(
             "snake.game.SnakeGame._place_new_food"
@@ -155,14 +230,15 @@ class TestSnakeGame:
         _,
         window_config: WindowConfig,
         game_config: GameConfig,
+        grid: Grid,
         fake_publisher: FakePublisher,
         fake_subscriber: FakeSubscriber,
     ):
-        snake = Snake(head=Point(x=50, y=25), body=[Point(x=45, y=25), Point(x=40, y=25)], block_size=5)
-        snake_handler = SnakeHandler(snake=snake)
+        snake = Snake(head=Point(x=10, y=5), body=[Point(x=9, y=5), Point(x=8, y=5)])
+        snake_handler = SnakeHandler(snake=snake, grid=grid)
 
-        food = Food(width=55, height=25, block_size=game_config.outer_block_size)
-        food_handler = FoodHandler(food=food, window_config=window_config)
+        food = Food(cell=grid.to_cell(Point(x=11, y=5)))
+        food_handler = FoodHandler(food=food, grid=grid, random_generator=np.random.default_rng(seed=0))
 
         with patch("snake.game.FoodHandler.move_food_to_random_position"), patch(
             "snake.game.SnakeGame._place_new_food"
@@ -179,6 +255,151 @@ class TestSnakeGame:
 
             assert fake_publisher.all_events == [PublisherEvents.REACHED_FOOD]
 
+    def test_reset_restores_initial_game_in_place(
+        self,
+        _,
+        snake_game: SnakeGame,
+        snake_handler: SnakeHandler,
+    ):
+        initial_snake = snake_handler.get_snake()
+        with patch("snake.game.CollisionChecker.collision_detected", return_value=True):
+            snake_game.update_direction(Direction.DOWN)
+            snake_game.run()
+        assert snake_game.is_over()
+
+        snake_game.reset()
+
+        assert not snake_game.is_over()
+        assert snake_game.get_score() == 0
+        assert snake_game.get_current_direction() == Direction.RIGHT
+        assert snake_handler.get_snake() == initial_snake
+        assert snake_game.get_food() not in initial_snake
+
+    def test_reset_in_scenario_mode_uses_predetermined_food_per_episode(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+    ):
+        game_config.seed = 7
+        game_config.scenario = True
+        factory = SnakeGameFactory(window_configuration=window_config, game_configuration=game_config)
+        first_game = factory.create_snake_game()
+        second_game = factory.create_snake_game()
+
+        first_game.reset()
+        first_game.reset(episode=3)
+        second_game.reset(episode=3)
+
+        assert first_game.get_episode() == second_game.get_episode() == 3
+        assert first_game.get_food() == second_game.get_food()
+
+    def test_seeded_games_place_the_same_food(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+    ):
+        game_config.seed = 7
+        factory = SnakeGameFactory(window_configuration=window_config, game_configuration=game_config)
+        first_game = factory.create_snake_game()
+        second_game = factory.create_snake_game()
+
+        for _ in range(5):
+            assert first_game.get_food() == second_game.get_food()
+            first_game.reset()
+            second_game.reset()
+
+    def test_run_publishes_no_reset_event_after_food_was_moved(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+        grid: Grid,
+        fake_publisher: FakePublisher,
+    ):
+        snake = Snake(head=Point(x=10, y=5), body=[Point(x=9, y=5), Point(x=8, y=5)])
+        snake_handler = SnakeHandler(snake=snake, grid=grid)
+        food_handler = FoodHandler(food=Food(cell=0), grid=grid, random_generator=np.random.default_rng(seed=0))
+
+        game = SnakeGame(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+            publisher=fake_publisher,
+        )
+        # pylint: disable=W0212
+        food_handler._food.cell = grid.to_cell(Point(x=11, y=5))
+        game.run()
+
+        assert game.get_food() != Point(x=11, y=5)
+        assert fake_publisher.all_events == [PublisherEvents.REACHED_FOOD]
+
+    def test_run_renders_and_paces_every_step_in_watch_mode(self, _, snake_game: SnakeGame):
+        # pylint: disable=W0212
+        game_ui = cast(MagicMock, snake_game._ui)
+        snake_game.run()
+        snake_game.run()
+
+        assert game_ui.update_snake_food_and_text.call_count == 2
+        assert game_ui.update_clock.call_count == 2
+
+    def test_run_renders_every_nth_step_without_pacing_in_fast_mode(self, _, snake_game: SnakeGame):
+        # pylint: disable=W0212
+        game_ui = cast(MagicMock, snake_game._ui)
+        snake_game.update_speed(SpeedMode.FAST)
+        for _ in range(2 * snake_game.get_speed_governor().get_frame_skip()):
+            snake_game.run()
+
+        assert game_ui.update_snake_food_and_text.call_count == 2
+        game_ui.update_clock.assert_not_called()
+
+    def test_run_does_not_render_in_dark_mode(self, _, snake_game: SnakeGame):
+        # pylint: disable=W0212
+        game_ui = cast(MagicMock, snake_game._ui)
+        snake_game.update_speed(SpeedMode.DARK)
+        snake_game.run()
+
+        game_ui.update_snake_food_and_text.assert_not_called()
+        game_ui.update_clock.assert_not_called()
+
+    def test_new_food_is_placed_on_free_cell_when_random_positions_hit_the_snake(
+        self, _, snake_game: SnakeGame, snake_handler: SnakeHandler, food_handler: FoodHandler
+    ):
+        food_handler.set_current_food_cell(snake_handler.grid.to_cell(Point(x=11, y=5)))
+
+        with patch(
+            "snake.game.SnakeGame._place_new_food_at_random_position", side_effect=FoodPlacedInSnakeException("")
+        ):
+            snake_game.run()
+
+        assert snake_game.get_score() == 1
+        assert snake_game.get_food() not in snake_handler.get_snake()
+
+    def test_run_sets_game_over_when_snake_fills_board(
+        self, _, window_config: WindowConfig, game_config: GameConfig, fake_publisher: FakePublisher
+    ):
+        grid = Grid(width=2, height=2)
+        snake = Snake(head=Point(x=1, y=0), body=[Point(x=0, y=0), Point(x=0, y=1)])
+        snake_handler = SnakeHandler(snake=snake, grid=grid)
+        food_handler = FoodHandler(food=Food(cell=0), grid=grid, random_generator=np.random.default_rng(seed=0))
+        game = SnakeGame(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=snake_handler,
+            food_handler=food_handler,
+            publisher=fake_publisher,
+        )
+        assert game.get_food() == Point(x=1, y=1)
+
+        game.update_direction(Direction.DOWN)
+        game.run()
+
+        assert game.is_over()
+        assert game.get_score() == 1
+        assert len(game.get_snake()) == grid.size
+
     def test_add_subscriber(
         self,
         _,
@@ -213,3 +434,32 @@ class TestSnakeGameFactory:
         factory = SnakeGameFactory(window_configuration=window_config, game_configuration=game_config)
 
         assert isinstance(factory.create_snake_game(), SnakeGame)
+
+    def test_create_snake_game_uses_configured_renderer(
+        self,
+        mocked_game_ui,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+    ):
+        game_config.renderer = "FramebufferGameUI"
+        factory = SnakeGameFactory(window_configuration=window_config, game_configuration=game_config)
+
+        with patch("snake.game.FramebufferGameUI") as mocked_framebuffer_game_ui:
+            factory.create_snake_game()
+
+        mocked_framebuffer_game_ui.assert_called_once()
+        mocked_game_ui.assert_not_called()
+
+    def test_create_snake_game_with_decoupled_rendering(
+        self,
+        _,
+        window_config: WindowConfig,
+        game_config: GameConfig,
+    ):
+        game_config.decoupled_rendering = True
+        factory = SnakeGameFactory(window_configuration=window_config, game_configuration=game_config)
+
+        with patch("snake.game.DecoupledGameUI") as mocked_decoupled_game_ui:
+            factory.create_snake_game()
+
+        mocked_decoupled_game_ui.assert_called_once()
@@ -2,10 +2,27 @@ from typing import List
 from unittest.mock import patch
 
 import pytest
-from pygame.constants import K_DOWN, K_LEFT, K_RIGHT, K_UP, KEYDOWN, QUIT
+from pygame.constants import (
+    K_DOWN,
+    K_EQUALS,
+    K_LEFT,
+    K_MINUS,
+    K_RIGHT,
+    K_UP,
+    KEYDOWN,
+    QUIT,
+    K_d,
+    K_f,
+    K_w,
+)
 from pygame.event import Event as PyEvent
 
-from snake.game_controls import Direction, PygameEventHandler
+from snake.game_controls import (
+    Direction,
+    HeadlessEventHandler,
+    PygameEventHandler,
+    SpeedMode,
+)
 
 INVALID_KEY = float("inf")
 
@@ -47,3 +64,50 @@ class TestPygameEventHandler:
             event_handler.handle_events()
             actual_direction = event_handler.get_updated_direction()
             assert actual_direction == expected_direction
+
+    @pytest.mark.parametrize(
+        "fake_input_event, expected_speed_mode",
+        [
+            ([PyEvent(KEYDOWN, key=K_w)], SpeedMode.WATCH),
+            ([PyEvent(KEYDOWN, key=K_f)], SpeedMode.FAST),
+            ([PyEvent(KEYDOWN, key=K_d)], SpeedMode.DARK),
+            ([PyEvent(KEYDOWN, key=K_RIGHT)], None),
+        ],
+        ids=[
+            "KEYDOWN event w key",
+            "KEYDOWN event f key",
+            "KEYDOWN event d key",
+            "KEYDOWN event without speed mode",
+        ],
+    )
+    def test_get_updated_speed_mode_for_key_down_event(
+        self, fake_input_event: List[PyEvent], expected_speed_mode: SpeedMode
+    ):
+        with patch(target="snake.game_controls.get_pygame_events") as mocked_pygame_events:
+            mocked_pygame_events.return_value = fake_input_event
+            event_handler = PygameEventHandler()
+            event_handler.handle_events()
+            assert event_handler.get_updated_speed_mode() == expected_speed_mode
+
+    def test_get_frame_skip_change_counts_presses_of_last_handled_events(self):
+        with patch(target="snake.game_controls.get_pygame_events") as mocked_pygame_events:
+            mocked_pygame_events.return_value = [PyEvent(KEYDOWN, key=K_EQUALS)] * 3 + [PyEvent(KEYDOWN, key=K_MINUS)]
+            event_handler = PygameEventHandler()
+            event_handler.handle_events()
+            assert event_handler.get_frame_skip_change() == 2
+
+            mocked_pygame_events.return_value = []
+            event_handler.handle_events()
+            assert event_handler.get_frame_skip_change() == 0
+
+
+class TestHeadlessEventHandler:
+    def test_headless_event_handler_never_changes_the_game(self):
+        with patch(target="snake.game_controls.get_pygame_events") as mocked_pygame_events:
+            event_handler = HeadlessEventHandler()
+            event_handler.handle_events()
+
+            assert mocked_pygame_events.call_count == 0
+            assert event_handler.get_updated_direction() is None
+            assert event_handler.get_updated_speed_mode() is None
+            assert not event_handler.quit_game()
@@ -0,0 +1,59 @@
+import pytest
+
+from snake.exceptions import NoHamiltonianCycleException
+from snake.game_objects.objects import Grid, Point, SnakeHandler
+from snake.hamiltonian import HamiltonianPlanner, create_hamiltonian_cycle
+
+
+def are_neighbours(grid: Grid, first_cell: int, second_cell: int) -> bool:
+    first, second = grid.to_point(first_cell), grid.to_point(second_cell)
+    return abs(first.x - second.x) + abs(first.y - second.y) == 1
+
+
+class TestHamiltonianCycle:
+    @pytest.mark.parametrize("grid", [Grid(width=20, height=10), Grid(width=5, height=4), Grid(width=4, height=5)])
+    def test_cycle_visits_every_cell_once_through_neighbours(self, grid: Grid):
+        cycle = create_hamiltonian_cycle(grid)
+
+        assert sorted(cycle.cells) == list(range(grid.size))
+        for cell in cycle.cells:
+            assert are_neighbours(grid, cell, cycle.successor(cell))
+
+    @pytest.mark.parametrize("grid", [Grid(width=5, height=5), Grid(width=1, height=4)])
+    def test_grid_without_cycle_raises(self, grid: Grid):
+        with pytest.raises(NoHamiltonianCycleException):
+            create_hamiltonian_cycle(grid)
+
+    def test_cycle_is_created_once_per_board_size(self):
+        assert create_hamiltonian_cycle(Grid(width=6, height=4)) is create_hamiltonian_cycle(Grid(width=6, height=4))
+
+    def test_distance_follows_cycle_order(self):
+        cycle = create_hamiltonian_cycle(Grid(width=6, height=4))
+        cell = cycle.cells[3]
+
+        assert cycle.distance(cell, cycle.successor(cell)) == 1
+        assert cycle.distance(cycle.successor(cell), cell) == cycle.size - 1
+        assert cycle.reversed().successor(cycle.successor(cell)) == cell
+
+
+class TestHamiltonianPlanner:
+    def test_cycle_direction_matches_start_snake(self, snake_handler: SnakeHandler, grid: Grid):
+        planner = HamiltonianPlanner(snake_handler=snake_handler)
+
+        assert planner.cycle.successor(grid.to_cell(snake_handler.body[0])) == grid.to_cell(snake_handler.head)
+
+    def test_takes_shortcut_towards_food(self, snake_handler: SnakeHandler, grid: Grid):
+        planner = HamiltonianPlanner(snake_handler=snake_handler)
+
+        assert planner.next_cell(grid.to_cell(Point(x=10, y=4))) == grid.to_cell(Point(x=10, y=4))
+
+    def test_does_not_shortcut_past_food(self, snake_handler: SnakeHandler, grid: Grid):
+        planner = HamiltonianPlanner(snake_handler=snake_handler)
+
+        assert planner.next_cell(grid.to_cell(Point(x=12, y=5))) == grid.to_cell(Point(x=11, y=5))
+
+    def test_follows_cycle_without_shortcuts(self, snake_handler: SnakeHandler, grid: Grid):
+        planner = HamiltonianPlanner(snake_handler=snake_handler, max_shortcut_fill=0)
+        head = grid.to_cell(snake_handler.head)
+
+        assert planner.next_cell(grid.to_cell(Point(x=10, y=4))) == planner.cycle.successor(head)
@@ -0,0 +1,71 @@
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from snake.config import GameConfig, WindowConfig
+from snake.game import SnakeGame
+from snake.game_controls import Direction
+from snake.game_objects.objects import (
+    AbstractSnakeListener,
+    Food,
+    FoodHandler,
+    Grid,
+    Point,
+    Snake,
+    SnakeHandler,
+)
+from snake.mcts import MonteCarloTreeSearch, turn
+from snake.model import LinearQNet
+from snake.state import State
+from tests.fake_classes import FakePublisher
+
+
+@pytest.mark.parametrize(
+    "action, expected_direction",
+    ((0, Direction.UP), (1, Direction.RIGHT), (2, Direction.LEFT)),
+)
+def test_turn_is_relative_to_direction(action: int, expected_direction: Direction):
+    assert turn(Direction.UP, action) is expected_direction
+
+
+def create_game(window_config: WindowConfig, game_config: GameConfig, grid: Grid) -> SnakeGame:
+    snake = Snake(head=Point(x=19, y=5), body=[Point(x=18, y=5), Point(x=17, y=5)])
+    food_handler = FoodHandler(
+        food=Food(cell=grid.to_cell(Point(x=19, y=2))), grid=grid, random_generator=np.random.default_rng(0)
+    )
+    with patch("snake.game.GameUI"), patch("snake.game.SnakeGame._place_new_food"):
+        return SnakeGame(
+            window_config=window_config,
+            game_config=game_config,
+            snake_handler=SnakeHandler(snake=snake, grid=grid),
+            food_handler=food_handler,
+            publisher=FakePublisher(),
+        )
+
+
+class TestMonteCarloTreeSearch:
+    def test_search_avoids_wall_without_touching_played_game(
+        self, window_config: WindowConfig, game_config: GameConfig, grid: Grid
+    ):
+        game = create_game(window_config, game_config, grid)
+        listener = Mock(spec=AbstractSnakeListener)
+        game.get_snake_handler().add_listener(listener)
+        search_game = create_game(window_config, game_config, grid)
+        search_state = State(game=search_game)
+        frame = np.asarray(State(game=game).calculate_state_from_game(), dtype=np.float32)
+        search = MonteCarloTreeSearch(
+            game=search_game,
+            state=search_state,
+            model=LinearQNet(input_feature_size=2 * len(frame)),
+            simulations=30,
+            exploration=1.5,
+            discount=0.9,
+        )
+        snapshot = game.snapshot()
+
+        action = search.search(root_state=snapshot, frames=(frame, frame))
+
+        assert turn(Direction.RIGHT, action) is not Direction.RIGHT
+        assert game.snapshot() == snapshot
+        assert not listener.method_calls
@@ -0,0 +1,59 @@
+import tracemalloc
+
+import numpy as np
+import torch
+
+from snake.config import GameConfig
+from snake.frame_stacking import FrameBuffer, FrameStacker
+from snake.memory_diagnostics import (
+    MemoryDiagnostics,
+    create_memory_diagnostics,
+    deep_sizeof,
+    measure_peak_allocated_bytes,
+)
+
+
+class TestDeepSizeof:
+    def test_counts_array_and_tensor_data(self):
+        sections = {"array": np.zeros(1_000, dtype=np.float64), "tensor": torch.zeros(1_000, dtype=torch.float32)}
+
+        assert deep_sizeof(sections) >= 8_000 + 4_000
+
+    def test_shared_objects_are_counted_for_first_owner_only(self):
+        frame_stacker = FrameStacker(frame_shape=(100,), depth=4, capacity=1_000)
+        stacks = [frame_stacker.push(np.ones(100)) for _ in range(10)]
+        memory_diagnostics = MemoryDiagnostics(interval_episodes=1, tracemalloc_frames=0)
+
+        sizes = memory_diagnostics.measure({"frame stacker": frame_stacker, "replay memory": stacks})
+
+        assert sizes["frame stacker"] >= 1_000 * 100 * 4
+        assert sizes["replay memory"] < 100 * 4 * 10
+
+
+class TestMemoryDiagnostics:
+    def test_report_lists_sections_and_allocation_sites(self):
+        memory_diagnostics = MemoryDiagnostics(interval_episodes=10, top_allocations=3)
+        try:
+            memory_diagnostics.report(episode=10, sections={"list": []})
+            allocations = [bytearray(10_000) for _ in range(10)]
+            report = memory_diagnostics.report(episode=20, sections={"list": allocations})
+        finally:
+            memory_diagnostics.stop()
+
+        assert "Memory after episode 20" in report
+        assert "Top 3 allocation sites" in report
+        assert __file__ in report
+        assert memory_diagnostics.should_report(20)
+        assert not memory_diagnostics.should_report(21)
+        assert not tracemalloc.is_tracing()
+
+
+def test_frame_buffer_append_does_not_allocate():
+    frame_buffer = FrameBuffer(capacity=100, frame_shape=(3, 20, 20))
+    frame = np.ones((3, 20, 20), dtype=np.float32)
+
+    assert measure_peak_allocated_bytes(lambda: frame_buffer.append(frame)) < 1_000
+
+
+def test_create_memory_diagnostics_is_disabled_by_default(game_config: GameConfig):
+    assert create_memory_diagnostics(game_config) is None
@@ -0,0 +1,104 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from snake.metrics import (
+    EpisodeMetrics,
+    MetricsSummary,
+    MetricsWriter,
+    StreamingStatistic,
+    read_metrics,
+)
+from snake.plot_metrics import moving_average
+
+
+def create_metrics(episode: int) -> EpisodeMetrics:
+    return EpisodeMetrics(
+        episode=episode,
+        score=episode % 3,
+        steps=10 * episode,
+        reward_sum=episode - 5,
+        epsilon=80 - episode,
+        loss=0.5,
+        steps_per_second=1_000.0,
+        replay_size=10 * episode,
+    )
+
+
+class TestMetricsWriter:
+    @pytest.mark.parametrize("file_name", ["metrics.jsonl", "metrics.csv"])
+    def test_written_metrics_can_be_read_back(self, tmp_path: Path, file_name: str):
+        path = tmp_path / "run" / file_name
+        metrics_writer = MetricsWriter(path, flush_episodes=2)
+        metrics_writer.start()
+        for episode in range(1, 6):
+            metrics_writer.write(create_metrics(episode))
+        metrics_writer.close()
+
+        rows = list(read_metrics(path))
+        assert [row["episode"] for row in rows] == [1, 2, 3, 4, 5]
+        assert rows[-1]["reward_sum"] == 0
+        assert set(rows[0]) == set(EpisodeMetrics.get_field_names())
+
+    @pytest.mark.parametrize("file_name", ["metrics.jsonl", "metrics.csv"])
+    def test_evaluation_results_are_only_in_their_episode(self, tmp_path: Path, file_name: str):
+        path = tmp_path / file_name
+        metrics_writer = MetricsWriter(path)
+        metrics_writer.start()
+        evaluated_metrics = create_metrics(2)
+        evaluated_metrics.evaluated_episode = 1
+        evaluated_metrics.evaluation_score_mean = 4.5
+        metrics_writer.write(create_metrics(1))
+        metrics_writer.write(evaluated_metrics)
+        metrics_writer.close()
+
+        first_row, second_row = read_metrics(path)
+        assert first_row["evaluation_score_mean"] is None or math.isnan(first_row["evaluation_score_mean"])
+        assert second_row["evaluated_episode"] == 1
+        assert second_row["evaluation_score_mean"] == 4.5
+
+    def test_write_buffers_until_flush_episodes(self, tmp_path: Path):
+        metrics_writer = MetricsWriter(tmp_path / "metrics.jsonl", flush_episodes=3)
+        metrics_writer.write(create_metrics(1))
+        metrics_writer.write(create_metrics(2))
+
+        # pylint: disable=W0212
+        assert metrics_writer._batches.empty()
+        metrics_writer.write(create_metrics(3))
+        assert metrics_writer._batches.qsize() == 1
+
+
+class TestStreamingStatistic:
+    def test_moving_average_and_quantiles_cover_window(self):
+        statistic = StreamingStatistic(window=4)
+        for value in range(10):
+            statistic.add(value)
+
+        assert statistic.get_count() == 10
+        assert statistic.get_mean() == pytest.approx(4.5)
+        assert statistic.get_moving_average() == pytest.approx(7.5)
+        assert statistic.get_quantile(0.5) == pytest.approx(7.5)
+
+    def test_summary_tracks_all_metrics_but_episode(self):
+        metrics_summary = MetricsSummary()
+        metrics_summary.add(create_metrics(3))
+
+        assert metrics_summary["steps"].get_moving_average() == 30
+        with pytest.raises(KeyError):
+            _ = metrics_summary["episode"]
+
+    def test_summary_skips_missing_evaluation_results(self):
+        metrics_summary = MetricsSummary()
+        evaluated_metrics = create_metrics(2)
+        evaluated_metrics.evaluation_score_mean = 4.5
+        metrics_summary.add(create_metrics(1))
+        metrics_summary.add(evaluated_metrics)
+
+        assert metrics_summary["evaluation_score_mean"].get_count() == 1
+        assert metrics_summary["evaluation_score_mean"].get_mean() == 4.5
+
+
+def test_moving_average_uses_available_values_at_start():
+    np.testing.assert_allclose(moving_average(np.array([1.0, 3.0, 5.0, 7.0]), window=2), [1.0, 2.0, 4.0, 6.0])
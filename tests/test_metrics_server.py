@@ -0,0 +1,65 @@
+from unittest.mock import patch
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from snake.metrics_server import LiveMetrics, MetricsExporter, MetricsServer
+from snake.profiler import StepProfiler
+
+
+def parse_samples(text: str) -> dict:
+    samples = {}
+    for line in text.splitlines():
+        if not line.startswith("#"):
+            name, value = line.rsplit(" ", maxsplit=1)
+            samples[name] = float(value)
+    return samples
+
+
+class TestMetricsExporter:
+    def test_export_counters_and_gauges(self):
+        with patch("snake.metrics_server.time.monotonic", side_effect=[0.0, 2.0, 4.0]):
+            live_metrics = LiveMetrics()
+            live_metrics.env_steps = 100
+            live_metrics.replay_size = 25
+            live_metrics.replay_capacity = 100
+            live_metrics.max_score = 7
+            live_metrics.checkpoint_saved_at = 1.5
+            metrics_exporter = MetricsExporter(live_metrics)
+            first_samples = parse_samples(metrics_exporter.export())
+            live_metrics.env_steps = 120
+            second_samples = parse_samples(metrics_exporter.export())
+
+        assert first_samples["snake_env_steps_total"] == 100
+        assert first_samples["snake_steps_per_second"] == pytest.approx(50)
+        assert first_samples["snake_replay_fill_ratio"] == pytest.approx(0.25)
+        assert first_samples["snake_max_score"] == 7
+        assert first_samples["snake_checkpoint_age_seconds"] == pytest.approx(0.5)
+        assert second_samples["snake_steps_per_second"] == pytest.approx(10)
+
+    def test_export_phase_latencies(self):
+        step_profiler = StepProfiler(window=10)
+        step_profiler.record("game.move", step_profiler.begin_step())
+        step_profiler.end_step()
+
+        samples = parse_samples(MetricsExporter(LiveMetrics(), step_profiler=step_profiler).export())
+
+        assert 'snake_phase_latency_seconds{phase="game.move",quantile="0.5"}' in samples
+        assert 'snake_phase_latency_seconds{phase="game.move",quantile="0.99"}' in samples
+
+
+class TestMetricsServer:
+    def test_serves_metrics_on_localhost(self):
+        metrics_server = MetricsServer(port=0)
+        metrics_server.live_metrics.episodes = 3
+        metrics_server.start()
+        try:
+            with urlopen(f"http://127.0.0.1:{metrics_server.port}/metrics", timeout=5) as response:
+                samples = parse_samples(response.read().decode("utf-8"))
+            with pytest.raises(HTTPError):
+                urlopen(f"http://127.0.0.1:{metrics_server.port}/", timeout=5)  # pylint: disable=consider-using-with
+        finally:
+            metrics_server.stop()
+
+        assert samples["snake_episodes_total"] == 3
@@ -0,0 +1,38 @@
+import torch
+
+from snake.model import ConvQNet, LinearQNet, QTrainer
+
+
+class TestLinearQNet:
+    def test_model_file_name_depends_on_input_size(self):
+        assert LinearQNet(input_feature_size=22).model_file_name == "model_22.pth"
+
+    def test_saved_model_with_other_input_size_is_kept(self, tmp_path):
+        LinearQNet(input_feature_size=20).save()
+
+        LinearQNet(input_feature_size=22).save()
+
+        assert {path.name for path in (tmp_path / "model").iterdir()} == {"model_20.pth", "model_22.pth"}
+
+
+class TestConvQNet:
+    def test_forward_for_single_and_batched_observations(self):
+        model = ConvQNet(input_shape=(3, 10, 20))
+
+        assert model(torch.zeros((3, 10, 20))).shape == (3,)
+        assert model(torch.zeros((5, 3, 10, 20))).shape == (5, 3)
+
+    def test_model_file_name_depends_on_input_shape(self):
+        assert ConvQNet(input_shape=(4, 5, 6)).model_file_name == "conv_model_4x5x6.pth"
+
+
+class TestQTrainer:
+    def test_train_step_accepts_single_grid_observation(self):
+        model = ConvQNet(input_shape=(3, 10, 20))
+        trainer = QTrainer(model=model)
+        state = torch.rand((3, 10, 20))
+        old_prediction = model(state).detach()
+
+        trainer.train_step(old_state=state, action=[1, 0, 0], reward=10, new_state=state, game_over=True)
+
+        assert not torch.equal(model(state).detach(), old_prediction)
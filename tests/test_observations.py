@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+import torch
+
+from snake.game_controls import Direction
+from snake.game_objects.objects import FoodHandler, Grid, Point, SnakeHandler
+from snake.observations import GridChannel, GridObservation, ObservationBatch
+
+
+def create_expected_channels(snake_handler: SnakeHandler, food_handler: FoodHandler) -> np.ndarray:
+    grid = snake_handler.grid
+    channels = np.zeros((3, grid.height, grid.width), dtype=np.float32)
+    if grid.contains(snake_handler.head):
+        channels[GridChannel.HEAD, snake_handler.head.y, snake_handler.head.x] = 1
+    for point in snake_handler.body:
+        channels[GridChannel.BODY, point.y, point.x] += 1
+    food = food_handler.get_current_food_position()
+    channels[GridChannel.FOOD, food.y, food.x] = 1
+    return channels
+
+
+class TestGridObservation:
+    def test_observe_matches_snake_and_food(self, snake_handler: SnakeHandler, food_handler: FoodHandler, grid: Grid):
+        observation = GridObservation(snake_handler=snake_handler, food_handler=food_handler)
+
+        assert observation.shape == (3, grid.height, grid.width)
+        np.testing.assert_array_equal(observation.observe(), create_expected_channels(snake_handler, food_handler))
+
+    def test_observe_is_updated_incrementally(self, snake_handler: SnakeHandler, food_handler: FoodHandler):
+        observation = GridObservation(snake_handler=snake_handler, food_handler=food_handler)
+
+        for direction in [Direction.UP, Direction.LEFT, Direction.LEFT, Direction.DOWN]:
+            snake_handler.move_snake(direction)
+            food_handler.move_food_to_random_position()
+            np.testing.assert_array_equal(observation.observe(), create_expected_channels(snake_handler, food_handler))
+        snake_handler.extend_snake(Point(x=8, y=7))
+        np.testing.assert_array_equal(observation.observe(), create_expected_channels(snake_handler, food_handler))
+
+        snake_handler.reset()
+        np.testing.assert_array_equal(observation.observe(), create_expected_channels(snake_handler, food_handler))
+
+    def test_observe_body_age(self, snake_handler: SnakeHandler, food_handler: FoodHandler):
+        observation = GridObservation(snake_handler=snake_handler, food_handler=food_handler, body_age=True)
+        snake_handler.move_snake(Direction.RIGHT)
+
+        body_age = observation.observe()[GridChannel.BODY_AGE]
+
+        assert body_age[5, 10] == pytest.approx(0.5)
+        assert body_age[5, 9] == pytest.approx(1.0)
+        assert body_age[5, 8] == 0
+        assert body_age[5, 11] == 0
+
+    def test_observe_downsampled(self, snake_handler: SnakeHandler, food_handler: FoodHandler, grid: Grid):
+        observation = GridObservation(snake_handler=snake_handler, food_handler=food_handler, downsampling=3)
+        out = np.empty(observation.shape, dtype=np.float32)
+
+        observation.observe(out=out)
+
+        assert observation.shape == (3, -(-grid.height // 3), -(-grid.width // 3))
+        assert out[GridChannel.HEAD].sum() == pytest.approx(1 / 9)
+        assert out[GridChannel.BODY].sum() == pytest.approx(2 / 9)
+        assert out[GridChannel.HEAD, 5 // 3, 10 // 3] == pytest.approx(1 / 9)
+
+
+class TestObservationBatch:
+    def test_write_fills_shared_tensor(self, snake_handler: SnakeHandler, food_handler: FoodHandler):
+        observation = GridObservation(snake_handler=snake_handler, food_handler=food_handler)
+        observation_batch = ObservationBatch(batch_size=2, shape=observation.shape)
+
+        tensor = observation_batch.write(1, observation)
+
+        assert tensor.data_ptr() == observation_batch.tensor[1].data_ptr()
+        assert torch.equal(tensor, torch.from_numpy(observation.observe()))
+        assert not observation_batch.tensor[0].any()
+
+    def test_stack(self):
+        observation_batch = ObservationBatch(batch_size=4, shape=(1, 2, 2))
+        observations = [np.full((1, 2, 2), value, dtype=np.float32) for value in range(3)]
+
+        tensor = observation_batch.stack(observations)
+
+        assert tensor.shape == (3, 1, 2, 2)
+        assert tensor.data_ptr() == observation_batch.tensor.data_ptr()
+        assert tensor[2].eq(2).all()
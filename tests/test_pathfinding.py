@@ -0,0 +1,110 @@
+from snake.game_controls import Direction
+from snake.game_objects.objects import Grid, Point, Snake, SnakeHandler
+from snake.pathfinding import (
+    PathPlanner,
+    count_reachable_cells,
+    create_neighbour_table,
+    find_path,
+)
+
+GRID = Grid(width=5, height=5)
+NEIGHBOURS = create_neighbour_table(GRID)
+
+
+def to_cells(*points: Point):
+    return [GRID.to_cell(point) for point in points]
+
+
+class TestFindPath:
+    def test_finds_shortest_path(self):
+        path = find_path(GRID, NEIGHBOURS, start=0, goal=24, is_blocked=lambda cell: False)
+
+        assert path is not None
+        assert len(path) == 8
+        assert path[-1] == 24
+
+    def test_finds_path_around_obstacle(self):
+        wall = set(to_cells(*(Point(x=2, y=y) for y in range(4))))
+
+        path = find_path(GRID, NEIGHBOURS, start=0, goal=4, is_blocked=lambda cell: cell in wall)
+
+        assert path is not None
+        assert len(path) == 12
+        assert not wall.intersection(path)
+
+    def test_returns_none_for_unreachable_goal(self):
+        wall = set(to_cells(*(Point(x=2, y=y) for y in range(5))))
+
+        assert find_path(GRID, NEIGHBOURS, start=0, goal=4, is_blocked=lambda cell: cell in wall) is None
+
+    def test_returns_none_when_expansions_are_exhausted(self):
+        assert find_path(GRID, NEIGHBOURS, start=0, goal=24, is_blocked=lambda cell: False, max_expansions=3) is None
+
+
+class TestCountReachableCells:
+    def test_counts_all_free_cells(self):
+        assert count_reachable_cells(NEIGHBOURS, start=0, is_blocked=lambda cell: False, limit=100) == 25
+
+    def test_stops_at_limit(self):
+        assert count_reachable_cells(NEIGHBOURS, start=0, is_blocked=lambda cell: False, limit=5) == 5
+
+    def test_respects_blocked_cells(self):
+        wall = set(to_cells(*(Point(x=2, y=y) for y in range(5))))
+
+        assert count_reachable_cells(NEIGHBOURS, start=0, is_blocked=lambda cell: cell in wall, limit=100) == 10
+
+
+class TestPathPlanner:
+    def test_cached_path_is_reused(self, snake_handler: SnakeHandler):
+        grid = snake_handler.grid
+        planner = PathPlanner(snake_handler=snake_handler)
+        food_cell = grid.to_cell(Point(x=15, y=5))
+
+        for x in range(11, 15):
+            assert planner.next_cell(food_cell) == grid.to_cell(Point(x=x, y=5))
+            snake_handler.move_snake(Direction.RIGHT)
+
+        assert planner.get_replan_count() == 1
+
+    def test_replans_when_food_moves(self, snake_handler: SnakeHandler):
+        grid = snake_handler.grid
+        planner = PathPlanner(snake_handler=snake_handler)
+        planner.next_cell(grid.to_cell(Point(x=15, y=5)))
+        snake_handler.move_snake(Direction.RIGHT)
+
+        assert planner.next_cell(grid.to_cell(Point(x=11, y=0))) == grid.to_cell(Point(x=11, y=4))
+        assert planner.get_replan_count() == 2
+
+    def test_repairs_blocked_path(self, snake_handler: SnakeHandler):
+        grid = snake_handler.grid
+        planner = PathPlanner(snake_handler=snake_handler)
+        planner.next_cell(grid.to_cell(Point(x=15, y=5)))
+        snake_handler.restore(
+            Point(x=11, y=5), [Point(x=11, y=4), Point(x=12, y=4), Point(x=12, y=5), Point(x=12, y=6), Point(x=11, y=6)]
+        )
+
+        assert planner.next_cell(grid.to_cell(Point(x=15, y=5))) == grid.to_cell(Point(x=11, y=6))
+        assert planner.get_repair_count() == 1
+        assert planner.get_replan_count() == 1
+
+    def test_avoids_dead_end_on_the_way_to_food(self):
+        snake_handler = SnakeHandler(
+            snake=Snake(
+                head=Point(x=1, y=1),
+                body=[Point(x=2, y=1), Point(x=2, y=0), Point(x=2, y=2), Point(x=0, y=1), Point(x=0, y=2)],
+            ),
+            grid=GRID,
+        )
+        planner = PathPlanner(snake_handler=snake_handler)
+
+        assert planner.next_cell(GRID.to_cell(Point(x=0, y=0))) == GRID.to_cell(Point(x=1, y=2))
+
+    def test_reset_forgets_cached_path(self, snake_handler: SnakeHandler):
+        food_cell = snake_handler.grid.to_cell(Point(x=15, y=5))
+        planner = PathPlanner(snake_handler=snake_handler)
+        planner.next_cell(food_cell)
+
+        planner.reset()
+        planner.next_cell(food_cell)
+
+        assert planner.get_replan_count() == 2
@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from snake.config import GameConfig
+from snake.profiler import (
+    NoStepProfiler,
+    PhaseHistogram,
+    StepProfiler,
+    create_step_profiler,
+)
+
+
+class TestPhaseHistogram:
+    def test_percentiles_cover_only_the_rolling_window(self):
+        histogram = PhaseHistogram(window=100)
+        for duration_ns in [1_000_000] * 100 + list(range(1, 101)):
+            histogram.add(duration_ns)
+
+        percentiles = histogram.get_percentiles_ns()
+
+        assert histogram.get_count() == 200
+        assert percentiles[50] == pytest.approx(50.5)
+        assert percentiles[99] == pytest.approx(99.01)
+
+
+class TestStepProfiler:
+    def test_record_measures_time_since_previous_phase(self):
+        with patch("snake.profiler.time.perf_counter_ns", side_effect=[0, 10, 12, 30, 31]):
+            step_profiler = StepProfiler(window=10)
+            started_at = step_profiler.begin_step()
+            started_at = step_profiler.record("game.move", started_at)
+            step_profiler.record("game.ui", started_at)
+            step_profiler.end_step()
+
+        assert step_profiler.get_step_count() == 1
+        assert step_profiler.get_percentiles_ns() == {
+            "game.move": {50: 10.0, 99: 10.0},
+            "game.ui": {50: 18.0, 99: 18.0},
+        }
+
+    def test_nested_steps_count_once(self):
+        step_profiler = StepProfiler(window=10)
+        step_profiler.begin_step()
+        step_profiler.begin_step()
+        step_profiler.end_step()
+        step_profiler.end_step()
+
+        assert step_profiler.get_step_count() == 1
+
+    def test_chrome_trace_is_written_for_sampled_steps(self, tmp_path: Path):
+        trace_path = tmp_path / "trace.json"
+        step_profiler = StepProfiler(window=10, trace_start=2, trace_steps=3, trace_path=trace_path)
+        for _ in range(6):
+            started_at = step_profiler.begin_step()
+            step_profiler.record("game.move", started_at)
+            step_profiler.end_step()
+
+        trace_events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+        assert [trace_event["args"]["step"] for trace_event in trace_events] == [2, 3, 4]
+        assert {trace_event["ph"] for trace_event in trace_events} == {"X"}
+
+
+def test_create_step_profiler_is_disabled_by_default(game_config: GameConfig):
+    assert isinstance(create_step_profiler(game_config), NoStepProfiler)
+    game_config.profiling = True
+    assert isinstance(create_step_profiler(game_config), StepProfiler)
@@ -3,6 +3,7 @@ from typing import Dict
 import pytest
 
 from snake.publisher import (
+    NoCollisionSubscriber,
     Publisher,
     PublisherEvents,
     RewardSubscriber,
@@ -27,6 +28,27 @@ class TestPublisher:
 
         assert fake_subscriber.received_notifications == [PublisherEvents.COLLISION_DETECTED]
 
+    def test_publish_events(self, fake_subscriber: FakeSubscriber):
+        publisher = Publisher()
+        publisher.add_subscriber(fake_subscriber)
+
+        events = [PublisherEvents.REACHED_FOOD, PublisherEvents.NO_COLLISION]
+        publisher.publish_events(events)
+
+        assert fake_subscriber.received_notifications == events
+
+    def test_publish_one_event_only_reaches_subscribed_handlers(self):
+        remuneration = {"score": 0, "reward": 5}
+        publisher = Publisher()
+        publisher.add_subscriber(ScoreSubscriber(remuneration))
+        publisher.add_subscriber(NoCollisionSubscriber(remuneration))
+
+        publisher.publish_one_event(PublisherEvents.NO_COLLISION)
+        assert remuneration == {"score": 0, "reward": 0}
+
+        publisher.publish_one_event(PublisherEvents.REACHED_FOOD)
+        assert remuneration == {"score": 1, "reward": 0}
+
 
 class TestScoreSubscriber:
     @pytest.mark.parametrize(
@@ -47,11 +69,12 @@ class TestRewardSubscriber:
         (
             (PublisherEvents.REACHED_FOOD, {"score": 0, "reward": 10}),
             (PublisherEvents.COLLISION_DETECTED, {"score": 0, "reward": -10}),
+            (PublisherEvents.LOOP_DETECTED, {"score": 0, "reward": -5}),
         ),
     )
     def test_got_notified_handles_events_correctly(self, event: PublisherEvents, expected_remuneration: Dict[str, int]):
         remuneration = {"score": 0, "reward": 0}
-        subscriber = RewardSubscriber(remuneration)
+        subscriber = RewardSubscriber(remuneration, loop_penalty=-5)
 
         subscriber.get_notified(event)
         assert remuneration == expected_remuneration
@@ -0,0 +1,27 @@
+from snake.random_generators import RandomStream, create_random_generator, derive_seed
+
+
+class TestCreateRandomGenerator:
+    def test_same_seed_and_stream_gives_same_numbers(self):
+        first_generator = create_random_generator(7, RandomStream.FOOD)
+        second_generator = create_random_generator(7, RandomStream.FOOD)
+        assert first_generator.integers(1_000, size=10).tolist() == second_generator.integers(1_000, size=10).tolist()
+
+    def test_streams_are_independent(self):
+        food_generator = create_random_generator(7, RandomStream.FOOD)
+        agent_generator = create_random_generator(7, RandomStream.AGENT)
+        assert food_generator.integers(1_000, size=10).tolist() != agent_generator.integers(1_000, size=10).tolist()
+
+    def test_keys_derive_separate_generators(self):
+        first_generator = create_random_generator(7, RandomStream.FOOD, 0)
+        second_generator = create_random_generator(7, RandomStream.FOOD, 1)
+        assert first_generator.integers(1_000, size=10).tolist() != second_generator.integers(1_000, size=10).tolist()
+
+
+class TestDeriveSeed:
+    def test_derive_seed_is_deterministic(self):
+        assert derive_seed(7, 3) == derive_seed(7, 3)
+        assert derive_seed(7, 3) != derive_seed(7, 4)
+
+    def test_derive_seed_without_seed(self):
+        assert derive_seed(None, 3) is None
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import pytest
+
+from snake.config import GameConfig
+from snake.game_controls import SpeedMode
+from snake.speed_governor import MAX_FRAME_SKIP, SpeedGovernor, StepRateMeter
+
+
+class TestStepRateMeter:
+    def test_get_steps_per_second_after_interval(self):
+        with patch("snake.speed_governor.time.perf_counter", side_effect=[0.0, 0.1, 0.2, 0.5]):
+            step_rate_meter = StepRateMeter(interval_s=0.5)
+            for _ in range(3):
+                step_rate_meter.count_step()
+
+        assert step_rate_meter.get_steps_per_second() == pytest.approx(6.0)
+
+
+class TestSpeedGovernor:
+    @pytest.mark.parametrize(
+        "speed_mode, expected_renders, expected_pacing",
+        [
+            (SpeedMode.WATCH, 8, True),
+            (SpeedMode.FAST, 2, False),
+            (SpeedMode.DARK, 0, False),
+        ],
+    )
+    def test_should_render_and_pace(
+        self, game_config: GameConfig, speed_mode: SpeedMode, expected_renders: int, expected_pacing: bool
+    ):
+        game_config.frame_skip = 4
+        speed_governor = SpeedGovernor(game_config)
+        speed_governor.update(speed_mode)
+
+        renders = 0
+        for _ in range(8):
+            speed_governor.count_step()
+            renders += speed_governor.should_render()
+
+        assert renders == expected_renders
+        assert speed_governor.should_pace() is expected_pacing
+
+    def test_update_keeps_speed_mode_without_input(self, game_config: GameConfig):
+        speed_governor = SpeedGovernor(game_config)
+        speed_governor.update(SpeedMode.DARK)
+        speed_governor.update(None)
+
+        assert speed_governor.get_speed_mode() is SpeedMode.DARK
+
+    @pytest.mark.parametrize(
+        "frame_skip_change, expected_frame_skip",
+        [(1, 16), (-2, 2), (-10, 1), (20, MAX_FRAME_SKIP)],
+    )
+    def test_update_doubles_or_halves_frame_skip(
+        self, game_config: GameConfig, frame_skip_change: int, expected_frame_skip: int
+    ):
+        game_config.frame_skip = 8
+        speed_governor = SpeedGovernor(game_config)
+        speed_governor.update(None, frame_skip_change=frame_skip_change)
+
+        assert speed_governor.get_frame_skip() == expected_frame_skip
+        assert isinstance(speed_governor.get_frame_skip(), int)
+
+    def test_frame_skip_stays_an_integer_after_halving_and_doubling(self, game_config: GameConfig):
+        game_config.frame_skip = 8
+        speed_governor = SpeedGovernor(game_config)
+        speed_governor.update(SpeedMode.FAST, frame_skip_change=-1)
+        speed_governor.update(None, frame_skip_change=1)
+
+        assert speed_governor.get_frame_skip() == 8
+        assert isinstance(speed_governor.get_frame_skip(), int)
+        assert speed_governor.get_overlay_text().endswith(" 1/8")
+
+    def test_get_overlay_text(self, game_config: GameConfig):
+        speed_governor = SpeedGovernor(game_config)
+        speed_governor.update(SpeedMode.FAST)
+
+        assert speed_governor.get_overlay_text() == f"FAST 0 steps/s 1/{game_config.frame_skip}"
@@ -4,7 +4,7 @@ from unittest.mock import Mock, patch
 import numpy as np
 import pytest
 
-from snake.config import GameConfig
+from snake.bitboard import SnakeBitboard
 from snake.game import SnakeGame
 from snake.game_controls import Direction
 from snake.game_objects.objects import Point
@@ -16,26 +16,26 @@ class TestState:
     @pytest.mark.parametrize(
         "current_direction, snake_head, expected_location_of_hazard",
         (
-            (Direction.RIGHT, Point(x=95, y=25), [1, 0, 0]),
-            (Direction.UP, Point(x=50, y=0), [1, 0, 0]),
-            (Direction.LEFT, Point(x=0, y=25), [1, 0, 0]),
-            (Direction.DOWN, Point(x=50, y=45), [1, 0, 0]),
-            (Direction.RIGHT, Point(x=50, y=45), [0, 1, 0]),
-            (Direction.UP, Point(x=95, y=25), [0, 1, 0]),
-            (Direction.LEFT, Point(x=50, y=0), [0, 1, 0]),
-            (Direction.DOWN, Point(x=0, y=25), [0, 1, 0]),
-            (Direction.RIGHT, Point(x=50, y=0), [0, 0, 1]),
-            (Direction.UP, Point(x=0, y=25), [0, 0, 1]),
-            (Direction.LEFT, Point(x=50, y=45), [0, 0, 1]),
-            (Direction.DOWN, Point(x=95, y=25), [0, 0, 1]),
-            (Direction.UP, Point(x=95, y=0), [1, 1, 0]),
-            (Direction.RIGHT, Point(x=95, y=0), [1, 0, 1]),
+            (Direction.RIGHT, Point(x=19, y=5), [1, 0, 0]),
+            (Direction.UP, Point(x=10, y=0), [1, 0, 0]),
+            (Direction.LEFT, Point(x=0, y=5), [1, 0, 0]),
+            (Direction.DOWN, Point(x=10, y=9), [1, 0, 0]),
+            (Direction.RIGHT, Point(x=10, y=9), [0, 1, 0]),
+            (Direction.UP, Point(x=19, y=5), [0, 1, 0]),
+            (Direction.LEFT, Point(x=10, y=0), [0, 1, 0]),
+            (Direction.DOWN, Point(x=0, y=5), [0, 1, 0]),
+            (Direction.RIGHT, Point(x=10, y=0), [0, 0, 1]),
+            (Direction.UP, Point(x=0, y=5), [0, 0, 1]),
+            (Direction.LEFT, Point(x=10, y=9), [0, 0, 1]),
+            (Direction.DOWN, Point(x=19, y=5), [0, 0, 1]),
+            (Direction.UP, Point(x=19, y=0), [1, 1, 0]),
+            (Direction.RIGHT, Point(x=19, y=0), [1, 0, 1]),
             (Direction.LEFT, Point(x=0, y=0), [1, 1, 0]),
             (Direction.UP, Point(x=0, y=0), [1, 0, 1]),
-            (Direction.DOWN, Point(x=0, y=45), [1, 1, 0]),
-            (Direction.LEFT, Point(x=0, y=45), [1, 0, 1]),
-            (Direction.RIGHT, Point(x=95, y=45), [1, 1, 0]),
-            (Direction.DOWN, Point(x=95, y=45), [1, 0, 1]),
+            (Direction.DOWN, Point(x=0, y=9), [1, 1, 0]),
+            (Direction.LEFT, Point(x=0, y=9), [1, 0, 1]),
+            (Direction.RIGHT, Point(x=19, y=9), [1, 1, 0]),
+            (Direction.DOWN, Point(x=19, y=9), [1, 0, 1]),
         ),
         ids=[
             "Snake moves right and is about to hit the right boundary -> straight hazard",
@@ -66,13 +66,12 @@ class TestState:
         snake_head: Point,
         expected_location_of_hazard: List[int],
         snake_game: SnakeGame,
-        game_config: GameConfig,
     ):
         with (
             patch("snake.game.SnakeGame.get_current_direction", return_value=current_direction),
             patch("snake.game.SnakeGame.get_snake", return_value=[snake_head]),
         ):
-            state = State(game=snake_game, game_config=game_config)
+            state = State(game=snake_game)
             actual_location_of_hazard = state.calculate_location_of_hazard_as_binary()
 
         assert actual_location_of_hazard == expected_location_of_hazard
@@ -92,10 +91,9 @@ class TestState:
         current_direction: Direction,
         expected_binary_expression: List[int],
         snake_game: SnakeGame,
-        game_config: GameConfig,
     ):
         with patch("snake.state.SnakeGame.get_current_direction", return_value=current_direction):
-            state = State(game=snake_game, game_config=game_config)
+            state = State(game=snake_game)
             actual_binary_expression = state.convert_direction_to_binary()
 
         assert actual_binary_expression == expected_binary_expression
@@ -104,14 +102,14 @@ class TestState:
     @pytest.mark.parametrize(
         "snake_head, food_position, expected_binary_position",
         (
-            (Point(x=10, y=0), Point(x=5, y=0), [1, 0, 0, 0]),
-            (Point(x=5, y=0), Point(x=10, y=0), [0, 1, 0, 0]),
-            (Point(x=0, y=10), Point(x=0, y=5), [0, 0, 1, 0]),
-            (Point(x=0, y=5), Point(x=0, y=10), [0, 0, 0, 1]),
-            (Point(x=10, y=10), Point(x=5, y=5), [1, 0, 1, 0]),
-            (Point(x=10, y=5), Point(x=5, y=10), [1, 0, 0, 1]),
-            (Point(x=5, y=10), Point(x=10, y=5), [0, 1, 1, 0]),
-            (Point(x=5, y=5), Point(x=10, y=10), [0, 1, 0, 1]),
+            (Point(x=2, y=0), Point(x=1, y=0), [1, 0, 0, 0]),
+            (Point(x=1, y=0), Point(x=2, y=0), [0, 1, 0, 0]),
+            (Point(x=0, y=2), Point(x=0, y=1), [0, 0, 1, 0]),
+            (Point(x=0, y=1), Point(x=0, y=2), [0, 0, 0, 1]),
+            (Point(x=2, y=2), Point(x=1, y=1), [1, 0, 1, 0]),
+            (Point(x=2, y=1), Point(x=1, y=2), [1, 0, 0, 1]),
+            (Point(x=1, y=2), Point(x=2, y=1), [0, 1, 1, 0]),
+            (Point(x=1, y=1), Point(x=2, y=2), [0, 1, 0, 1]),
         ),
         ids=[
             "Food is to the left of the snakes head.",
@@ -130,18 +128,17 @@ class TestState:
         food_position: Point,
         expected_binary_position: List[int],
         snake_game: SnakeGame,
-        game_config: GameConfig,
     ):
         with (
             patch("snake.game.SnakeGame.get_snake", return_value=[snake_head]),
             patch("snake.game.SnakeGame.get_food", return_value=food_position),
         ):
-            state = State(game=snake_game, game_config=game_config)
+            state = State(game=snake_game)
             actual_binary_position = state.calculate_current_food_position_relative_to_snake_as_binary()
         assert actual_binary_position == expected_binary_position
         assert len(actual_binary_position) == 4
 
-    def test_calculate_state_from_game(self, snake_game: SnakeGame, game_config: GameConfig):
+    def test_calculate_state_from_game(self, snake_game: SnakeGame):
         hazards = [1, 0, 1]
         direction = [1, 0, 0, 0]
         food_position = [1, 0, 0, 0]
@@ -153,8 +150,36 @@ class TestState:
             convert_direction_to_binary=Mock(return_value=direction),
             calculate_current_food_position_relative_to_snake_as_binary=Mock(return_value=food_position),
         ):
-            state = State(game=snake_game, game_config=game_config)
+            state = State(game=snake_game)
             actual_state = state.calculate_state_from_game()
 
         assert np.array_equal(actual_state, expected_state)
         assert len(actual_state) == 11
+
+    def test_calculate_state_from_game_with_reachable_area_features(self, snake_game: SnakeGame):
+        state = State(
+            game=snake_game,
+            snake_bitboard=SnakeBitboard(snake_game.get_snake_handler()),
+            reachable_area_features=True,
+        )
+
+        actual_state = state.calculate_state_from_game()
+
+        assert len(actual_state) == 14
+        assert actual_state[3:6].tolist() == [0, 0, 0]
+
+    def test_calculate_reachable_cells_for_relative_moves(self, snake_game: SnakeGame):
+        snake_handler = snake_game.get_snake_handler()
+        state = State(game=snake_game, snake_bitboard=SnakeBitboard(snake_handler))
+        assert state.calculate_reachable_cells() == [3, 3, 3]
+
+        snake_handler.restore(Point(x=19, y=1), [Point(x=18, y=1), Point(x=18, y=0), Point(x=17, y=0)])
+
+        assert state.calculate_reachable_cells() == [0, 4, 1]
+
+    def test_calculate_enclosed_space_as_binary(self, snake_game: SnakeGame):
+        with patch("snake.state.State.calculate_reachable_cells", return_value=[3, 2, 0]):
+            state = State(game=snake_game)
+
+            assert state.calculate_safe_moves() == [True, False, False]
+            assert state.calculate_enclosed_space_as_binary() == [0, 1, 1]
@@ -0,0 +1,83 @@
+import csv
+import threading
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from snake.config import GameConfig, WindowConfig
+from snake.sweep import MedianStoppingRule, create_trials, run_sweep, write_results
+
+
+class TestCreateTrials:
+    def test_grid_spec_combines_all_values(self):
+        spec = {"method": "grid", "parameters": {"learning_rate": [0.01, 0.001], "hidden_layer_size": [64, 128, 256]}}
+
+        trials = create_trials(spec, seed=3)
+
+        assert len(trials) == 6
+        assert trials[1].parameters == {"learning_rate": 0.01, "hidden_layer_size": 128}
+        assert len({trial.seed for trial in trials}) == 6
+        assert [trial.seed for trial in trials] == [trial.seed for trial in create_trials(spec, seed=3)]
+
+    def test_random_spec_is_reproducible_and_keeps_parameter_types(self):
+        spec = {
+            "method": "random",
+            "trials": 20,
+            "parameters": {
+                "learning_rate": {"min": 0.0001, "max": 0.01, "log": True},
+                "hidden_layer_size": {"min": 16, "max": 512, "log": True},
+                "epsilon_decay": [0.5, 1],
+            },
+        }
+
+        trials = create_trials(spec, seed=3)
+
+        assert [trial.parameters for trial in trials] == [trial.parameters for trial in create_trials(spec, seed=3)]
+        assert all(0.0001 <= trial.parameters["learning_rate"] <= 0.01 for trial in trials)
+        assert all(isinstance(trial.parameters["hidden_layer_size"], int) for trial in trials)
+        assert {trial.parameters["epsilon_decay"] for trial in trials} == {0.5, 1.0}
+
+    @pytest.mark.parametrize(
+        "spec",
+        (
+            {"parameters": {"frame_rate": [1, 2]}},
+            {"method": "bayes", "parameters": {"learning_rate": [0.01]}},
+            {"method": "grid", "parameters": {"learning_rate": 0.01}},
+            {"method": "random", "parameters": {"learning_rate": {"min": 0.01}}},
+        ),
+    )
+    def test_invalid_spec(self, spec: dict):
+        with pytest.raises(ValueError):
+            create_trials(spec, seed=0)
+
+
+class TestMedianStoppingRule:
+    def test_trials_below_the_median_of_their_peers_are_stopped(self):
+        stopping_rule = MedianStoppingRule(rung_games=10, min_trials=2, reports={}, lock=threading.Lock())
+
+        assert not stopping_rule.should_stop(games=5, score=0.0)
+        assert not stopping_rule.should_stop(games=10, score=5.0)
+        assert not stopping_rule.should_stop(games=10, score=3.0)
+        assert stopping_rule.should_stop(games=10, score=1.0)
+        assert not stopping_rule.should_stop(games=10, score=6.0)
+        assert not stopping_rule.should_stop(games=20, score=0.0)
+
+
+class TestRunSweep:
+    def test_run_sweep_trains_every_trial_and_writes_one_table(
+        self, window_config: WindowConfig, game_config: GameConfig, tmp_path: Path
+    ):
+        game_config = replace(game_config, loop_detection=True)
+        trials = create_trials({"parameters": {"hidden_layer_size": [16, 32]}}, seed=0)
+
+        results = run_sweep(window_config, game_config, trials, games=2, workers=1)
+        write_results(results, tmp_path / "sweep.csv")
+
+        assert sorted(result.trial for result in results) == [0, 1]
+        assert all(result.games == 2 and not result.stopped_early for result in results)
+        assert results[0].score_moving_average >= results[1].score_moving_average
+        with open(tmp_path / "sweep.csv", encoding="utf-8", newline="") as results_file:
+            rows = list(csv.DictReader(results_file))
+        assert [row["trial"] for row in rows] == [str(result.trial) for result in results]
+        assert {row["hidden_layer_size"] for row in rows} == {"16", "32"}
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 from dynaconf import Dynaconf, ValidationError, Validator
 
+from snake.config import GameConfig
 from snake.validators import ConfigValidator
 
 
@@ -29,3 +30,21 @@ class TestConfigValidator:
         with pytest.raises(ValidationError), patch(target="snake.validators.settings", new=test_settings):
             ConfigValidator.register_validator(validator)
             ConfigValidator.validate_all()
+
+    @pytest.mark.parametrize(
+        "settings, is_valid",
+        [
+            ({"scenario": False}, True),
+            ({"scenario": True, "seed": 3}, True),
+            ({"scenario": True}, False),
+        ],
+    )
+    def test_scenario_requires_seed(self, settings: dict, is_valid: bool):
+        test_settings = Dynaconf(**settings)
+        with patch(target="snake.validators.settings", new=test_settings):
+            ConfigValidator.register_validator(GameConfig.SCENARIO_SEED_VALIDATOR)
+            if is_valid:
+                ConfigValidator.validate_all()
+            else:
+                with pytest.raises(ValidationError):
+                    ConfigValidator.validate_all()
@@ -0,0 +1,70 @@
+import numpy as np
+
+from snake.game_controls import Direction
+from snake.game_objects.objects import FoodHandler, Point, SnakeHandler
+from snake.zobrist import LoopDetector, ZobristHash
+
+
+def create_zobrist_hash(snake_handler: SnakeHandler, food_handler: FoodHandler) -> ZobristHash:
+    return ZobristHash(
+        snake_handler=snake_handler, food_handler=food_handler, random_generator=np.random.default_rng(0)
+    )
+
+
+class TestZobristHash:
+    def test_incremental_hash_matches_hash_from_scratch(self, snake_handler: SnakeHandler, food_handler: FoodHandler):
+        zobrist_hash = create_zobrist_hash(snake_handler, food_handler)
+        for direction in [Direction.UP, Direction.LEFT, Direction.LEFT, Direction.DOWN]:
+            snake_handler.move_snake(direction)
+        snake_handler.extend_snake(Point(x=8, y=7))
+        incremental_hash = zobrist_hash.get_hash(Direction.DOWN)
+
+        zobrist_hash.snake_reset()
+
+        assert zobrist_hash.get_hash(Direction.DOWN) == incremental_hash
+
+    def test_hash_depends_on_snake_food_and_direction(self, snake_handler: SnakeHandler, food_handler: FoodHandler):
+        zobrist_hash = create_zobrist_hash(snake_handler, food_handler)
+        initial_hash = zobrist_hash.get_hash(Direction.RIGHT)
+
+        assert zobrist_hash.get_hash(Direction.UP) != initial_hash
+        food_handler.move_food_to_random_position()
+        assert zobrist_hash.get_hash(Direction.RIGHT) != initial_hash
+        snake_handler.move_snake(Direction.RIGHT)
+        assert zobrist_hash.get_hash(Direction.RIGHT) != initial_hash
+
+    def test_hash_repeats_for_repeated_position(self, snake_handler: SnakeHandler, food_handler: FoodHandler):
+        zobrist_hash = create_zobrist_hash(snake_handler, food_handler)
+        hashes = []
+        for direction in [Direction.UP, Direction.LEFT, Direction.DOWN, Direction.RIGHT] * 2:
+            snake_handler.move_snake(direction)
+            hashes.append(zobrist_hash.get_hash(direction))
+
+        assert len(set(hashes)) == 4
+        assert hashes[:4] == hashes[4:]
+
+    def test_hash_depends_on_body_order(self, snake_handler: SnakeHandler, food_handler: FoodHandler):
+        zobrist_hash = create_zobrist_hash(snake_handler, food_handler)
+        head = Point(x=1, y=1)
+        snake_handler.restore(head, [Point(x=1, y=2), Point(x=2, y=2), Point(x=2, y=1)])
+        clockwise_hash = zobrist_hash.get_hash(Direction.UP)
+
+        snake_handler.restore(head, [Point(x=2, y=1), Point(x=2, y=2), Point(x=1, y=2)])
+
+        assert zobrist_hash.get_hash(Direction.UP) != clockwise_hash
+
+    def test_seeded_hashes_are_reproducible(self, snake_handler: SnakeHandler, food_handler: FoodHandler):
+        first_hash = create_zobrist_hash(snake_handler, food_handler).get_hash(Direction.RIGHT)
+
+        assert create_zobrist_hash(snake_handler, food_handler).get_hash(Direction.RIGHT) == first_hash
+
+
+class TestLoopDetector:
+    def test_visit_detects_repeated_hash_until_reset(self):
+        loop_detector = LoopDetector()
+        loop_detector.reset(1)
+
+        assert not loop_detector.visit(2)
+        assert loop_detector.visit(1)
+        loop_detector.reset(3)
+        assert not loop_detector.visit(2)